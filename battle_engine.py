@@ -7,7 +7,25 @@ dodge, species abilities, status effects, pack bonuses, damage variance.
 """
 
 import random
-import math
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import NamedTuple
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Numeric kernels are compiled when numba is available, plain Python otherwise
+if numba is not None:
+    _prange = numba.prange
+    _njit = numba.njit(cache=True, fastmath=True)
+    _njit_parallel = numba.njit(parallel=True, cache=True, fastmath=True)
+else:
+    _prange = range
+    _njit = _njit_parallel = lambda fn: fn
 
 # ── Species Family Mapping ──────────────────────────────────────
 SPECIES_FAMILIES = {
@@ -41,6 +59,13 @@ SPECIES_FAMILIES = {
     "therizinosaurus": "therizinosaur",
 }
 
+
+@lru_cache(maxsize=256)
+def family_of(dino_id):
+    """Family for a dino id (case-insensitive), memoized per id."""
+    return SPECIES_FAMILIES.get(dino_id.lower(), "generic")
+
+
 # ── Group Slot Calc ─────────────────────────────────────────────
 def get_group_slots(cw):
     if cw >= 7000: return 5
@@ -53,101 +78,84 @@ def get_group_slots(cw):
 HIT_ZONES = [("HEAD", 0.20, 1.20), ("BODY", 0.55, 1.00),
              ("TAIL", 0.15, 0.25), ("FLANK", 0.10, 0.80)]
 
-def roll_hit_zone():
-    r = random.random()
-    c = 0
-    for name, prob, mult in HIT_ZONES:
-        c += prob
-        if r <= c:
-            return name, mult
-    return "BODY", 1.0
+# Cumulative zone table. Tuples are constants for the compiled damage core;
+# the batched simulator uses the array forms.
+_ZONE_NAMES = tuple(z[0] for z in HIT_ZONES)
+_ZONE_CDF_T = tuple(accumulate(z[1] for z in HIT_ZONES))
+_ZONE_MULTS_T = tuple(z[2] for z in HIT_ZONES)
+_ZONE_CDF = np.array(_ZONE_CDF_T)
+_ZONE_MULTS = np.array(_ZONE_MULTS_T)
+
+def roll_hit_zone(rng=random) -> tuple[str, float]:
+    i = bisect_left(_ZONE_CDF_T, rng.random())
+    if i == len(_ZONE_NAMES):
+        return "BODY", 1.0
+    return _ZONE_NAMES[i], _ZONE_MULTS_T[i]
 
 # ── Ability Pools ───────────────────────────────────────────────
+# Built once at import: (name, atk_scale, cd, effects, desc) per family.
+# Damage is resolved per fighter as int(base_atk * atk_scale).
+ABILITY_TABLE = {
+    "tyrannosaurid": (
+        ("Bite",             1.0, 0, (), "a powerful jaw clamp"),
+        ("Charged Bite",     2.2, 3, (), "a devastating charged jaw crush"),
+        ("Crushing Bite",    1.5, 2, ({"type": "bonebreak", "dur": 2},), "a bone-shattering crunch"),
+        ("Tyrant Stomp",     0.8, 1, (), "a thundering stomp"),
+    ),
+    "raptor": (
+        ("Raptor Strikes",   0.7, 0, (), "a flurry of rapid claw swipes"),
+        ("Pounce",           1.8, 2, ({"type": "bleed", "dur": 3, "pct": 0.03},), "a leaping pounce attack"),
+        ("Claw Slash",       1.2, 1, (), "a vicious claw rake"),
+        ("Ripping Kick",     0.5, 1, ({"type": "bleed", "dur": 2, "pct": 0.02},), "a slashing kick that tears flesh"),
+    ),
+    "therizinosaur": (
+        ("Scythe Swipe",     1.2, 0, (), "a sweeping scythe claw slash"),
+        ("Rending Slash",    2.0, 2, ({"type": "bleed", "dur": 3, "pct": 0.04},), "a deep rending claw tear"),
+        ("Defensive Stance", 0.0, 3, ({"type": "defense", "dur": 2, "reduction": 0.5},), "raises claws to block incoming"),
+    ),
+    "ceratopsian": (
+        ("Horn Thrust",      1.0, 0, (), "a forward horn jab"),
+        ("Charge",           2.0, 3, ({"type": "bonebreak", "dur": 2},), "a full-speed horn charge"),
+        ("Headbutt",         1.3, 1, (), "a heavy frill-first headbutt"),
+    ),
+    "ankylosaur": (
+        ("Tail Club",        1.1, 0, (), "a heavy tail club swing"),
+        ("Tail Slam",        1.8, 2, ({"type": "bonebreak", "dur": 2},), "a crushing tail slam"),
+        ("Spike Guard",      0.4, 2, ({"type": "defense", "dur": 1, "reduction": 0.6},), "hunkers behind armored plates"),
+    ),
+    "hadrosaur": (
+        ("Kick",             0.9, 0, (), "a swift rear kick"),
+        ("Tail Sweep",       1.4, 2, (), "a wide sweeping tail strike"),
+        ("Alarm Call",       0.0, 3, ({"type": "heal", "pct": 0.08},), "a booming rally call"),
+    ),
+    "sauropod": (
+        ("Stomp",            1.0, 0, (), "a ground-shaking stomp"),
+        ("Tail Whip",        1.6, 2, (), "a massive whipping tail strike"),
+        ("Tremor",           0.6, 3, ({"type": "bonebreak", "dur": 1},), "shakes the earth, rattling bones"),
+    ),
+}
+
+# Families without a dedicated pool fall back on diet type
+FALLBACK_ABILITY_TABLE = {
+    "carnivore": (
+        ("Bite",             1.0, 0, (), "a snapping bite"),
+        ("Lunge",            1.6, 2, ({"type": "bleed", "dur": 2, "pct": 0.02},), "a lunging snap"),
+    ),
+    "herbivore": (
+        ("Kick",             0.9, 0, (), "a rear-leg kick"),
+        ("Tail Sweep",       1.5, 2, (), "a sweeping tail"),
+    ),
+}
+
+
 def get_ability_pool(family, dtype, base_atk):
-    pools = {
-        "tyrannosaurid": [
-            {"name": "Bite",          "base": base_atk,           "cd": 0, "effects": [],
-             "desc": "a powerful jaw clamp"},
-            {"name": "Charged Bite",  "base": int(base_atk*2.2),  "cd": 3, "effects": [],
-             "desc": "a devastating charged jaw crush"},
-            {"name": "Crushing Bite", "base": int(base_atk*1.5),  "cd": 2,
-             "effects": [{"type": "bonebreak", "dur": 2}],
-             "desc": "a bone-shattering crunch"},
-            {"name": "Tyrant Stomp",  "base": int(base_atk*0.8),  "cd": 1, "effects": [],
-             "desc": "a thundering stomp"},
-        ],
-        "raptor": [
-            {"name": "Raptor Strikes","base": int(base_atk*0.7),  "cd": 0, "effects": [],
-             "desc": "a flurry of rapid claw swipes"},
-            {"name": "Pounce",        "base": int(base_atk*1.8),  "cd": 2,
-             "effects": [{"type": "bleed", "dur": 3, "pct": 0.03}],
-             "desc": "a leaping pounce attack"},
-            {"name": "Claw Slash",    "base": int(base_atk*1.2),  "cd": 1, "effects": [],
-             "desc": "a vicious claw rake"},
-            {"name": "Ripping Kick",  "base": int(base_atk*0.5),  "cd": 1,
-             "effects": [{"type": "bleed", "dur": 2, "pct": 0.02}],
-             "desc": "a slashing kick that tears flesh"},
-        ],
-        "therizinosaur": [
-            {"name": "Scythe Swipe",  "base": int(base_atk*1.2),  "cd": 0, "effects": [],
-             "desc": "a sweeping scythe claw slash"},
-            {"name": "Rending Slash", "base": int(base_atk*2.0),  "cd": 2,
-             "effects": [{"type": "bleed", "dur": 3, "pct": 0.04}],
-             "desc": "a deep rending claw tear"},
-            {"name": "Defensive Stance","base": 0,                "cd": 3,
-             "effects": [{"type": "defense", "dur": 2, "reduction": 0.5}],
-             "desc": "raises claws to block incoming"},
-        ],
-        "ceratopsian": [
-            {"name": "Horn Thrust",   "base": base_atk,           "cd": 0, "effects": [],
-             "desc": "a forward horn jab"},
-            {"name": "Charge",        "base": int(base_atk*2.0),  "cd": 3,
-             "effects": [{"type": "bonebreak", "dur": 2}],
-             "desc": "a full-speed horn charge"},
-            {"name": "Headbutt",      "base": int(base_atk*1.3),  "cd": 1, "effects": [],
-             "desc": "a heavy frill-first headbutt"},
-        ],
-        "ankylosaur": [
-            {"name": "Tail Club",     "base": int(base_atk*1.1),  "cd": 0, "effects": [],
-             "desc": "a heavy tail club swing"},
-            {"name": "Tail Slam",     "base": int(base_atk*1.8),  "cd": 2,
-             "effects": [{"type": "bonebreak", "dur": 2}],
-             "desc": "a crushing tail slam"},
-            {"name": "Spike Guard",   "base": int(base_atk*0.4),  "cd": 2,
-             "effects": [{"type": "defense", "dur": 1, "reduction": 0.6}],
-             "desc": "hunkers behind armored plates"},
-        ],
-        "hadrosaur": [
-            {"name": "Kick",          "base": int(base_atk*0.9),  "cd": 0, "effects": [],
-             "desc": "a swift rear kick"},
-            {"name": "Tail Sweep",    "base": int(base_atk*1.4),  "cd": 2, "effects": [],
-             "desc": "a wide sweeping tail strike"},
-            {"name": "Alarm Call",    "base": 0,                  "cd": 3,
-             "effects": [{"type": "heal", "pct": 0.08}],
-             "desc": "a booming rally call"},
-        ],
-        "sauropod": [
-            {"name": "Stomp",         "base": base_atk,           "cd": 0, "effects": [],
-             "desc": "a ground-shaking stomp"},
-            {"name": "Tail Whip",     "base": int(base_atk*1.6),  "cd": 2, "effects": [],
-             "desc": "a massive whipping tail strike"},
-            {"name": "Tremor",        "base": int(base_atk*0.6),  "cd": 3,
-             "effects": [{"type": "bonebreak", "dur": 1}],
-             "desc": "shakes the earth, rattling bones"},
-        ],
-    }
-    if family in pools:
-        return pools[family]
-    if dtype == "carnivore":
-        return [
-            {"name": "Bite", "base": base_atk, "cd": 0, "effects": [], "desc": "a snapping bite"},
-            {"name": "Lunge", "base": int(base_atk*1.6), "cd": 2,
-             "effects": [{"type": "bleed", "dur": 2, "pct": 0.02}], "desc": "a lunging snap"},
-        ]
-    return [
-        {"name": "Kick", "base": int(base_atk*0.9), "cd": 0, "effects": [], "desc": "a rear-leg kick"},
-        {"name": "Tail Sweep", "base": int(base_atk*1.5), "cd": 2, "effects": [], "desc": "a sweeping tail"},
-    ]
+    table = ABILITY_TABLE.get(family)
+    if table is None:
+        table = FALLBACK_ABILITY_TABLE["carnivore" if dtype == "carnivore" else "herbivore"]
+    # Effect dicts are copied too: callers may edit them, and the table is shared
+    return [{"name": name, "base": int(base_atk * scale), "cd": cd,
+             "effects": [dict(e) for e in effects], "desc": desc}
+            for name, scale, cd, effects, desc in table]
 
 
 # ── Passives ────────────────────────────────────────────────────
@@ -159,107 +167,223 @@ PASSIVES = {
     "therizinosaur": ("Lone Survivor","+10% Armor when solo"),
 }
 
+# (ATK per ally, armor per ally, armor when solo) for each passive
+PASSIVE_BONUSES = {
+    "Tyrant Roar":   (0.10, 0.0, 0.0),
+    "Pack Bark":     (0.08, 0.0, 0.0),
+    "Herd Shield":   (0.0, 0.05, 0.0),
+    "Shell Wall":    (0.0, 0.08, 0.0),
+    "Lone Survivor": (0.0, 0.0, 0.10),
+}
+
+
+# Status effect bits (PackMember.status_flags)
+ST_BLEED, ST_BONEBREAK, ST_DEFENSE = 1, 2, 4
+
+# Ability effect codes; effects are compiled to (code, dur, value) tuples
+EFF_NONE, EFF_BLEED, EFF_BONEBREAK, EFF_DEFENSE, EFF_HEAL = 0, 1, 2, 3, 4
+_EFF_CODES = {"bleed": EFF_BLEED, "bonebreak": EFF_BONEBREAK,
+              "defense": EFF_DEFENSE, "heal": EFF_HEAL}
+
+
+def _compile_effects(effects):
+    """Turn effect dicts into (code, dur, value) tuples, dropping unknown types."""
+    compiled = []
+    for eff in effects:
+        code = _EFF_CODES.get(eff.get("type"), EFF_NONE)
+        if code == EFF_BLEED:
+            compiled.append((code, eff.get("dur", 0), eff.get("pct", 0.03)))
+        elif code == EFF_BONEBREAK:
+            compiled.append((code, eff.get("dur", 0), 0.0))
+        elif code == EFF_DEFENSE:
+            compiled.append((code, eff.get("dur", 0), eff.get("reduction", 0.5)))
+        elif code == EFF_HEAL:
+            compiled.append((code, eff.get("dur", 0), eff.get("pct", 0.05)))
+    return tuple(compiled)
+
+
+class Ability(NamedTuple):
+    """A battle-ready ability: base damage scaled to the dino's ATK, effects compiled."""
+    name: str
+    base: int
+    cd: int
+    fx: tuple
+    desc: str
+    n_support: int  # defense/heal effects, weighted up when the user is low on HP
+
+
+def _make_ability(name, base, cd, effects, desc):
+    fx = _compile_effects(effects)
+    return Ability(name, base, cd, fx, desc, sum(1 for f in fx if f[0] in (EFF_DEFENSE, EFF_HEAL)))
+
+
+@lru_cache(maxsize=512)
+def _battle_ability_pool(family, dtype, base_atk):
+    """get_ability_pool as Ability tuples, shared by every PackMember of that stat line."""
+    return tuple(_make_ability(a["name"], a["base"], a["cd"], a["effects"], a["desc"])
+                 for a in get_ability_pool(family, dtype, base_atk))
 
-# ── Individual Pack Member ──────────────────────────────────────
-class PackMember:
-    """One individual dino within a pack/team. Tracks its own HP and status."""
 
-    def __init__(self, dino_data, index=0):
+# ── Dino Template ───────────────────────────────────────────────
+class DinoTemplate:
+    """Read-only per-dino setup (stats, family, abilities), shared by a whole pack."""
+
+    __slots__ = (
+        "data", "dino_id", "base_name", "family", "dtype",
+        "cw", "max_hp", "base_atk", "armor", "spd", "abilities", "ready_cum",
+    )
+
+    def __init__(self, dino_data):
         self.data = dino_data
         self.dino_id = dino_data.get("id", "unknown")
         self.base_name = dino_data["name"]
-        self.index = index
-        self.family = SPECIES_FAMILIES.get(self.dino_id.lower(), "generic")
+        self.family = family_of(self.dino_id)
         self.dtype = dino_data.get("type", "carnivore")
-
-        # Individual stats
         self.cw = dino_data.get("cw", 3000)
         self.max_hp = dino_data.get("hp", 500)
-        self.hp = self.max_hp
         self.base_atk = dino_data.get("atk", 50)
         self.armor = dino_data.get("armor", 1.0)
         self.spd = dino_data.get("spd", 500)
 
+        # Use custom abilities if defined, otherwise use the shared family pool
+        if dino_data.get('custom_abilities'):
+            # Scale custom ability base values relative to this dino's actual ATK
+            # 'base' in custom abilities is stored as multiplier*100 (100 = 1.0x ATK)
+            self.abilities = tuple(
+                _make_ability(ab['name'], int(self.base_atk * (ab.get('base', 100) / 100.0)),
+                              ab.get('cd', 0), ab.get('effects', ()), ab.get('desc', ''))
+                for ab in dino_data['custom_abilities'])
+        else:
+            self.abilities = _battle_ability_pool(self.family, self.dtype, self.base_atk)
+        # Cumulative pick weights for the common case: healthy, everything off cooldown
+        self.ready_cum = tuple(accumulate(30 if a.cd > 0 else 10 for a in self.abilities))
+
+
+# ── Individual Pack Member ──────────────────────────────────────
+class PackMember:
+    """One individual dino within a pack/team. Tracks its own HP and status."""
+
+    __slots__ = (
+        "data", "dino_id", "base_name", "index", "family", "dtype", "label",
+        "cw", "max_hp", "hp", "base_atk", "armor", "spd",
+        "atk_bonus", "armor_bonus", "atk_mult", "armor_mult", "defense_up", "fled",
+        "status_flags", "bleeds", "bone_rem", "def_rem", "def_reduction",
+        "abilities", "ready_cum", "cooldowns",
+    )
+
+    def __init__(self, dino_data, index=0, template=None):
+        # Static stats come from the pack's shared template; they are copied
+        # onto the member because the combat hot path reads them directly
+        tpl = template or DinoTemplate(dino_data)
+        self.data = dino_data
+        self.dino_id = tpl.dino_id
+        self.base_name = tpl.base_name
+        self.index = index
+        self.family = tpl.family
+        self.dtype = tpl.dtype
+
+        # Individual stats
+        self.cw = tpl.cw
+        self.max_hp = tpl.max_hp
+        self.hp = self.max_hp
+        self.base_atk = tpl.base_atk
+        self.armor = tpl.armor
+        self.spd = tpl.spd
+
         # Combat state
         self.atk_bonus = 0.0
         self.armor_bonus = 0.0
-        self.status_effects = []
+        self.update_multipliers()
+        # Status effects: bleeds stack as [remaining, pct] pairs; bonebreak and
+        # defense keep one slot each, refreshed to the longer/stronger value
+        self.status_flags = 0
+        self.bleeds = []
+        self.bone_rem = 0
+        self.def_rem = 0
+        self.def_reduction = 0.0
         self.defense_up = 0.0
         self.fled = False
 
-        # Abilities and cooldowns (each member has their own)
-        # Use custom abilities if defined, otherwise use family pool
-        if dino_data.get('custom_abilities'):
-            # Scale custom ability base values relative to this dino's actual ATK
-            self.abilities = []
-            for ab in dino_data['custom_abilities']:
-                scaled = dict(ab)
-                # 'base' in custom abilities is stored as multiplier*100 (100 = 1.0x ATK)
-                scaled['base'] = int(self.base_atk * (ab.get('base', 100) / 100.0))
-                self.abilities.append(scaled)
-        else:
-            self.abilities = get_ability_pool(self.family, self.dtype, self.base_atk)
-        self.cooldowns = {a["name"]: 0 for a in self.abilities}
+        # Abilities are read-only during battle; cooldowns are per member
+        self.abilities = tpl.abilities
+        self.ready_cum = tpl.ready_cum
+        self.cooldowns = [0] * len(self.abilities)  # indexed by ability slot
 
-    @property
-    def label(self):
-        if self.index > 0:
-            return f"{self.base_name} #{self.index + 1}"
-        return self.base_name
+        # Display name, built once (used in every log line)
+        self.label = f"{self.base_name} #{index + 1}" if index > 0 else self.base_name
+
+    def update_multipliers(self) -> None:
+        """Cache the damage multipliers derived from ATK/armor bonuses."""
+        self.atk_mult = 1.0 + self.atk_bonus
+        armor_red = self.armor * (1.0 + self.armor_bonus) * 0.10
+        self.armor_mult = 1.0 - (armor_red if armor_red < 0.50 else 0.50)
 
     @property
     def alive(self):
         return self.hp > 0 and not self.fled
 
-    def pick_ability(self):
-        available = [a for a in self.abilities if self.cooldowns.get(a["name"], 0) <= 0]
+    def pick_ability(self, rng=random) -> Ability:
+        """Weighted-random pick among ready abilities; puts the pick on cooldown."""
+        abilities, cooldowns = self.abilities, self.cooldowns
+        available = [i for i, c in enumerate(cooldowns) if c <= 0]
         if not available:
-            available = [a for a in self.abilities if a["cd"] == 0]
+            available = [i for i, a in enumerate(abilities) if a.cd == 0]
         if not available:
-            return {"name": "Struggle", "base": max(5, int(self.base_atk * 0.3)),
-                    "cd": 0, "effects": [], "desc": "a desperate flailing attack"}
-        weights = []
-        for a in available:
-            w = 30 if a["cd"] > 0 else 10
-            if self.hp < self.max_hp * 0.3:
-                for eff in a.get("effects", []):
-                    if eff["type"] in ("defense", "heal"):
-                        w += 40
-            weights.append(w)
-        total = sum(weights)
-        r = random.random() * total
-        cumul = 0
-        for i, w in enumerate(weights):
-            cumul += w
-            if r <= cumul:
-                return available[i]
-        return available[0]
-
-    def tick_cooldowns(self):
-        for name in self.cooldowns:
-            if self.cooldowns[name] > 0:
-                self.cooldowns[name] -= 1
-
-    def tick_status_effects(self):
-        logs = []
+            return Ability("Struggle", max(5, int(self.base_atk * 0.3)), 0, (), "a desperate flailing attack", 0)
+        # Same draw as rng.choices(available, weights), minus its per-call setup
+        if self.hp < self.max_hp * 0.3:
+            cum = list(accumulate((30 if abilities[i].cd > 0 else 10) + 40 * abilities[i].n_support
+                                  for i in available))
+        elif len(available) == len(abilities):
+            cum = self.ready_cum
+        else:
+            cum = list(accumulate(30 if abilities[i].cd > 0 else 10 for i in available))
+        i = available[bisect_right(cum, rng.random() * cum[-1], 0, len(cum) - 1)]
+        ability = abilities[i]
+        cooldowns[i] = ability.cd
+        return ability
+
+    def tick_cooldowns(self) -> None:
+        cooldowns = self.cooldowns
+        for i, c in enumerate(cooldowns):
+            if c > 0:
+                cooldowns[i] = c - 1
+
+    def tick_status_effects(self, log: bool = True) -> list | None:
+        logs = [] if log else None
         self.defense_up = 0.0
-        new = []
-        for eff in self.status_effects:
-            if eff["type"] == "bleed":
-                dmg = max(1, int(self.max_hp * eff.get("pct", 0.03)))
+        flags = self.status_flags
+        if not flags:
+            return logs
+        if flags & ST_BLEED:
+            left = []
+            for bleed in self.bleeds:
+                dmg = int(self.max_hp * bleed[1]) or 1
                 self.hp = max(0, self.hp - dmg)
-                logs.append(f"  🩸 {self.label} bleeds for **{dmg}** ({eff['remaining']} turns)")
-            elif eff["type"] == "bonebreak":
+                if log:
+                    logs.append(f"  🩸 {self.label} bleeds for **{dmg}** ({bleed[0]} turns)")
+                bleed[0] -= 1
+                if bleed[0] > 0:
+                    left.append(bleed)
+            self.bleeds = left
+            if not left:
+                flags &= ~ST_BLEED
+        if flags & ST_BONEBREAK:
+            if log:
                 logs.append(f"  🦴 {self.label} — bonebroken, dodge disabled")
-            elif eff["type"] == "defense":
-                self.defense_up = max(self.defense_up, eff.get("reduction", 0.5))
-            eff["remaining"] -= 1
-            if eff["remaining"] > 0:
-                new.append(eff)
-        self.status_effects = new
+            self.bone_rem -= 1
+            if self.bone_rem <= 0:
+                flags &= ~ST_BONEBREAK
+        if flags & ST_DEFENSE:
+            self.defense_up = self.def_reduction
+            self.def_rem -= 1
+            if self.def_rem <= 0:
+                flags &= ~ST_DEFENSE
+                self.def_reduction = 0.0
+        self.status_flags = flags
         return logs
 
-    def check_flee(self):
+    def check_flee(self, rng=random) -> bool:
         """Check if this member flees. Higher chance when lower HP."""
         if self.fled:
             return False
@@ -269,8 +393,9 @@ class PackMember:
         # Below 25% HP: increasing flee chance
         # At 25%: 10% chance, at 10%: 35% chance, at 5%: 50% chance
         flee_chance = 0.10 + (0.25 - hp_pct) * 1.6
-        flee_chance = min(0.50, flee_chance)
-        if random.random() < flee_chance:
+        if flee_chance > 0.50:
+            flee_chance = 0.50
+        if rng.random() < flee_chance:
             self.fled = True
             return True
         return False
@@ -283,14 +408,15 @@ class BattleSide:
     def __init__(self, dino_data, pack_size=1):
         self.dino_data = dino_data
         self.pack_size = pack_size
-        self.family = SPECIES_FAMILIES.get(dino_data.get("id", "").lower(), "generic")
-        self.dtype = dino_data.get("type", "carnivore")
-        self.cw = dino_data.get("cw", 3000)
+        template = DinoTemplate(dino_data)
+        self.family = template.family
+        self.dtype = template.dtype
+        self.cw = template.cw
 
         # Create individual members
         self.members = []
         for i in range(pack_size):
-            self.members.append(PackMember(dino_data, index=i if pack_size > 1 else 0))
+            self.members.append(PackMember(dino_data, index=i if pack_size > 1 else 0, template=template))
 
         # Pack display name
         if pack_size > 1:
@@ -302,321 +428,460 @@ class BattleSide:
 
     @property
     def alive_members(self):
-        return [m for m in self.members if m.alive]
+        return [m for m in self.members if m.hp > 0 and not m.fled]
 
     @property
     def alive(self):
-        return len(self.alive_members) > 0
+        for m in self.members:
+            if m.hp > 0 and not m.fled:
+                return True
+        return False
 
     @property
     def alive_count(self):
-        return len(self.alive_members)
+        return sum(1 for m in self.members if m.hp > 0 and not m.fled)
+
+    @property
+    def ko_count(self):
+        return sum(1 for m in self.members if m.hp <= 0)
 
     def apply_pack_bonuses(self):
         """Apply group passive bonuses to each member."""
+        if not self.passive:
+            return
+        atk_per, armor_per, solo_armor = PASSIVE_BONUSES.get(self.passive[0], (0.0, 0.0, 0.0))
         ally_count = self.pack_size - 1
+        atk_bonus = atk_per * ally_count
+        armor_bonus = armor_per * ally_count + (solo_armor if ally_count == 0 else 0.0)
+        # Every member shares the family, so the bonus is resolved once per side
         for m in self.members:
-            if self.passive:
-                pname = self.passive[0]
-                if pname == "Lone Survivor" and self.pack_size == 1:
-                    m.armor_bonus += 0.10
-                elif pname == "Tyrant Roar":
-                    m.atk_bonus += 0.10 * ally_count
-                elif pname == "Pack Bark":
-                    m.atk_bonus += 0.08 * ally_count
-                elif pname == "Herd Shield":
-                    m.armor_bonus += 0.05 * ally_count
-                elif pname == "Shell Wall":
-                    m.armor_bonus += 0.08 * ally_count
-
-    def pick_attacker(self):
+            m.atk_bonus += atk_bonus
+            m.armor_bonus += armor_bonus
+            m.update_multipliers()
+
+    def pick_attacker(self, rng=random):
         """Pick a random alive member to attack this turn."""
         alive = self.alive_members
-        if not alive:
-            return None
-        return random.choice(alive)
+        if len(alive) < 2:
+            return alive[0] if alive else None
+        return rng.choice(alive)
 
-    def pick_target(self):
+    def pick_target(self, rng=random):
         """Pick a random alive member on this side to be attacked."""
         alive = self.alive_members
-        if not alive:
-            return None
-        return random.choice(alive)
+        if len(alive) < 2:
+            return alive[0] if alive else None
+        return rng.choice(alive)
 
 
 # ── Core Damage Calc (PoT Formula) ─────────────────────────────
-def calc_pot_damage(attacker: PackMember, defender: PackMember, ability):
+def _clip(x: float, lo: float, hi: float) -> float:
+    return lo if x < lo else hi if x > hi else x
+
+
+@_njit
+def _calc_damage_core(base, atk_cw, def_cw, def_spd, has_bb, armor_mult, def_up, atk_mult,
+                      r_dodge, r_zone, r_crit, r_var):
+    """
+    calc_pot_damage's formula for compiled callers, with every random draw
+    passed in. Returns (damage, zone_idx, is_crit, is_dodge); zone_idx is -1
+    on a dodge. calc_pot_damage itself stays inline: a call through the numba
+    dispatcher costs more than the arithmetic it would replace.
+    """
+    # Dodge check
+    dodge = 0.02 if has_bb else min(0.15, def_spd / 12000.0)
+    if r_dodge < dodge:
+        return 0, -1, False, True
+
+    # PoT formula
+    raw = base * (atk_cw / max(1.0, def_cw))
+
+    # Hit zone
+    zi = 0
+    while zi < len(_ZONE_CDF_T) - 1 and r_zone > _ZONE_CDF_T[zi]:
+        zi += 1
+    raw *= _ZONE_MULTS_T[zi]
+
+    # Crit (12%)
+    crit = r_crit < 0.12
+    if crit:
+        raw *= 1.5
+
+    # Armor, defense stance, ATK bonus, variance ±20%
+    raw *= armor_mult
+    raw *= 1.0 - min(0.90, def_up)
+    raw *= atk_mult
+    raw *= 0.80 + 0.40 * r_var
+    return max(1, int(raw)), zi, crit, False
+
+
+def calc_pot_damage(attacker: PackMember, defender: PackMember, ability: Ability, rng=random) -> tuple[int, str, bool, bool]:
     """Returns (damage, zone_name, is_crit, is_dodge)"""
-    if ability["base"] <= 0:
+    if ability.base <= 0:
         return 0, "—", False, False
 
     # Dodge check
-    has_bb = any(e["type"] == "bonebreak" for e in defender.status_effects)
-    dodge = 0.02 if has_bb else min(0.15, defender.spd / 12000.0)
-    if random.random() < dodge:
+    if defender.status_flags & ST_BONEBREAK:
+        dodge = 0.02
+    else:
+        dodge = defender.spd / 12000.0
+        if dodge > 0.15:
+            dodge = 0.15
+    if rng.random() < dodge:
         return 0, "—", False, True
 
     # PoT formula
     cw_ratio = attacker.cw / max(1, defender.cw)
-    raw = ability["base"] * cw_ratio
+    raw = ability.base * cw_ratio
 
     # Hit zone
-    zone, zmult = roll_hit_zone()
+    zone, zmult = roll_hit_zone(rng)
     raw *= zmult
 
     # Crit (12%)
-    crit = random.random() < 0.12
+    crit = rng.random() < 0.12
     if crit:
         raw *= 1.5
 
     # Armor
-    armor_total = defender.armor * (1.0 + defender.armor_bonus)
-    raw *= (1.0 - min(0.50, armor_total * 0.10))
+    raw *= defender.armor_mult
 
     # Defense stance
-    if defender.defense_up > 0:
-        raw *= (1.0 - min(0.90, defender.defense_up))
+    defense_up = defender.defense_up
+    if defense_up > 0:
+        raw *= 1.0 - (defense_up if defense_up < 0.90 else 0.90)
 
     # ATK bonus
-    raw *= (1.0 + attacker.atk_bonus)
+    raw *= attacker.atk_mult
 
     # Variance ±20%
-    raw *= random.uniform(0.80, 1.20)
+    raw *= 0.80 + 0.40 * rng.random()
 
-    final = max(1, int(raw))
-    defender.hp = max(0, defender.hp - final)
+    final = int(raw) or 1
+    hp = defender.hp - final
+    defender.hp = hp if hp > 0 else 0
     return final, zone, crit, False
 
 
-def apply_effects(ability, attacker: PackMember, defender: PackMember, lines):
-    """Apply ability status effects. Returns log lines."""
-    for eff in ability.get("effects", []):
-        if eff["type"] == "bleed":
-            dur = max(1, min(eff["dur"] + 2, int(eff["dur"] * (attacker.cw / max(1, defender.cw)))))
-            defender.status_effects.append({"type": "bleed", "remaining": dur, "pct": eff.get("pct", 0.03)})
-            lines.append(f"  🩸 {defender.label} starts **bleeding** ({dur} turns)!")
-        elif eff["type"] == "bonebreak":
-            dur = max(1, min(eff["dur"] + 2, int(eff["dur"] * (attacker.cw / max(1, defender.cw)))))
-            defender.status_effects.append({"type": "bonebreak", "remaining": dur})
-            lines.append(f"  🦴 {defender.label} suffers **Bonebreak** ({dur} turns)!")
-        elif eff["type"] == "defense":
-            attacker.status_effects.append({"type": "defense", "remaining": eff["dur"], "reduction": eff["reduction"]})
-            lines.append(f"  🛡️ {attacker.label} enters **Defensive Stance** (−{int(eff['reduction']*100)}% incoming)")
-        elif eff["type"] == "heal":
-            heal = max(1, int(attacker.max_hp * eff.get("pct", 0.05)))
-            attacker.hp = min(attacker.max_hp, attacker.hp + heal)
-            lines.append(f"  💚 {attacker.label} heals **{heal}** HP → {attacker.hp}/{attacker.max_hp}")
+def _effect_dur(dur: int, attacker: PackMember, defender: PackMember) -> int:
+    """Offensive effect duration scaled by CW ratio, capped at base + 2."""
+    return _clip(int(dur * (attacker.cw / max(1, defender.cw))), 1, dur + 2)
+
+
+def _fx_bleed(dur: int, val: float, attacker: PackMember, defender: PackMember, lines: list | None) -> None:
+    dur = _effect_dur(dur, attacker, defender)
+    defender.bleeds.append([dur, val])
+    defender.status_flags |= ST_BLEED
+    if lines is not None:
+        lines.append(f"  🩸 {defender.label} starts **bleeding** ({dur} turns)!")
+
+
+def _fx_bonebreak(dur: int, val: float, attacker: PackMember, defender: PackMember, lines: list | None) -> None:
+    dur = _effect_dur(dur, attacker, defender)
+    defender.bone_rem = max(defender.bone_rem, dur)
+    defender.status_flags |= ST_BONEBREAK
+    if lines is not None:
+        lines.append(f"  🦴 {defender.label} suffers **Bonebreak** ({dur} turns)!")
+
+
+def _fx_defense(dur: int, val: float, attacker: PackMember, defender: PackMember, lines: list | None) -> None:
+    attacker.def_rem = max(attacker.def_rem, dur)
+    attacker.def_reduction = max(attacker.def_reduction, val)
+    attacker.status_flags |= ST_DEFENSE
+    if lines is not None:
+        lines.append(f"  🛡️ {attacker.label} enters **Defensive Stance** (−{int(val*100)}% incoming)")
+
+
+def _fx_heal(dur: int, val: float, attacker: PackMember, defender: PackMember, lines: list | None) -> None:
+    heal = int(attacker.max_hp * val) or 1
+    attacker.hp = min(attacker.max_hp, attacker.hp + heal)
+    if lines is not None:
+        lines.append(f"  💚 {attacker.label} heals **{heal}** HP → {attacker.hp}/{attacker.max_hp}")
+
+
+# Indexed by EFF_* code
+_EFFECT_HANDLERS = (None, _fx_bleed, _fx_bonebreak, _fx_defense, _fx_heal)
+
+
+def apply_effects(ability: Ability, attacker: PackMember, defender: PackMember, lines: list | None) -> None:
+    """Apply ability status effects, appending log lines unless `lines` is None."""
+    for code, dur, val in ability.fx:
+        _EFFECT_HANDLERS[code](dur, val, attacker, defender, lines)
 
 
 # ── Battle Simulation ──────────────────────────────────────────
-def simulate_battle(dino_a_data, dino_b_data, pack_a=1, pack_b=1, max_turns=15):
+def _resolve_attack(attacker, target, ability, lines, rng, extra=False) -> bool:
     """
-    Turn-by-turn battle with individual pack members.
-    Tracks prop bet outcomes: flee, bleed kills, first crit, KO count.
+    Damage, log lines and effects for one attack; returns True on a crit.
+    Extra pack attacks use the short log form, and their non-damaging
+    picks are skipped (support moves only come from the main attack).
     """
-    side_a = BattleSide(dino_a_data, pack_size=pack_a)
-    side_b = BattleSide(dino_b_data, pack_size=pack_b)
-
-    side_a.apply_pack_bonuses()
-    side_b.apply_pack_bonuses()
+    if ability.base <= 0:
+        if extra:
+            return False
+        if lines is not None:
+            lines.append(f"{attacker.label} uses **{ability.name}** ({ability.desc})")
+        apply_effects(ability, attacker, target, lines)
+        return False
 
-    turns = []
-    hp_snapshots = []  # [{a_hp, a_max, b_hp, b_max}, ...]
+    dmg, zone, crit, dodge = calc_pot_damage(attacker, target, ability, rng)
+    if lines is not None:
+        if dodge:
+            verb = "also attacks with" if extra else "uses"
+            desc = "" if extra else f" ({ability.desc})"
+            lines.append(f"{attacker.label} {verb} **{ability.name}**{desc} → {target.label} **dodges!** 💨")
+        else:
+            crit_txt = " ⚡ **CRIT!**" if crit else ""
+            if extra:
+                lines.append(f"{attacker.label} also uses **{ability.name}** → 🎯 {zone} HIT{crit_txt} — **{dmg}** dmg")
+            else:
+                lines.append(
+                    f"{attacker.label} uses **{ability.name}** ({ability.desc}) "
+                    f"→ 🎯 {zone} HIT{crit_txt} — **{dmg}** damage"
+                )
+            lines.append(f"  ↳ {target.label}: {target.hp}/{target.max_hp} HP")
+            if target.hp <= 0:
+                lines.append(f"  💀 **{target.label}** has been defeated!")
+    apply_effects(ability, attacker, target, lines)
+    return crit
+
+
+def _run_packs(side_a, side_b, max_turns, log, rng):
+    """Generic turn loop. Returns (turns, hp_snapshots, turn_count, any_fled, bleed_kills, first_crit_side)."""
+    turns = [] if log else None
+    hp_snapshots = [] if log else None  # [{a_hp, a_max, b_hp, b_max}, ...]
+    a_max = sum(m.max_hp for m in side_a.members)
+    b_max = sum(m.max_hp for m in side_b.members)
     turn_num = 0
 
+    def record_hp():
+        snap = {"a_hp": sum(max(0, m.hp) for m in side_a.members), "a_max": a_max,
+                "b_hp": sum(max(0, m.hp) for m in side_b.members), "b_max": b_max}
+        hp_snapshots.append(snap)
+        return snap
+
     # Prop bet tracking
     any_fled = False
     bleed_kills = 0
     first_crit_side = None  # "a" or "b"
-    total_kos = 0
-    # Track which members have already been counted as dead
-    dead_set = set()
-
-    def _check_new_deaths(side, side_label):
-        nonlocal total_kos
-        count = 0
-        for m in side.members:
-            mid = id(m)
-            if m.hp <= 0 and mid not in dead_set:
-                dead_set.add(mid)
-                total_kos += 1
-                count += 1
-        return count
 
     while side_a.alive and side_b.alive and turn_num < max_turns:
         turn_num += 1
-        lines = [f"⚔️ **Turn {turn_num}**"]
+        lines = [f"⚔️ **Turn {turn_num}**"] if log else None
 
-        if side_a.pack_size > 1 or side_b.pack_size > 1:
+        if log and (side_a.pack_size > 1 or side_b.pack_size > 1):
             lines.append(f"  📋 {side_a.display_name}: {side_a.alive_count}/{side_a.pack_size} alive | "
                          f"{side_b.display_name}: {side_b.alive_count}/{side_b.pack_size} alive")
 
-        # Status effect ticks
+        # Status effect ticks (members with nothing active are skipped)
+        bled_out = []
         for m in side_a.alive_members + side_b.alive_members:
-            hp_before = m.hp
-            for log_line in m.tick_status_effects():
-                lines.append(log_line)
+            if not m.status_flags and not m.defense_up:
+                continue
+            tick_logs = m.tick_status_effects(log)
+            if tick_logs:
+                lines.extend(tick_logs)
             # Bleed kill check
-            if hp_before > 0 and m.hp <= 0:
-                if any(e["type"] == "bleed" for e in m.status_effects) or hp_before > m.hp:
-                    bleed_kills += 1
-
-        # Check bleed deaths
-        for m in side_a.members + side_b.members:
-            if m.hp <= 0 and id(m) not in dead_set:
+            if m.hp <= 0:
+                bled_out.append(m)
+        bleed_kills += len(bled_out)
+        if log:
+            for m in bled_out:
                 lines.append(f"  💀 {m.label} succumbs to their wounds!")
-                dead_set.add(id(m))
-                total_kos += 1
 
         if not side_a.alive or not side_b.alive:
-            a_hp = sum(max(0, m.hp) for m in side_a.members)
-            a_max = sum(m.max_hp for m in side_a.members)
-            b_hp = sum(max(0, m.hp) for m in side_b.members)
-            b_max = sum(m.max_hp for m in side_b.members)
-            hp_snapshots.append({"a_hp": a_hp, "a_max": a_max, "b_hp": b_hp, "b_max": b_max})
-            turns.append(lines)
+            if log:
+                record_hp()
+                turns.append(lines)
             break
 
         # Flee checks
         for m in side_a.alive_members + side_b.alive_members:
-            if m.check_flee():
+            if m.check_flee(rng):
                 any_fled = True
-                lines.append(f"  🏃 {m.label} panics and **flees** the battle! ({m.hp}/{m.max_hp} HP)")
+                if log:
+                    lines.append(f"  🏃 {m.label} panics and **flees** the battle! ({m.hp}/{m.max_hp} HP)")
 
         if not side_a.alive or not side_b.alive:
-            if not side_a.alive:
+            if log and not side_a.alive:
                 lines.append(f"💨 {side_a.display_name}'s remaining fighters have fled or fallen!")
-            if not side_b.alive:
+            if log and not side_b.alive:
                 lines.append(f"💨 {side_b.display_name}'s remaining fighters have fled or fallen!")
-            a_hp = sum(max(0, m.hp) for m in side_a.members)
-            a_max = sum(m.max_hp for m in side_a.members)
-            b_hp = sum(max(0, m.hp) for m in side_b.members)
-            b_max = sum(m.max_hp for m in side_b.members)
-            hp_snapshots.append({"a_hp": a_hp, "a_max": a_max, "b_hp": b_hp, "b_max": b_max})
-            turns.append(lines)
+            if log:
+                record_hp()
+                turns.append(lines)
             break
 
         # Speed-based initiative
         first_side, second_side = (side_a, side_b) if side_a.cw <= side_b.cw else (side_b, side_a)
         first_label = "a" if first_side is side_a else "b"
         second_label = "b" if first_label == "a" else "a"
-        if random.random() < 0.15:
+        if rng.random() < 0.15:
             first_side, second_side = second_side, first_side
             first_label, second_label = second_label, first_label
 
-        # ── First side attacks ──
-        attacker = first_side.pick_attacker()
-        target = second_side.pick_target()
-        if attacker and target:
-            ability = attacker.pick_ability()
-            attacker.cooldowns[ability["name"]] = ability["cd"]
-
-            if ability["base"] > 0:
-                dmg, zone, crit, dodge = calc_pot_damage(attacker, target, ability)
-                if crit and first_crit_side is None:
-                    first_crit_side = first_label
-                if dodge:
-                    lines.append(f"{attacker.label} uses **{ability['name']}** ({ability['desc']}) → {target.label} **dodges!** 💨")
-                else:
-                    crit_txt = " ⚡ **CRIT!**" if crit else ""
-                    lines.append(
-                        f"{attacker.label} uses **{ability['name']}** ({ability['desc']}) "
-                        f"→ 🎯 {zone} HIT{crit_txt} — **{dmg}** damage"
-                    )
-                    lines.append(f"  ↳ {target.label}: {target.hp}/{target.max_hp} HP")
-                    if target.hp <= 0:
-                        lines.append(f"  💀 **{target.label}** has been defeated!")
-                        _check_new_deaths(second_side, second_label)
-            else:
-                lines.append(f"{attacker.label} uses **{ability['name']}** ({ability['desc']})")
-
-            apply_effects(ability, attacker, target, lines)
-
-        if not second_side.alive:
-            turns.append(lines)
-            break
-
-        # ── Second side attacks ──
-        attacker2 = second_side.pick_attacker()
-        target2 = first_side.pick_target()
-        if attacker2 and target2:
-            ability2 = attacker2.pick_ability()
-            attacker2.cooldowns[ability2["name"]] = ability2["cd"]
-
-            if ability2["base"] > 0:
-                dmg2, zone2, crit2, dodge2 = calc_pot_damage(attacker2, target2, ability2)
-                if crit2 and first_crit_side is None:
-                    first_crit_side = second_label
-                if dodge2:
-                    lines.append(f"{attacker2.label} uses **{ability2['name']}** ({ability2['desc']}) → {target2.label} **dodges!** 💨")
-                else:
-                    crit_txt2 = " ⚡ **CRIT!**" if crit2 else ""
-                    lines.append(
-                        f"{attacker2.label} uses **{ability2['name']}** ({ability2['desc']}) "
-                        f"→ 🎯 {zone2} HIT{crit_txt2} — **{dmg2}** damage"
-                    )
-                    lines.append(f"  ↳ {target2.label}: {target2.hp}/{target2.max_hp} HP")
-                    if target2.hp <= 0:
-                        lines.append(f"  💀 **{target2.label}** has been defeated!")
-                        _check_new_deaths(first_side, first_label)
-            else:
-                lines.append(f"{attacker2.label} uses **{ability2['name']}** ({ability2['desc']})")
-
-            apply_effects(ability2, attacker2, target2, lines)
-
-        if not first_side.alive:
-            turns.append(lines)
+        # ── Main attacks: first side, then second side ──
+        main_attackers = []
+        for att_side, def_side, att_label, def_label in ((first_side, second_side, first_label, second_label),
+                                                          (second_side, first_side, second_label, first_label)):
+            attacker = att_side.pick_attacker(rng)
+            target = def_side.pick_target(rng)
+            main_attackers.append(attacker)
+            if attacker and target:
+                if _resolve_attack(attacker, target, attacker.pick_ability(rng), lines, rng) \
+                        and first_crit_side is None:
+                    first_crit_side = att_label
+
+            if not def_side.alive:
+                break
+
+        if not first_side.alive or not second_side.alive:
+            if log:
+                turns.append(lines)
             break
 
         # Extra pack attacks
         for extra_side, target_side in [(first_side, second_side), (second_side, first_side)]:
             ex_label = "a" if extra_side is side_a else "b"
-            extras = [m for m in extra_side.alive_members if m != attacker and m != attacker2]
+            extras = [m for m in extra_side.alive_members if m not in main_attackers]
             for em in extras:
                 if not target_side.alive:
                     break
-                if random.random() < 0.60:
-                    et = target_side.pick_target()
-                    if et:
-                        ea = em.pick_ability()
-                        em.cooldowns[ea["name"]] = ea["cd"]
-                        if ea["base"] > 0:
-                            ed, ez, ec, edg = calc_pot_damage(em, et, ea)
-                            if ec and first_crit_side is None:
-                                first_crit_side = ex_label
-                            if edg:
-                                lines.append(f"{em.label} also attacks with **{ea['name']}** → {et.label} **dodges!** 💨")
-                            else:
-                                ct = " ⚡ **CRIT!**" if ec else ""
-                                lines.append(f"{em.label} also uses **{ea['name']}** → 🎯 {ez} HIT{ct} — **{ed}** dmg")
-                                lines.append(f"  ↳ {et.label}: {et.hp}/{et.max_hp} HP")
-                                if et.hp <= 0:
-                                    lines.append(f"  💀 **{et.label}** has been defeated!")
-                                    _check_new_deaths(target_side, "a" if target_side is side_a else "b")
-                            apply_effects(ea, em, et, lines)
+                if rng.random() < 0.60:
+                    et = target_side.pick_target(rng)
+                    if et and _resolve_attack(em, et, em.pick_ability(rng), lines, rng, extra=True) \
+                            and first_crit_side is None:
+                        first_crit_side = ex_label
 
         if not side_a.alive or not side_b.alive:
-            a_hp = sum(max(0, m.hp) for m in side_a.members)
-            a_max = sum(m.max_hp for m in side_a.members)
-            b_hp = sum(max(0, m.hp) for m in side_b.members)
-            b_max = sum(m.max_hp for m in side_b.members)
-            hp_snapshots.append({"a_hp": a_hp, "a_max": a_max, "b_hp": b_hp, "b_max": b_max})
-            turns.append(lines)
+            if log:
+                record_hp()
+                turns.append(lines)
             break
 
         # Turn summary
-        a_hp = sum(max(0, m.hp) for m in side_a.members)
-        a_max = sum(m.max_hp for m in side_a.members)
-        b_hp = sum(max(0, m.hp) for m in side_b.members)
-        b_max = sum(m.max_hp for m in side_b.members)
-        lines.append(f"📊 {side_a.display_name}: {a_hp}/{a_max} HP ({side_a.alive_count} alive) | "
-                     f"{side_b.display_name}: {b_hp}/{b_max} HP ({side_b.alive_count} alive)")
-        hp_snapshots.append({"a_hp": a_hp, "a_max": a_max, "b_hp": b_hp, "b_max": b_max})
+        if log:
+            snap = record_hp()
+            lines.append(f"📊 {side_a.display_name}: {snap['a_hp']}/{a_max} HP ({side_a.alive_count} alive) | "
+                         f"{side_b.display_name}: {snap['b_hp']}/{b_max} HP ({side_b.alive_count} alive)")
 
         for m in side_a.alive_members + side_b.alive_members:
             m.tick_cooldowns()
 
-        turns.append(lines)
+        if log:
+            turns.append(lines)
+
+    return turns, hp_snapshots, turn_num, any_fled, bleed_kills, first_crit_side
+
+
+def _run_1v1(side_a, side_b, max_turns, log, rng):
+    """
+    _run_packs specialised for one fighter a side: no alive-list rebuilds,
+    member picks or extra attacks. Same draws, results and log text.
+    """
+    a, b = side_a.members[0], side_b.members[0]
+    turns = [] if log else None
+    hp_snapshots = [] if log else None
+
+    def record_hp():
+        snap = {"a_hp": max(0, a.hp), "a_max": a.max_hp, "b_hp": max(0, b.hp), "b_max": b.max_hp}
+        hp_snapshots.append(snap)
+        return snap
+
+    any_fled = False
+    bleed_kills = 0
+    first_crit_side = None
+    a_has_initiative = side_a.cw <= side_b.cw
+    turn_num = 0
+
+    while a.hp > 0 and not a.fled and b.hp > 0 and not b.fled and turn_num < max_turns:
+        turn_num += 1
+        lines = [f"⚔️ **Turn {turn_num}**"] if log else None
+
+        # Status effect ticks
+        bled_out = []
+        for m in (a, b):
+            if m.status_flags or m.defense_up:
+                tick_logs = m.tick_status_effects(log)
+                if tick_logs:
+                    lines.extend(tick_logs)
+                if m.hp <= 0:
+                    bled_out.append(m)
+        if bled_out:
+            bleed_kills += len(bled_out)
+            if log:
+                for m in bled_out:
+                    lines.append(f"  💀 {m.label} succumbs to their wounds!")
+                record_hp()
+                turns.append(lines)
+            break
+
+        # Flee checks
+        for m in (a, b):
+            if m.check_flee(rng):
+                any_fled = True
+                if log:
+                    lines.append(f"  🏃 {m.label} panics and **flees** the battle! ({m.hp}/{m.max_hp} HP)")
+        if a.fled or b.fled:
+            if log:
+                for side, m in ((side_a, a), (side_b, b)):
+                    if m.fled:
+                        lines.append(f"💨 {side.display_name}'s remaining fighters have fled or fallen!")
+                record_hp()
+                turns.append(lines)
+            break
+
+        # Speed-based initiative, then one attack each
+        a_first = a_has_initiative
+        if rng.random() < 0.15:
+            a_first = not a_first
+        order = ((a, b, "a"), (b, a, "b")) if a_first else ((b, a, "b"), (a, b, "a"))
+        for attacker, target, att_label in order:
+            if _resolve_attack(attacker, target, attacker.pick_ability(rng), lines, rng) \
+                    and first_crit_side is None:
+                first_crit_side = att_label
+            if target.hp <= 0:
+                break
+        if a.hp <= 0 or b.hp <= 0:
+            if log:
+                turns.append(lines)
+            break
+
+        # Turn summary
+        if log:
+            snap = record_hp()
+            lines.append(f"📊 {side_a.display_name}: {snap['a_hp']}/{a.max_hp} HP (1 alive) | "
+                         f"{side_b.display_name}: {snap['b_hp']}/{b.max_hp} HP (1 alive)")
+            turns.append(lines)
+
+        a.tick_cooldowns()
+        b.tick_cooldowns()
+
+    return turns, hp_snapshots, turn_num, any_fled, bleed_kills, first_crit_side
+
+
+def simulate_battle(dino_a_data, dino_b_data, pack_a=1, pack_b=1, max_turns=15, log=True, seed=None):
+    """
+    Turn-by-turn battle with individual pack members.
+    Tracks prop bet outcomes: flee, bleed kills, first crit, KO count.
+    With log=False no turn text or HP snapshots are built ("turns" and
+    "hp_snapshots" are None).
+    A `seed` gives the battle its own random.Random, making it reproducible.
+    """
+    rng = random.Random(seed) if seed is not None else random
+    side_a = BattleSide(dino_a_data, pack_size=pack_a)
+    side_b = BattleSide(dino_b_data, pack_size=pack_b)
+
+    side_a.apply_pack_bonuses()
+    side_b.apply_pack_bonuses()
+
+    if pack_a == 1 and pack_b == 1:
+        run = _run_1v1
+    else:
+        run = _run_packs
+    turns, hp_snapshots, turn_num, any_fled, bleed_kills, first_crit_side = run(side_a, side_b, max_turns, log, rng)
+    a_max = sum(m.max_hp for m in side_a.members)
+    b_max = sum(m.max_hp for m in side_b.members)
 
     # ── Winner ──
     if side_a.alive and not side_b.alive:
@@ -624,10 +889,13 @@ def simulate_battle(dino_a_data, dino_b_data, pack_a=1, pack_b=1, max_turns=15):
     elif side_b.alive and not side_a.alive:
         winner = "b"
     else:
-        a_pct = sum(m.hp for m in side_a.alive_members) / max(1, sum(m.max_hp for m in side_a.members))
-        b_pct = sum(m.hp for m in side_b.alive_members) / max(1, sum(m.max_hp for m in side_b.members))
+        a_pct = sum(m.hp for m in side_a.alive_members) / max(1, a_max)
+        b_pct = sum(m.hp for m in side_b.alive_members) / max(1, b_max)
         winner = "a" if a_pct >= b_pct else "b"
 
+    # KO'd members never recover, so every member at 0 HP is exactly one KO
+    total_kos = side_a.ko_count + side_b.ko_count
+
     w_side = side_a if winner == "a" else side_b
     l_side = side_b if winner == "a" else side_a
 
@@ -639,6 +907,7 @@ def simulate_battle(dino_a_data, dino_b_data, pack_a=1, pack_b=1, max_turns=15):
         "winner_name": w_side.display_name,
         "loser_name": l_side.display_name,
         "turns": turns,
+        "turn_count": turn_num,
         "hp_snapshots": hp_snapshots,
         # Prop bet outcomes
         "any_fled": any_fled,
@@ -649,7 +918,7 @@ def simulate_battle(dino_a_data, dino_b_data, pack_a=1, pack_b=1, max_turns=15):
         "fighter_a": {
             "name": side_a.display_name, "family": side_a.family,
             "hp": sum(max(0, m.hp) for m in side_a.members),
-            "max_hp": sum(m.max_hp for m in side_a.members),
+            "max_hp": a_max,
             "type": side_a.dtype, "cw": side_a.cw,
             "group_slots": get_group_slots(side_a.cw),
             "pack_size": side_a.pack_size,
@@ -660,7 +929,7 @@ def simulate_battle(dino_a_data, dino_b_data, pack_a=1, pack_b=1, max_turns=15):
         "fighter_b": {
             "name": side_b.display_name, "family": side_b.family,
             "hp": sum(max(0, m.hp) for m in side_b.members),
-            "max_hp": sum(m.max_hp for m in side_b.members),
+            "max_hp": b_max,
             "type": side_b.dtype, "cw": side_b.cw,
             "group_slots": get_group_slots(side_b.cw),
             "pack_size": side_b.pack_size,
@@ -671,3 +940,625 @@ def simulate_battle(dino_a_data, dino_b_data, pack_a=1, pack_b=1, max_turns=15):
     }
 
 
+# ── Batched Monte-Carlo Simulation ─────────────────────────────
+# Structure-of-arrays layout: fighters[side, fight, member], one field per stat.
+# Used for odds/balance estimation where only outcomes matter, not logs.
+# Bleeds are kept as a per-member ring of scheduled tick damage (slot = turn
+# % ring), so stacked bleeds add up exactly as in simulate_battle.
+def _fighter_dtype(n_abilities, ring):
+    return np.dtype([
+        ("hp", "i4"), ("max_hp", "i4"), ("cw", "f4"), ("atk", "f4"),
+        ("armor", "f4"), ("spd", "f4"), ("atk_bonus", "f4"), ("armor_bonus", "f4"),
+        ("cd", "i1", (n_abilities,)),
+        ("bleed", "i4", (ring,)), ("bone_r", "i1"),
+        ("def_r", "i1"), ("def_v", "f8"), ("def_st", "f8"),
+        ("fled", "?"),
+    ])
+
+
+def _pool_arrays(bases, cds, fxs):
+    """
+    Parallel ability arrays: base, cd, support flag, and every effect slot as
+    (n_abilities, n_effects) code/dur/value columns, padded with EFF_NONE.
+    """
+    width = max([1, *map(len, fxs)])
+    padded = [tuple(fx) + ((EFF_NONE, 0, 0.0),) * (width - len(fx)) for fx in fxs]
+    return {
+        "base": np.array(bases), "cd": np.array(cds, np.int8),
+        "eff": np.array([[e[0] for e in fx] for fx in padded], np.int8).reshape(len(fxs), width),
+        "dur": np.array([[e[1] for e in fx] for fx in padded], np.int8).reshape(len(fxs), width),
+        "val": np.array([[e[2] for e in fx] for fx in padded], np.float64).reshape(len(fxs), width),
+        "support": np.array([any(f[0] in (EFF_DEFENSE, EFF_HEAL) for f in fx) for fx in fxs], bool),
+    }
+
+
+@lru_cache(maxsize=None)
+def _family_pool_arrays(family, dtype):
+    """A family's ability table as parallel arrays, built once; 'base' holds the ATK scale."""
+    table = ABILITY_TABLE.get(family)
+    if table is None:
+        table = FALLBACK_ABILITY_TABLE["carnivore" if dtype == "carnivore" else "herbivore"]
+    return _pool_arrays([row[1] for row in table], [row[2] for row in table],
+                        [_compile_effects(row[3]) for row in table])
+
+
+def _ability_table(member):
+    """A PackMember's abilities as parallel arrays (plus a Struggle slot)."""
+    if member.data.get("custom_abilities"):
+        ab = member.abilities
+        pool = _pool_arrays([a.base for a in ab], [a.cd for a in ab], [a.fx for a in ab])
+    else:
+        pool = dict(_family_pool_arrays(member.family, member.dtype))
+        pool["base"] = member.base_atk * pool["base"]
+    struggle = {"base": max(5, int(member.base_atk * 0.3))}
+    tbl = {k: np.concatenate([v, np.full((1, *v.shape[1:]), struggle.get(k, 0), v.dtype)])
+           for k, v in pool.items()}
+    tbl["base"] = tbl["base"].astype(np.int32)
+    return tbl
+
+
+def _init_fighters(dinos, packs, n):
+    """
+    Build the (2, n, max pack) SoA fighter matrix and per-side ability tables.
+    Cooldown slots are padded to the larger table; the smaller pack is padded
+    with members that are never alive and never count as a KO.
+    """
+    members, tbls = [], []
+    for dino_data, pack in zip(dinos, packs):
+        side = BattleSide(dino_data, pack_size=pack)
+        side.apply_pack_bonuses()
+        members.append(side.members[0])
+        tbls.append(_ability_table(side.members[0]))
+    ring = max(int(t["dur"].max()) for t in tbls) + 3
+    f = np.zeros((2, n, max(packs)), dtype=_fighter_dtype(max(len(t["base"]) for t in tbls), ring))
+    for s, (member, pack) in enumerate(zip(members, packs)):
+        row = f[s, :, :pack]
+        row["hp"] = member.max_hp
+        row["max_hp"] = member.max_hp
+        f["cw"][s] = member.cw
+        f["atk"][s] = member.base_atk
+        f["armor"][s] = member.armor
+        f["spd"][s] = member.spd
+        f["atk_bonus"][s] = member.atk_bonus
+        f["armor_bonus"][s] = member.armor_bonus
+        pad = f[s, :, pack:]
+        pad["hp"] = 1
+        pad["fled"] = True
+    return f, tbls
+
+
+def _batch_alive(f):
+    return (f["hp"] > 0) & ~f["fled"]
+
+
+def _side_alive(f):
+    return _batch_alive(f).any(axis=-1)
+
+
+def _batch_pick_member(alive, u):
+    """Uniform pick among alive members per fight (`alive` is a (k, members) mask)."""
+    if alive.shape[1] == 1:
+        return np.zeros(len(alive), np.intp)
+    kth = (u * alive.sum(axis=1)).astype(np.intp)
+    return np.argmax(np.cumsum(alive, axis=1) > kth[:, None], axis=1)
+
+
+def _batch_pick_ability(f, tbl, idx, mem, u):
+    """Vectorized pick_ability for members `mem` of fights `idx` using uniform draws `u`."""
+    n_real = len(tbl["base"]) - 1
+    cd = f["cd"][idx, mem, :n_real]
+    avail = cd <= 0
+    none_ready = ~avail.any(axis=1)
+    avail[none_ready] = tbl["cd"][:n_real] == 0
+    weights = np.where(tbl["cd"][:n_real] > 0, 30, 10)[None, :].repeat(len(idx), axis=0)
+    low_hp = f["hp"][idx, mem] < f["max_hp"][idx, mem] * 0.3
+    weights = weights + 40 * (low_hp[:, None] & tbl["support"][None, :n_real])
+    weights = weights * avail
+    cum = np.cumsum(weights, axis=1)
+    r = u * cum[:, -1]
+    pick = np.argmax((cum >= r[:, None]) & avail, axis=1)
+    pick[~avail.any(axis=1)] = n_real  # Struggle
+    return pick
+
+
+def _batch_attack(att, dfn, tbl, idx, am, dm, u, crit_side, side_code, turn, extra=False):
+    """
+    One attack from member `am` of `att` onto member `dm` of `dfn` for every
+    fight in `idx` (PoT formula, vectorized). `u` holds the pick, dodge, zone,
+    crit and variance draws as rows 0-4. Extra pack attacks skip the effects
+    of non-damaging picks, as _resolve_attack(extra=True) does.
+    """
+    slot = _batch_pick_ability(att, tbl, idx, am, u[0])
+    att["cd"][idx, am, slot] = tbl["cd"][slot]
+
+    base = tbl["base"][slot].astype(np.float64)
+    hits = base > 0
+    dodge_p = np.where(dfn["bone_r"][idx, dm] > 0, 0.02, np.minimum(0.15, dfn["spd"][idx, dm] / 12000.0))
+    dodged = hits & (u[1] < dodge_p)
+    landed = hits & ~dodged
+
+    cw_ratio = att["cw"][idx, am] / np.maximum(1, dfn["cw"][idx, dm])
+    zmult = _ZONE_MULTS[np.minimum(np.searchsorted(_ZONE_CDF, u[2]), len(_ZONE_MULTS) - 1)]
+    crit = landed & (u[3] < 0.12)
+    armor_total = dfn["armor"][idx, dm] * (1.0 + dfn["armor_bonus"][idx, dm])
+    def_st = dfn["def_st"][idx, dm]
+    raw = (base * cw_ratio * zmult * np.where(crit, 1.5, 1.0)
+           * (1.0 - np.minimum(0.50, armor_total * 0.10))
+           * (1.0 - np.minimum(0.90, def_st))
+           * (1.0 + att["atk_bonus"][idx, am])
+           * (0.80 + 0.40 * u[4]))
+    dmg = np.where(landed, np.maximum(1, raw.astype(np.int64)), 0)
+    dfn["hp"][idx, dm] = np.maximum(0, dfn["hp"][idx, dm] - dmg)
+
+    new_crit = crit & (crit_side[idx] < 0)
+    crit_side[idx[new_crit]] = side_code
+
+    # Status effects (applied whether or not the hit landed, as in apply_effects), in slot order
+    for c in range(tbl["eff"].shape[1]):
+        eff = tbl["eff"][slot, c]
+        if extra:
+            eff = np.where(hits, eff, EFF_NONE)
+        _batch_effect(att, dfn, idx, am, dm, eff, tbl["dur"][slot, c].astype(np.int64),
+                      tbl["val"][slot, c], cw_ratio, turn)
+
+
+def _batch_effect(att, dfn, idx, am, dm, eff, dur, val, cw_ratio, turn):
+    """One effect column of _batch_attack: per-fight code `eff` with its `dur`/`val`."""
+    scaled = np.clip((dur * cw_ratio).astype(np.int64), 1, dur + 2)
+    m = eff == EFF_BLEED
+    if m.any():
+        j, q = idx[m], dm[m]
+        tick = np.maximum(1, (dfn["max_hp"][j, q] * val[m]).astype(np.int64))
+        ring = dfn["bleed"].shape[-1]
+        for k in range(1, ring):
+            sel = scaled[m] >= k
+            if not sel.any():
+                break
+            dfn["bleed"][j[sel], q[sel], (turn + k) % ring] += tick[sel]
+    m = eff == EFF_BONEBREAK
+    if m.any():
+        j, q = idx[m], dm[m]
+        dfn["bone_r"][j, q] = np.maximum(dfn["bone_r"][j, q], scaled[m])
+    m = eff == EFF_DEFENSE
+    if m.any():
+        j, p = idx[m], am[m]
+        att["def_r"][j, p] = np.maximum(att["def_r"][j, p], dur[m])
+        att["def_v"][j, p] = np.maximum(att["def_v"][j, p], val[m])
+    m = eff == EFF_HEAL
+    if m.any():
+        j, p = idx[m], am[m]
+        heal = np.maximum(1, (att["max_hp"][j, p] * val[m]).astype(np.int64))
+        att["hp"][j, p] = np.minimum(att["max_hp"][j, p], att["hp"][j, p] + heal)
+
+
+def _batch_main_attack(f, tbls, att, lane, main, rng, crit_side, turn):
+    """Main attack of side `att` in fights `lane`: random attacker onto random target."""
+    if len(lane) == 0:
+        return
+    u = rng.random((7, len(lane)))
+    am = _batch_pick_member(_batch_alive(f[att][lane]), u[5])
+    dm = _batch_pick_member(_batch_alive(f[1 - att][lane]), u[6])
+    main[att, lane] = am
+    _batch_attack(f[att], f[1 - att], tbls[att], lane, am, dm, u, crit_side, att, turn)
+
+
+def _batch_extra_attacks(f, tbls, e, lane, main, rng, crit_side, turn):
+    """Extra pack attacks of side `e` in fights `lane` (60% chance per non-main member)."""
+    if len(lane) == 0:
+        return
+    att, dfn = f[e], f[1 - e]
+    extras = _batch_alive(att[lane])
+    extras[np.arange(len(lane)), main[e, lane]] = False
+    for p in range(att.shape[1]):
+        sel = lane[extras[:, p]]
+        sel = sel[_side_alive(dfn[sel])]
+        sel = sel[rng.random(len(sel)) < 0.60]
+        if len(sel) == 0:
+            continue
+        u = rng.random((6, len(sel)))
+        dm = _batch_pick_member(_batch_alive(dfn[sel]), u[5])
+        _batch_attack(att, dfn, tbls[e], sel, np.full(len(sel), p), dm, u, crit_side, e, turn, extra=True)
+
+
+def _batch_tick(f, idx, turn):
+    """tick_status_effects for alive members of fights `idx`. Returns bleed deaths per fight."""
+    si, mi = np.nonzero(_batch_alive(f[idx]))
+    j = idx[si]
+    def_r = f["def_r"][j, mi]
+    f["def_st"][j, mi] = np.where(def_r > 0, f["def_v"][j, mi], 0.0)
+    f["def_r"][j, mi] = np.maximum(0, def_r - 1)
+    expired = def_r == 1
+    f["def_v"][j[expired], mi[expired]] = 0.0
+    f["bone_r"][j, mi] = np.maximum(0, f["bone_r"][j, mi] - 1)
+
+    slot = turn % f["bleed"].shape[-1]
+    hp_before = f["hp"][j, mi]
+    hp_after = np.maximum(0, hp_before - f["bleed"][j, mi, slot])
+    f["hp"][j, mi] = hp_after
+    f["bleed"][idx, :, slot] = 0
+    return np.bincount(si, weights=(hp_after <= 0) & (hp_before > 0), minlength=len(idx)).astype(np.int16)
+
+
+def _batch_flee(f, idx, u):
+    """
+    check_flee for alive members of both sides in fights `idx`, using draws
+    `u` shaped (2, len(idx), members). Returns mask of fights with a flee.
+    """
+    sub = f[:, idx]
+    alive = _batch_alive(sub)
+    hp_pct = sub["hp"] / np.maximum(1, sub["max_hp"])
+    chance = np.minimum(0.50, 0.10 + (0.25 - hp_pct) * 1.6)
+    flee = alive & (hp_pct <= 0.25) & (u < chance)
+    si, fi, mi = np.nonzero(flee)
+    f["fled"][si, idx[fi], mi] = True
+    return flee.any(axis=(0, 2))
+
+
+def _batch_tick_cooldowns(f, idx):
+    si, mi = np.nonzero(_batch_alive(f[idx]))
+    j = idx[si]
+    f["cd"][j, mi] = np.maximum(0, f["cd"][j, mi] - 1)
+
+
+# Scalar kernel pieces: per-fight arrays are (side, member[, slot])
+@_njit
+def _k_side_alive(hp, fled, s, n):
+    for p in range(n):
+        if hp[s, p] > 0 and not fled[s, p]:
+            return True
+    return False
+
+
+@_njit
+def _k_pick_member(hp, fled, s, n):
+    cnt = 0
+    for p in range(n):
+        if hp[s, p] > 0 and not fled[s, p]:
+            cnt += 1
+    k = int(np.random.random() * cnt)
+    for p in range(n):
+        if hp[s, p] > 0 and not fled[s, p]:
+            if k == 0:
+                return p
+            k -= 1
+    return 0
+
+
+@_njit
+def _tick_status_core(s, p, slot, hp, bleed, bone_r, def_r, def_v, def_st):
+    """tick_status_effects for one member in kernel arrays. Returns 1 if it bled out."""
+    def_st[s, p] = def_v[s, p] if def_r[s, p] > 0 else 0.0
+    if def_r[s, p] > 0:
+        def_r[s, p] -= 1
+        if def_r[s, p] == 0:
+            def_v[s, p] = 0.0
+    if bone_r[s, p] > 0:
+        bone_r[s, p] -= 1
+    if bleed[s, p, slot] > 0:
+        hp[s, p] = max(0, hp[s, p] - bleed[s, p, slot])
+        if hp[s, p] <= 0:
+            return 1
+    return 0
+
+
+@_njit
+def _k_attack(att, am, dm, t, hp, hp0, cw, armor, spd, atk_bonus, armor_bonus, n_real,
+              ab_base, ab_cd, ab_eff, ab_dur, ab_val, ab_support, cd, bleed, bone_r, def_r, def_v, def_st,
+              extra):
+    """One attack from (att, am) onto (1 - att, dm). Returns True on a crit.
+    Extra pack attacks skip the effects of non-damaging picks."""
+    dfn = 1 - att
+
+    # pick_ability
+    nr = n_real[att]
+    low_hp = hp[att, am] < hp0[att] * 0.3
+    any_ready = False
+    for j in range(nr):
+        if cd[att, am, j] <= 0:
+            any_ready = True
+    total = 0.0
+    for j in range(nr):
+        if (cd[att, am, j] <= 0) if any_ready else (ab_cd[att, j] == 0):
+            w = 30.0 if ab_cd[att, j] > 0 else 10.0
+            if ab_support[att, j] and low_hp:
+                w += 40.0
+            total += w
+    slot = nr
+    if total > 0:
+        r = np.random.random() * total
+        for j in range(nr):
+            if (cd[att, am, j] <= 0) if any_ready else (ab_cd[att, j] == 0):
+                w = 30.0 if ab_cd[att, j] > 0 else 10.0
+                if ab_support[att, j] and low_hp:
+                    w += 40.0
+                r -= w
+                if r < 0:
+                    slot = j
+                    break
+        if slot == nr:
+            slot = nr - 1
+    cd[att, am, slot] = ab_cd[att, slot]
+
+    # Damage
+    cw_ratio = cw[att] / max(1.0, cw[dfn])
+    is_crit = False
+    base = ab_base[att, slot]
+    if base > 0:
+        dmg, _zi, is_crit, _dodged = _calc_damage_core(
+            float(base), cw[att], cw[dfn], spd[dfn], bone_r[dfn, dm] > 0,
+            1.0 - min(0.50, armor[dfn] * (1.0 + armor_bonus[dfn]) * 0.10),
+            def_st[dfn, dm], 1.0 + atk_bonus[att],
+            np.random.random(), np.random.random(), np.random.random(), np.random.random())
+        hp[dfn, dm] = max(0, hp[dfn, dm] - dmg)
+    elif extra:
+        return is_crit
+
+    # Status effects, in slot order
+    for c in range(ab_eff.shape[2]):
+        eff = ab_eff[att, slot, c]
+        dur = ab_dur[att, slot, c]
+        val = ab_val[att, slot, c]
+        scaled = max(1, min(dur + 2, int(dur * cw_ratio)))
+        if eff == EFF_BLEED:
+            ring = bleed.shape[2]
+            tick = max(1, int(hp0[dfn] * val))
+            for k in range(1, scaled + 1):
+                bleed[dfn, dm, (t + k) % ring] += tick
+        elif eff == EFF_BONEBREAK:
+            bone_r[dfn, dm] = max(bone_r[dfn, dm], scaled)
+        elif eff == EFF_DEFENSE:
+            def_r[att, am] = max(def_r[att, am], dur)
+            def_v[att, am] = max(def_v[att, am], val)
+        elif eff == EFF_HEAL:
+            hp[att, am] = min(hp0[att], hp[att, am] + max(1, int(hp0[att] * val)))
+    return is_crit
+
+
+@_njit_parallel
+def _batch_kernel(hp0, cw, armor, spd, atk_bonus, armor_bonus, pack, n_real,
+                  ab_base, ab_cd, ab_eff, ab_dur, ab_val, ab_support, ring, max_turns, seed,
+                  a_wins, any_fled, bleed_kills, crit_side, total_kos, turns):
+    """
+    Whole-battle loop for one fight per iteration, written for numba.njit.
+    Side-indexed inputs are (2,) / (2, n_abilities) arrays, with effect code/dur/value
+    as (2, n_abilities, n_effects); Struggle sits at n_real[s].
+    Same mechanics as the vectorized NumPy path.
+    With seed >= 0 each fight reseeds its thread's RNG with seed + i, so
+    results do not depend on how prange splits the work.
+    """
+    n_ab = ab_base.shape[1]
+    n_mem = max(pack[0], pack[1])
+    for i in _prange(a_wins.shape[0]):
+        if seed >= 0:
+            np.random.seed(seed + i)
+        hp = np.zeros((2, n_mem), np.int64)
+        for s in range(2):
+            for p in range(pack[s]):
+                hp[s, p] = hp0[s]
+        fled = np.zeros((2, n_mem), np.bool_)
+        cd = np.zeros((2, n_mem, n_ab), np.int64)
+        bleed = np.zeros((2, n_mem, ring), np.int64)
+        bone_r = np.zeros((2, n_mem), np.int64)
+        def_r = np.zeros((2, n_mem), np.int64)
+        def_v = np.zeros((2, n_mem))
+        def_st = np.zeros((2, n_mem))
+        main = np.zeros(2, np.int64)
+        extras = np.zeros(n_mem, np.bool_)
+        crit = -1
+        bk = 0
+        fled_any = False
+        t = 0
+        while t < max_turns:
+            t += 1
+
+            # Status tick
+            slot = t % ring
+            for s in range(2):
+                for p in range(pack[s]):
+                    if hp[s, p] > 0 and not fled[s, p]:
+                        bk += _tick_status_core(s, p, slot, hp, bleed, bone_r, def_r, def_v, def_st)
+                    bleed[s, p, slot] = 0
+            if not _k_side_alive(hp, fled, 0, pack[0]) or not _k_side_alive(hp, fled, 1, pack[1]):
+                break
+
+            # Flee checks
+            for s in range(2):
+                for p in range(pack[s]):
+                    if hp[s, p] > 0 and not fled[s, p]:
+                        pct = hp[s, p] / max(1, hp0[s])
+                        if pct <= 0.25 and np.random.random() < min(0.50, 0.10 + (0.25 - pct) * 1.6):
+                            fled[s, p] = True
+                            fled_any = True
+            if not _k_side_alive(hp, fled, 0, pack[0]) or not _k_side_alive(hp, fled, 1, pack[1]):
+                break
+
+            # Initiative, then one main attack per side
+            first = 0 if cw[0] <= cw[1] else 1
+            if np.random.random() < 0.15:
+                first = 1 - first
+            ended = False
+            for k in range(2):
+                att = first if k == 0 else 1 - first
+                dfn = 1 - att
+                am = _k_pick_member(hp, fled, att, pack[att])
+                dm = _k_pick_member(hp, fled, dfn, pack[dfn])
+                main[att] = am
+                if _k_attack(att, am, dm, t, hp, hp0, cw, armor, spd, atk_bonus, armor_bonus, n_real,
+                             ab_base, ab_cd, ab_eff, ab_dur, ab_val, ab_support,
+                             cd, bleed, bone_r, def_r, def_v, def_st, False) and crit < 0:
+                    crit = att
+                if not _k_side_alive(hp, fled, dfn, pack[dfn]):
+                    ended = True
+                    break
+            if ended:
+                break
+
+            # Extra pack attacks
+            for k in range(2):
+                e = first if k == 0 else 1 - first
+                tgt = 1 - e
+                for p in range(pack[e]):
+                    extras[p] = hp[e, p] > 0 and not fled[e, p] and p != main[e]
+                for p in range(pack[e]):
+                    if not extras[p]:
+                        continue
+                    if not _k_side_alive(hp, fled, tgt, pack[tgt]):
+                        break
+                    if np.random.random() < 0.60:
+                        dm = _k_pick_member(hp, fled, tgt, pack[tgt])
+                        if _k_attack(e, p, dm, t, hp, hp0, cw, armor, spd, atk_bonus, armor_bonus, n_real,
+                                     ab_base, ab_cd, ab_eff, ab_dur, ab_val, ab_support,
+                                     cd, bleed, bone_r, def_r, def_v, def_st, True) and crit < 0:
+                            crit = e
+            if not _k_side_alive(hp, fled, 0, pack[0]) or not _k_side_alive(hp, fled, 1, pack[1]):
+                break
+
+            for s in range(2):
+                for p in range(pack[s]):
+                    if hp[s, p] > 0 and not fled[s, p]:
+                        for j in range(n_ab):
+                            if cd[s, p, j] > 0:
+                                cd[s, p, j] -= 1
+
+        left = np.zeros(2)
+        kos = 0
+        for s in range(2):
+            for p in range(pack[s]):
+                if hp[s, p] > 0 and not fled[s, p]:
+                    left[s] += hp[s, p]
+                if hp[s, p] <= 0:
+                    kos += 1
+        a_alive = left[0] > 0
+        b_alive = left[1] > 0
+        if a_alive != b_alive:
+            a_wins[i] = a_alive
+        else:
+            a_wins[i] = left[0] / max(1, hp0[0] * pack[0]) >= left[1] / max(1, hp0[1] * pack[1])
+        any_fled[i] = fled_any
+        bleed_kills[i] = bk
+        crit_side[i] = crit
+        total_kos[i] = kos
+        turns[i] = t
+
+
+_batch_kernel_jit = _batch_kernel if numba is not None else None
+
+
+def _simulate_batch_jit(f, tbls, packs, n_sims, max_turns, seed):
+    """Pack per-side stats and ability tables into (2, ...) arrays and run the compiled kernel."""
+    ab = {}
+    for k in tbls[0]:
+        shape = np.max([t[k].shape for t in tbls], axis=0)  # abilities, then effect slots
+        ab[k] = np.zeros((2, *shape), tbls[0][k].dtype)
+        for s, tbl in enumerate(tbls):
+            ab[k][(s, *map(slice, tbl[k].shape))] = tbl[k]
+
+    def side(field):
+        return f[field][:, 0, 0].astype(np.float64)
+
+    out = {
+        "a_wins": np.zeros(n_sims, bool),
+        "any_fled": np.zeros(n_sims, bool),
+        "bleed_kills": np.zeros(n_sims, np.int16),
+        "first_crit_side": np.full(n_sims, -1, np.int8),
+        "total_kos": np.zeros(n_sims, np.int8),
+        "turns": np.zeros(n_sims, np.int16),
+    }
+    _batch_kernel_jit(
+        f["max_hp"][:, 0, 0].astype(np.int64), side("cw"), side("armor"),
+        side("spd"), side("atk_bonus"), side("armor_bonus"),
+        np.array(packs, np.int64), np.array([len(t["base"]) - 1 for t in tbls], np.int64),
+        ab["base"], ab["cd"], ab["eff"], ab["dur"], ab["val"], ab["support"],
+        f["bleed"].shape[-1], max_turns, -1 if seed is None else seed,
+        out["a_wins"], out["any_fled"], out["bleed_kills"], out["first_crit_side"],
+        out["total_kos"], out["turns"])
+    return out
+
+
+def simulate_batch(dino_a_data, dino_b_data, pack_a=1, pack_b=1, n_sims=1000, max_turns=15, seed=None,
+                   jit=True):
+    """
+    Run `n_sims` independent battles at once using NumPy SoA buffers.
+    Mirrors simulate_battle's mechanics (packs included) without building
+    any log text.
+
+    When numba is installed the fights run in a parallel compiled kernel;
+    jit=False forces the NumPy path. A `seed` makes either path
+    reproducible (the two paths draw differently).
+
+    Returns a dict of per-fight arrays: a_wins, any_fled, bleed_kills,
+    first_crit_side (-1 none, 0 a, 1 b), total_kos, turns.
+    """
+    f, tbls = _init_fighters((dino_a_data, dino_b_data), (pack_a, pack_b), n_sims)
+    if jit and _batch_kernel_jit is not None:
+        return _simulate_batch_jit(f, tbls, (pack_a, pack_b), n_sims, max_turns, seed)
+
+    rng = np.random.default_rng(seed)
+
+    any_fled = np.zeros(n_sims, bool)
+    bleed_kills = np.zeros(n_sims, np.int16)
+    crit_side = np.full(n_sims, -1, np.int8)
+    turns = np.zeros(n_sims, np.int16)
+    active = np.ones(n_sims, bool)
+    first = np.zeros(n_sims, np.int8)
+    main = np.zeros((2, n_sims), np.intp)
+    a_goes_first = f["cw"][0, :, 0] <= f["cw"][1, :, 0]
+    n_mem = f.shape[2]
+
+    def both_alive(idx):
+        return idx[_side_alive(f[0][idx]) & _side_alive(f[1][idx])]
+
+    for turn in range(1, max_turns + 1):
+        idx = np.flatnonzero(active)
+        if len(idx) == 0:
+            break
+        turns[idx] += 1
+
+        bleed_kills[idx] += _batch_tick(f[0], idx, turn) + _batch_tick(f[1], idx, turn)
+        idx = both_alive(idx)
+
+        # One block of draws for the turn's flee checks (every member of both
+        # sides) and initiative swaps
+        u = rng.random((2, n_mem + 1, len(idx)))
+        any_fled[idx] |= _batch_flee(f, idx, u[:, :n_mem].transpose(0, 2, 1))
+        keep = _side_alive(f[0][idx]) & _side_alive(f[1][idx])
+        idx = idx[keep]
+
+        # lanes[s]: fights where side s has initiative this turn
+        a_first = a_goes_first[idx] ^ (u[0, n_mem, keep] < 0.15)
+        first[idx] = ~a_first
+        lanes = [idx[a_first], idx[~a_first]]
+        for k in range(2):
+            for s in (0, 1):
+                att = s if k == 0 else 1 - s
+                _batch_main_attack(f, tbls, att, lanes[s], main, rng, crit_side, turn)
+            if k == 0:
+                lanes = [lane[_side_alive(f[1 - s][lane])] for s, lane in enumerate(lanes)]
+        idx = both_alive(idx)
+
+        if n_mem > 1:
+            for k in range(2):
+                for s in (0, 1):
+                    e = s if k == 0 else 1 - s
+                    _batch_extra_attacks(f, tbls, e, idx[first[idx] == s], main, rng, crit_side, turn)
+            idx = both_alive(idx)
+
+        _batch_tick_cooldowns(f[0], idx)
+        _batch_tick_cooldowns(f[1], idx)
+        active[:] = False
+        active[idx] = True
+
+    alive = _batch_alive(f)
+    side_alive = alive.any(axis=2)
+    left = np.where(alive, f["hp"], 0).sum(axis=2)
+    pct = left / np.maximum(1, f["max_hp"].sum(axis=2))
+    a_wins = np.where(side_alive[0] != side_alive[1], side_alive[0], pct[0] >= pct[1])
+
+    return {
+        "a_wins": a_wins,
+        "any_fled": any_fled,
+        "bleed_kills": bleed_kills,
+        "first_crit_side": crit_side,
+        "total_kos": (f["hp"] <= 0).sum(axis=(0, 2)).astype(np.int8),
+        "turns": turns,
+    }
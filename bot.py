@@ -1,23 +1,50 @@
 import asyncio
-import builtins
+import heapq
 import io
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache, wraps
+from operator import itemgetter
 import pytz
 import discord
 from discord.ext import commands, tasks
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 import dashboard
 
-# ── Intercept print() for dashboard live logs ────────────────────
-_original_print = builtins.print
-def _captured_print(*args, **kwargs):
-    _original_print(*args, **kwargs)
-    msg = " ".join(str(a) for a in args)
-    dashboard.add_log(msg)
-builtins.print = _captured_print
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ── Mirror stdout into the dashboard live logs ──────────────────
+class _DashboardTee:
+    """stdout wrapper: writes pass straight through, complete lines are copied to the dashboard."""
+    def __init__(self, stream):
+        self._stream = stream
+        self._partial = ""
+
+    def write(self, s):
+        n = self._stream.write(s)
+        if "\n" not in s:
+            self._partial += s
+            return n
+        *lines, self._partial = (self._partial + s).split("\n")
+        for line in lines:
+            dashboard.add_log(line)
+        return n
+
+    def flush(self):
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+if not isinstance(sys.stdout, _DashboardTee):
+    sys.stdout = _DashboardTee(sys.stdout)
 
 # ----------------------------
 # Fix asyncio for Python 3.14+
@@ -55,6 +82,28 @@ SESSION_TYPES = {
     'migration': {'emoji': '🏃', 'color': 0x3498db, 'label': 'Migration Run'},
 }
 
+# (attend button, not-attending button) as (label, emoji) per non-nesting session type
+SESSION_BUTTON_CFG = {
+    'hunt':      (("Join Hunt", "🦴"), ("Can't Make It", "😞")),
+    'growth':    (("Join Growth", "🌱"), ("Skipping", "😞")),
+    'pvp':       (("Join Battle", "⚔️"), ("Retreating", "😞")),
+    'migration': (("Join Herd", "🏃"), ("Staying Behind", "😞")),
+}
+
+# Weekday names accepted by !addday / !removeday -> datetime.weekday() index
+DAY_MAP = {"monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
+           "friday": 4, "saturday": 5, "sunday": 6}
+DAY_NAMES = ", ".join(DAY_MAP)
+
+session_type = 'hunt'
+_active_stype = SESSION_TYPES['hunt']  # SESSION_TYPES entry for session_type
+
+def set_session_type(t):
+    """Assign session_type and the matching SESSION_TYPES entry (unknown types render as hunt)."""
+    global session_type, _active_stype
+    session_type = t
+    _active_stype = SESSION_TYPES.get(t, SESSION_TYPES['hunt'])
+
 ALLOWED_GUILDS = [1370907857830746194, 1370907957830746194, 1475253514111291594]
 SCHEDULE_CHANNEL_ID = 1370911001247223859
 DEFAULT_ARCHIVE_CHANNEL_ID = 1448185222842683456  # attendance-tracker channel
@@ -66,9 +115,125 @@ os.makedirs(DATA_DIR, exist_ok=True)
 STATE_FILE = os.path.join(DATA_DIR, "state.json")
 HISTORY_FILE = os.path.join(DATA_DIR, "history.json")
 
+# ----------------------------
+# JSON file I/O (orjson when installed, stdlib json otherwise)
+# ----------------------------
+def read_json(path):
+    if orjson:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def dump_json(data):
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+def _atomic_write(path, payload, fsync=True):
+    """Write bytes to a temp file and swap it in, so readers never see a torn file.
+    With fsync the data is on disk before the rename; only do that off the event loop."""
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+def write_json(path, data):
+    """Blocking write for the dino files, which are saved on the event loop right after a load.
+    Skips the fsync so a battle or dashboard save never waits on a disk sync."""
+    _atomic_write(path, dump_json(data), fsync=False)
+
+# Background writes: serialize on the event loop, write on a worker thread.
+# Only the newest payload per file is kept, so bursts collapse into one write.
+_save_pending = {}      # path -> latest serialized payload
+_save_tasks = {}        # path -> in-flight writer task
+
+async def _flush_json_async(path):
+    while path in _save_pending:
+        payload = _save_pending.pop(path)
+        try:
+            await asyncio.to_thread(_atomic_write, path, payload)
+        except Exception as e:
+            print(f"❌ Error writing {os.path.basename(path)}: {e}")
+    _save_tasks.pop(path, None)
+
+def write_json_background(path, data):
+    """Serialize now, write off the event loop. Falls back to a blocking write outside a loop."""
+    payload = dump_json(data)
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _atomic_write(path, payload)
+        return
+    _save_pending[path] = payload
+    if path not in _save_tasks:
+        _save_tasks[path] = loop.create_task(_flush_json_async(path))
+
+# Every state mutation is followed by a save request, so saves double as the
+# invalidation signal for anything cached off the session state (see build_embed).
+_state_version = 0
+
+def bump_state_version():
+    global _state_version
+    _state_version += 1
+
+# Debounced saves: button spam schedules one write per window instead of one per click.
+SAVE_DEBOUNCE_SECONDS = 0.5
+_save_handles = {}      # save fn -> asyncio.TimerHandle
+
+def _request_save(fn):
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        fn()
+        return
+    if fn in _save_handles:
+        return
+    def _fire():
+        _save_handles.pop(fn, None)
+        fn()
+    _save_handles[fn] = loop.call_later(SAVE_DEBOUNCE_SECONDS, _fire)
+
+def request_save_state():
+    bump_state_version()
+    _request_save(save_state)
+
+def request_save_history():
+    bump_history_version()
+    _request_save(save_history)
+
+async def flush_saves():
+    """Run any debounced saves now and wait until every file has hit disk."""
+    for fn, handle in list(_save_handles.items()):
+        handle.cancel()
+        fn()
+    _save_handles.clear()
+    tasks = list(_save_tasks.values())
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+
 # ----------------------------
 # Admin check
 # ----------------------------
+# Lowercased role-name sets; call _refresh_role_caches() after changing the name lists
+_admin_role_names_lc = frozenset()
+_beta_role_names_lc = frozenset()
+
+def _refresh_role_caches():
+    global _admin_role_names_lc, _beta_role_names_lc
+    _admin_role_names_lc = frozenset(r.lower() for r in admin_role_names)
+    _beta_role_names_lc = frozenset(r.lower() for r in beta_role_names)
+
 def is_admin(user):
     """True if user is the hardcoded admin, has a configured admin role, or has server admin perms."""
     if user.id == ADMIN_ID:
@@ -78,7 +243,7 @@ def is_admin(user):
         for role in user.roles:
             if role.permissions.administrator:
                 return True
-            if role.name.lower() in [r.lower() for r in admin_role_names]:
+            if role.name.lower() in _admin_role_names_lc:
                 return True
     return False
 
@@ -88,7 +253,7 @@ def has_beta_role(user):
         return True  # admins can always schedule
     if hasattr(user, 'roles'):
         for role in user.roles:
-            if role.name.lower() in [r.lower() for r in beta_role_names]:
+            if role.name.lower() in _beta_role_names_lc:
                 return True
     return False
 
@@ -99,6 +264,24 @@ async def check_admin(ctx):
     await ctx.send("❌ Admin only.", delete_after=5)
     return False
 
+# Parsed session datetime, keyed on the string it came from so any reassignment
+# of session_dt_str is picked up without explicit invalidation.
+_session_dt_cache = None   # (session_dt_str, datetime, unix_ts)
+
+def _session_dt_entry():
+    global _session_dt_cache
+    if _session_dt_cache is None or _session_dt_cache[0] != session_dt_str:
+        dt = datetime.fromisoformat(session_dt_str)
+        _session_dt_cache = (session_dt_str, dt, int(dt.timestamp()))
+    return _session_dt_cache
+
+def get_session_dt():
+    """Parsed session_dt_str (raises like fromisoformat if unset or malformed)."""
+    return _session_dt_entry()[1]
+
+def get_session_unix_ts():
+    return _session_dt_entry()[2]
+
 def session_has_started():
     """Returns True if the session datetime has passed and session has NOT ended."""
     if session_ended:
@@ -106,10 +289,10 @@ def session_has_started():
     if not session_dt_str:
         return False
     try:
-        session_dt = datetime.fromisoformat(session_dt_str)
+        session_dt = get_session_dt()
         now = datetime.now(session_dt.tzinfo or EST)
         return now >= session_dt
-    except:
+    except (ValueError, TypeError):
         return False
 
 def session_is_active():
@@ -128,47 +311,47 @@ def load_state():
     global admin_role_names, beta_role_names, archive_channel_id, session_ended
     global status_channel_id, status_start_msg, status_stop_msg
     global battle_channel_id
-    global session_type, nest_parent_ids, nest_baby_ids, nest_protector_ids
+    global nest_parent_ids, nest_baby_ids, nest_protector_ids
 
     try:
         if os.path.exists(STATE_FILE):
-            with open(STATE_FILE, 'r') as f:
-                data = json.load(f)
-                attending_ids = data.get('attending_ids', [])
-                standby_ids = data.get('standby_ids', [])
-                not_attending_ids = data.get('not_attending_ids', [])
-                pending_offer_id = data.get('pending_offer_id')
-                event_message_id = data.get('event_message_id')
-                event_channel_id = data.get('event_channel_id')
-                session_name = data.get('session_name', 'Session')
-                session_dt_str = data.get('session_dt')
-                last_posted_session = data.get('last_posted_session')
-                MAX_ATTENDING = data.get('max_attending', DEFAULT_MAX_ATTENDING)
-                session_days = data.get('session_days', [
-                    {"weekday": 0, "hour": 20, "name": "Monday", "post_hours_before": 12},
-                    {"weekday": 1, "hour": 20, "name": "Tuesday", "post_hours_before": 20},
-                    {"weekday": 2, "hour": 20, "name": "Wednesday", "post_hours_before": 20},
-                ])
-                reminder_sent = data.get('reminder_sent', False)
-                checkin_active = data.get('checkin_active', False)
-                checked_in_ids = data.get('checked_in_ids', [])
-                checkin_message_id = data.get('checkin_message_id')
-                NOSHOW_THRESHOLD = data.get('noshow_threshold', DEFAULT_NOSHOW_THRESHOLD)
-                CHECKIN_GRACE_MINUTES = data.get('checkin_grace_minutes', DEFAULT_CHECKIN_GRACE)
-                admin_role_names = data.get('admin_role_names', ['Admin'])
-                beta_role_names = data.get('beta_role_names', ['Beta', 'Lead Beta'])
-                archive_channel_id = data.get('archive_channel_id', DEFAULT_ARCHIVE_CHANNEL_ID)
-                session_ended = data.get('session_ended', False)
-                status_channel_id = data.get('status_channel_id', None)
-                battle_channel_id = data.get('battle_channel_id', None)
-                status_start_msg = data.get('status_start_msg', '🟢 **{name}** is now LIVE! Join us!')
-                status_stop_msg = data.get('status_stop_msg', '🔴 **{name}** has ended. See you next time!')
-                session_type = data.get('session_type', 'hunt')
-                nest_parent_ids = data.get('nest_parent_ids', [])
-                nest_baby_ids = data.get('nest_baby_ids', [])
-                nest_protector_ids = data.get('nest_protector_ids', [])
-                print(f"✅ Loaded state from {STATE_FILE}")
-                return True
+            data = read_json(STATE_FILE)
+            attending_ids = data.get('attending_ids', [])
+            standby_ids = data.get('standby_ids', [])
+            not_attending_ids = data.get('not_attending_ids', [])
+            pending_offer_id = data.get('pending_offer_id')
+            event_message_id = data.get('event_message_id')
+            event_channel_id = data.get('event_channel_id')
+            session_name = data.get('session_name', 'Session')
+            session_dt_str = data.get('session_dt')
+            last_posted_session = data.get('last_posted_session')
+            MAX_ATTENDING = data.get('max_attending', DEFAULT_MAX_ATTENDING)
+            session_days = data.get('session_days', [
+                {"weekday": 0, "hour": 20, "name": "Monday", "post_hours_before": 12},
+                {"weekday": 1, "hour": 20, "name": "Tuesday", "post_hours_before": 20},
+                {"weekday": 2, "hour": 20, "name": "Wednesday", "post_hours_before": 20},
+            ])
+            reminder_sent = data.get('reminder_sent', False)
+            checkin_active = data.get('checkin_active', False)
+            checked_in_ids = data.get('checked_in_ids', [])
+            checkin_message_id = data.get('checkin_message_id')
+            NOSHOW_THRESHOLD = data.get('noshow_threshold', DEFAULT_NOSHOW_THRESHOLD)
+            CHECKIN_GRACE_MINUTES = data.get('checkin_grace_minutes', DEFAULT_CHECKIN_GRACE)
+            admin_role_names = data.get('admin_role_names', ['Admin'])
+            beta_role_names = data.get('beta_role_names', ['Beta', 'Lead Beta'])
+            archive_channel_id = data.get('archive_channel_id', DEFAULT_ARCHIVE_CHANNEL_ID)
+            session_ended = data.get('session_ended', False)
+            status_channel_id = data.get('status_channel_id', None)
+            battle_channel_id = data.get('battle_channel_id', None)
+            status_start_msg = data.get('status_start_msg', '🟢 **{name}** is now LIVE! Join us!')
+            status_stop_msg = data.get('status_stop_msg', '🔴 **{name}** has ended. See you next time!')
+            set_session_type(data.get('session_type', 'hunt'))
+            nest_parent_ids = set(data.get('nest_parent_ids', []))
+            nest_baby_ids = set(data.get('nest_baby_ids', []))
+            nest_protector_ids = set(data.get('nest_protector_ids', []))
+            _refresh_role_caches()
+            print(f"✅ Loaded state from {STATE_FILE}")
+            return True
     except Exception as e:
         print(f"❌ Error loading state: {e}")
 
@@ -202,14 +385,15 @@ def load_state():
     battle_channel_id = None
     status_start_msg = '🟢 **{name}** is now LIVE! Join us!'
     status_stop_msg = '🔴 **{name}** has ended. See you next time!'
-    session_type = 'hunt'
-    nest_parent_ids = []
-    nest_baby_ids = []
-    nest_protector_ids = []
+    set_session_type('hunt')
+    nest_parent_ids = set()
+    nest_baby_ids = set()
+    nest_protector_ids = set()
+    _refresh_role_caches()
     return False
 
-def save_state():
-    data = {
+def _serialize_state():
+    return {
         'attending_ids': attending_ids,
         'standby_ids': standby_ids,
         'not_attending_ids': not_attending_ids,
@@ -236,13 +420,15 @@ def save_state():
         'status_start_msg': status_start_msg,
         'status_stop_msg': status_stop_msg,
         'session_type': session_type,
-        'nest_parent_ids': nest_parent_ids,
-        'nest_baby_ids': nest_baby_ids,
-        'nest_protector_ids': nest_protector_ids,
+        'nest_parent_ids': list(nest_parent_ids),
+        'nest_baby_ids': list(nest_baby_ids),
+        'nest_protector_ids': list(nest_protector_ids),
     }
+
+def save_state():
+    bump_state_version()
     try:
-        with open(STATE_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+        write_json_background(STATE_FILE, _serialize_state())
     except Exception as e:
         print(f"❌ Error saving state: {e}")
 
@@ -251,13 +437,18 @@ def save_state():
 # ----------------------------
 # Format: {user_id_str: {"attended": N, "no_shows": N, "total_signups": N, "streak": N, "best_streak": N}}
 attendance_history = {}
+_history_version = 0  # bumped on every history write; keys caches derived from attendance_history
+
+def bump_history_version():
+    global _history_version
+    _history_version += 1
+    bump_state_version()
 
 def load_history():
     global attendance_history
     try:
         if os.path.exists(HISTORY_FILE):
-            with open(HISTORY_FILE, 'r') as f:
-                attendance_history = json.load(f)
+            attendance_history = read_json(HISTORY_FILE)
             print(f"✅ Loaded history ({len(attendance_history)} users)")
             return
     except Exception as e:
@@ -265,9 +456,9 @@ def load_history():
     attendance_history = {}
 
 def save_history():
+    bump_history_version()
     try:
-        with open(HISTORY_FILE, 'w') as f:
-            json.dump(attendance_history, f, indent=2)
+        write_json_background(HISTORY_FILE, attendance_history)
     except Exception as e:
         print(f"❌ Error saving history: {e}")
 
@@ -288,14 +479,14 @@ def record_attendance(user_id):
     stats["streak"] += 1
     if stats["streak"] > stats["best_streak"]:
         stats["best_streak"] = stats["streak"]
-    save_history()
+    request_save_history()
 
 def record_no_show(user_id):
     stats = get_user_stats(user_id)
     stats["no_shows"] += 1
     stats["total_signups"] += 1
     stats["streak"] = 0  # reset streak
-    save_history()
+    request_save_history()
 
 def is_auto_standby(user_id):
     """Rate-based: auto-standby if no-show rate >= 60% with at least 3 signups"""
@@ -317,16 +508,70 @@ def streak_badge(user_id):
         return f" ⚡{s}"
     return ""
 
+def _precompute_badges(users):
+    """{user id: streak badge} for one render, so each user is looked up once."""
+    return {u.id: streak_badge(u.id) for u in users}
+
+def attendance_rows():
+    """(uid_str, attended, total, rate, streak, no_shows) for every user with signups."""
+    for uid_str, data in attendance_history.items():
+        total = data.get("total_signups", 0)
+        if total == 0:
+            continue
+        attended = data.get("attended", 0)
+        yield (uid_str, attended, total, (attended / total) * 100,
+               data.get("streak", 0), data.get("no_shows", 0))
+
+def nesting_rows():
+    """(uid_str, parents, babies, protectors, total) for every user with nesting roles."""
+    for uid_str, data in attendance_history.items():
+        parents = data.get("nest_parent_count", 0)
+        babies = data.get("nest_baby_count", 0)
+        protectors = data.get("nest_protector_count", 0)
+        total = parents + babies + protectors
+        if total == 0:
+            continue
+        yield (uid_str, parents, babies, protectors, total)
+
+# C-level sort keys for the row tuples above (no Python lambda call per row)
+BY_RATE = itemgetter(3)                   # attendance_rows: rate
+BY_NEST_TOTAL = itemgetter(4)             # nesting_rows: total roles
+BY_NEST_TOTAL_PARENTS = itemgetter(4, 1)  # nesting_rows: total, then parents as tie-breaker
+
+def member_display_name(guild, uid_str):
+    try:
+        member = guild.get_member(int(uid_str))
+        return member.display_name if member else f"User {uid_str}"
+    except (ValueError, TypeError, AttributeError):
+        return f"User {uid_str}"
+
+# ----------------------------
+# Channel lookup (gateway cache first, REST fetch once per channel)
+# ----------------------------
+_channel_cache = {}   # channel id -> channel object
+
+async def resolve_channel(chan_id):
+    """Channel for chan_id, or None if unset. Fetched over REST at most once per id."""
+    if not chan_id:
+        return None
+    channel = _channel_cache.get(chan_id)
+    if channel is None:
+        channel = bot.get_channel(chan_id) or await bot.fetch_channel(chan_id)
+        _channel_cache[chan_id] = channel
+    return channel
+
 # ----------------------------
 # Session Archiving
 # ----------------------------
 async def archive_session():
     """Archives the current session's attendance data to the archive channel."""
-    if not session_name or not attending_ids and not standby_ids and not not_attending_ids:
+    if not session_name:
+        return
+    if not (attending_ids or standby_ids or not_attending_ids):
         return  # nothing to archive
 
     try:
-        channel = await bot.fetch_channel(archive_channel_id)
+        channel = await resolve_channel(archive_channel_id)
         if not channel:
             print("❌ Archive channel not found")
             return
@@ -345,18 +590,18 @@ async def archive_session():
         # Session time info
         if session_dt_str:
             try:
-                dt = datetime.fromisoformat(session_dt_str)
-                unix_ts = int(dt.timestamp())
+                unix_ts = get_session_unix_ts()
                 embed.add_field(name="🕐 Session Time", value=f"<t:{unix_ts}:f>", inline=True)
-            except:
+            except (ValueError, TypeError):
                 pass
 
         # Attending list
         if attending_ids:
+            checked_in = set(checked_in_ids)
             attend_mentions = []
             for uid in attending_ids:
                 badge = ""
-                if uid in checked_in_ids:
+                if uid in checked_in:
                     badge = " ✅"
                 else:
                     badge = " ❌ (no-show)"
@@ -390,20 +635,9 @@ async def archive_session():
         # Leaderboard section — top 5 by attendance rate
         if attendance_history:
             leaderboard_lines = []
-            entries = []
-            for uid_str, data in attendance_history.items():
-                total = data.get("total_signups", 0)
-                if total == 0:
-                    continue
-                attended = data.get("attended", 0)
-                no_shows = data.get("no_shows", 0)
-                streak = data.get("streak", 0)
-                rate = (attended / total) * 100
-                entries.append((uid_str, attended, total, rate, streak, no_shows))
-
-            entries.sort(key=lambda x: x[3], reverse=True)
+            top = heapq.nlargest(5, attendance_rows(), key=BY_RATE)
             medals = ["🥇", "🥈", "🥉"]
-            for i, (uid_str, attended, total, rate, streak, no_shows) in enumerate(entries[:5]):
+            for i, (uid_str, attended, total, rate, streak, no_shows) in enumerate(top):
                 medal = medals[i] if i < 3 else f"{i+1}."
                 streak_str = f" 🔥{streak}" if streak >= 3 else ""
                 noshow_str = f" ⚠️{no_shows}NS" if no_shows > 0 else ""
@@ -429,7 +663,9 @@ async def end_session():
     global session_ended, countdown_task
 
     session_ended = True
-    save_state()
+    request_save_state()
+    if schedule_view:
+        schedule_view.cancel_embed_update()
 
     # Cancel countdown timer
     if countdown_task and not countdown_task.done():
@@ -438,8 +674,9 @@ async def end_session():
 
     # Tally Nesting roles (only for attendees who checked in)
     if session_type == 'nesting':
+        checked_in = set(checked_in_ids)
         for uid in attending_ids:
-            if uid in checked_in_ids:
+            if uid in checked_in:
                 stats = get_user_stats(uid)
                 if uid in nest_parent_ids:
                     stats["nest_parent_count"] += 1
@@ -447,14 +684,17 @@ async def end_session():
                     stats["nest_baby_count"] += 1
                 elif uid in nest_protector_ids:
                     stats["nest_protector_count"] += 1
-        save_history()
+        request_save_history()
+
+    # Make sure the final session state is on disk before the slow Discord calls
+    await flush_saves()
 
     # Archive to the attendance tracker channel
     await archive_session()
 
     # Post "Session Offline" to archive channel
     try:
-        archive_ch = await bot.fetch_channel(archive_channel_id)
+        archive_ch = await resolve_channel(archive_channel_id)
         if archive_ch:
             offline_embed = discord.Embed(
                 title="Session Offline 🔴",
@@ -480,8 +720,8 @@ async def end_session():
     # Post to status channel if configured
     if status_channel_id:
         try:
-            status_ch = await bot.fetch_channel(status_channel_id)
-            sname = SESSION_TYPES.get(session_type, SESSION_TYPES['hunt'])['label']
+            status_ch = await resolve_channel(status_channel_id)
+            sname = _active_stype['label']
             msg = status_stop_msg.replace('{name}', sname)
             stop_embed = discord.Embed(
                 title=f"{sname} Ended 🔴",
@@ -499,18 +739,32 @@ load_state()
 load_history()
 
 # References to be populated at runtime
-attending = []
-standby = []
-not_attending = []
+# Rosters map user id -> User/Member; dicts keep sign-up order, so the first key is the head of the queue
+attending = {}
+standby = {}
+not_attending = {}
 pending_offer = None
 event_message = None
 schedule_view = None
 countdown_task = None  # asyncio.Task for live countdown
 _leaderboard_cooldown = None  # Cooldown for leaderboard button (60s)
+_last_leaderboard = None  # (key, image url, posted at) of the last leaderboard image posted
+_leaderboard_entries = None  # (key, built at, entries) of the last computed leaderboard rows
+LEADERBOARD_ENTRIES_TTL = 300  # seconds; display names can change without a history write
+LEADERBOARD_URL_TTL = 3600  # seconds to re-link a posted image; Discord CDN attachment links expire
 
 # ----------------------------
 # Helper: next run datetime
 # ----------------------------
+@lru_cache(maxsize=24)
+def hour_label(hour):
+    """12-hour label for a 0-23 hour, e.g. 20 -> '8PM'."""
+    return f"{hour % 12 or 12}{'AM' if hour < 12 else 'PM'}"
+
+def session_day_label(sd):
+    """Session name for a session_days entry, e.g. 'Monday 8PM EST Session'."""
+    return f"{sd['name']} {hour_label(sd['hour'])} EST Session"
+
 def next_run_time(target_hour: int, target_weekday: int):
     now = datetime.now(EST)
     today_weekday = now.weekday()
@@ -544,18 +798,54 @@ async def on_command_error(ctx, error):
     print(f"Command error in {ctx.command}: {error}")
     try:
         await ctx.send(f"Error: {error}", delete_after=10)
-    except:
+    except discord.HTTPException:
         pass
 
 # ----------------------------
 # Sync IDs to User objects
 # ----------------------------
+MEMBER_QUERY_CHUNK = 100  # gateway limit for query_members(user_ids=...)
+
+async def resolve_members(guild, ids):
+    """Map user id -> Member: guild cache first, then chunked gateway queries for the rest.
+    Ids that can't be resolved (member left the guild) are left out."""
+    wanted = {uid for uid in ids if uid}
+    members = {}
+    for uid in wanted:
+        m = guild.get_member(uid)
+        if m is not None:
+            members[uid] = m
+
+    missing = list(wanted - members.keys())
+    if missing:
+        chunks = [missing[i:i + MEMBER_QUERY_CHUNK] for i in range(0, len(missing), MEMBER_QUERY_CHUNK)]
+        results = await asyncio.gather(
+            *(guild.query_members(user_ids=chunk, cache=True) for chunk in chunks),
+            return_exceptions=True,
+        )
+        for res in results:
+            if isinstance(res, Exception):
+                print(f"⚠️ Member query failed: {res}")
+                continue
+            for m in res:
+                members[m.id] = m
+
+    # Per-member REST fallback for anything the gateway didn't return
+    for uid in wanted - members.keys():
+        try:
+            members[uid] = await guild.fetch_member(uid)
+        except discord.NotFound:
+            print(f"⚠️ Member {uid} is no longer in the guild")
+        except discord.HTTPException as e:
+            print(f"❌ Could not fetch member {uid}: {e}")
+    return members
+
 async def sync_users_from_ids():
     global attending, standby, not_attending, pending_offer, event_message
 
-    attending = []
-    standby = []
-    not_attending = []
+    attending = {}
+    standby = {}
+    not_attending = {}
     pending_offer = None
     event_message = None
 
@@ -569,41 +859,15 @@ async def sync_users_from_ids():
         print("❌ No allowed guild found")
         return
 
-    for uid in attending_ids:
-        try:
-            member = await guild.fetch_member(uid)
-            if member:
-                attending.append(member)
-        except:
-            pass
-
-    for uid in standby_ids:
-        try:
-            member = await guild.fetch_member(uid)
-            if member:
-                standby.append(member)
-        except:
-            pass
-
-    for uid in not_attending_ids:
-        try:
-            member = await guild.fetch_member(uid)
-            if member:
-                not_attending.append(member)
-        except:
-            pass
-
-    if pending_offer_id:
-        try:
-            member = await guild.fetch_member(pending_offer_id)
-            if member:
-                pending_offer = member
-        except:
-            pass
+    members = await resolve_members(guild, [*attending_ids, *standby_ids, *not_attending_ids, pending_offer_id])
+    attending = {uid: members[uid] for uid in attending_ids if uid in members}
+    standby = {uid: members[uid] for uid in standby_ids if uid in members}
+    not_attending = {uid: members[uid] for uid in not_attending_ids if uid in members}
+    pending_offer = members.get(pending_offer_id) if pending_offer_id else None
 
     if event_message_id and event_channel_id:
         try:
-            channel = await bot.fetch_channel(event_channel_id)
+            channel = await resolve_channel(event_channel_id)
             if channel:
                 event_message = await channel.fetch_message(event_message_id)
                 print(f"✅ Restored event message: {event_message_id}")
@@ -621,22 +885,37 @@ def sync_ids_from_users():
 
     # Fallback assignment for Nesting sessions: if an attending user has no explicit role, default to Protector.
     if session_type == 'nesting':
-        for u in attending:
-            if u.id not in nest_parent_ids and u.id not in nest_baby_ids and u.id not in nest_protector_ids:
-                nest_protector_ids.append(u.id)
-
-    attending_ids = [u.id for u in attending]
-    standby_ids = [u.id for u in standby]
-    not_attending_ids = [u.id for u in not_attending]
+        assigned = nest_parent_ids | nest_baby_ids | nest_protector_ids
+        for uid in attending:
+            if uid not in assigned:
+                nest_protector_ids.add(uid)
+                assigned.add(uid)
+
+    attending_ids = list(attending)
+    standby_ids = list(standby)
+    not_attending_ids = list(not_attending)
     pending_offer_id = pending_offer.id if pending_offer else None
 
-    save_state()
+    request_save_state()
 
 # ----------------------------
 # Build embed (with countdown + streaks)
 # ----------------------------
+_embed_cache = None   # (key, discord.Embed)
+
 def build_embed():
-    stype = SESSION_TYPES.get(session_type, SESSION_TYPES['hunt'])
+    """Session embed, rebuilt only when the state version or session phase changes.
+    Returns a copy, so callers are free to tweak the footer."""
+    global _embed_cache
+    key = (_state_version, session_type, session_name, session_dt_str, session_ended,
+           session_has_started(), MAX_ATTENDING,
+           len(attending), len(standby), len(not_attending), len(checked_in_ids))
+    if _embed_cache is None or _embed_cache[0] != key:
+        _embed_cache = (key, _render_embed())
+    return _embed_cache[1].copy()
+
+def _render_embed():
+    stype = _active_stype
     title = f"{stype['emoji']} {session_name or 'Session Sign-Up'}"
 
     # Add session type label
@@ -646,10 +925,9 @@ def build_embed():
     # Add countdown if session time is set
     if session_dt_str:
         try:
-            dt = datetime.fromisoformat(session_dt_str)
-            unix_ts = int(dt.timestamp())
+            unix_ts = get_session_unix_ts()
             title += f"\n⏰ Starts <t:{unix_ts}:R>"
-        except:
+        except (ValueError, TypeError):
             pass
 
     # Color changes based on session state
@@ -662,12 +940,21 @@ def build_embed():
 
     embed = discord.Embed(title=title, color=color)
 
+    # Set snapshots so per-user lookups below are O(1)
+    checked_in = set(checked_in_ids)
+    badges = _precompute_badges(attending.values())
+
     # ── NESTING MODE ── shows Parent/Babies/Protectors
     if session_type == 'nesting':
         # Parents
-        parents = [u for u in attending if u.id in nest_parent_ids]
-        babies = [u for u in attending if u.id in nest_baby_ids]
-        protectors = [u for u in attending if u.id in nest_protector_ids]
+        parents, babies, protectors = [], [], []
+        for u in attending.values():
+            if u.id in nest_parent_ids:
+                parents.append(u)
+            if u.id in nest_baby_ids:
+                babies.append(u)
+            if u.id in nest_protector_ids:
+                protectors.append(u)
 
         if parents:
             parent_text = "\n".join(f"`{i+1}.` {u.mention} 🦕" for i, u in enumerate(parents))
@@ -675,16 +962,15 @@ def build_embed():
             parent_text = "*No parent designated — use `!parent @user`*"
 
         if babies:
-            baby_lines = []
-            for i, u in enumerate(babies):
-                checkin_mark = " ✅" if u.id in checked_in_ids else ""
-                baby_lines.append(f"`{i+1}.` {u.mention} 🐣{checkin_mark}{streak_badge(u.id)}")
-            baby_text = "\n".join(baby_lines)
+            baby_text = "\n".join(
+                f"`{i}.` {u.mention} 🐣{' ✅' if u.id in checked_in else ''}{badges[u.id]}"
+                for i, u in enumerate(babies, 1)
+            )
         else:
             baby_text = "*No babies yet — click Join as Baby!*"
 
         if protectors:
-            prot_text = "\n".join(f"`{i+1}.` {u.mention} 🛡️{streak_badge(u.id)}" for i, u in enumerate(protectors))
+            prot_text = "\n".join(f"`{i+1}.` {u.mention} 🛡️{badges[u.id]}" for i, u in enumerate(protectors))
         else:
             prot_text = "*None*"
 
@@ -706,18 +992,17 @@ def build_embed():
     else:
         # ── REGULAR MODE ── (Hunt, Growth, PvP, Migration)
         if attending:
-            attend_lines = []
-            for i, user in enumerate(attending):
-                checkin_mark = " ✅" if user.id in checked_in_ids else ""
-                attend_lines.append(f"`{i+1}.` {user.mention}{checkin_mark}{streak_badge(user.id)}")
-            attend_text = "\n".join(attend_lines)
+            attend_text = "\n".join(
+                f"`{i}.` {user.mention}{' ✅' if user.id in checked_in else ''}{badges[user.id]}"
+                for i, user in enumerate(attending.values(), 1)
+            )
         else:
             attend_text = "*No one yet — be the first!*"
 
         if standby:
             standby_text = "\n".join(
                 f"`{i+1}.` {user.mention}{streak_badge(user.id)}"
-                for i, user in enumerate(standby)
+                for i, user in enumerate(standby.values())
             )
         else:
             standby_text = "*Empty*"
@@ -735,7 +1020,7 @@ def build_embed():
 
     # Not attending (both modes)
     if not_attending:
-        not_attend_text = "\n".join(f"{user.mention}" for user in not_attending)
+        not_attend_text = "\n".join(f"{user.mention}" for user in not_attending.values())
     else:
         not_attend_text = "*None*"
 
@@ -752,8 +1037,7 @@ def build_embed():
         embed.set_footer(text="🟢 Session is live! Check-in enabled.")
     else:
         # No-show warning footer
-        auto_standby_users = [u for u in attending if is_auto_standby(u.id)]
-        if auto_standby_users:
+        if any(is_auto_standby(uid) for uid in attending):
             embed.set_footer(text="⚠️ Some users have high no-show counts")
         else:
             footer = "Click a button below to sign up!"
@@ -769,7 +1053,7 @@ def build_embed():
 async def offer_next_standby():
     global pending_offer
     while standby and len(attending) < MAX_ATTENDING and pending_offer is None:
-        next_user = standby.pop(0)
+        next_user = standby.pop(next(iter(standby)))
         pending_offer = next_user
         sync_ids_from_users()
         try:
@@ -778,12 +1062,31 @@ async def offer_next_standby():
                 view=OfferView(next_user)
             )
             break
-        except:
-            not_attending.append(next_user)
+        except discord.HTTPException:
+            not_attending[next_user.id] = next_user
             pending_offer = None
             sync_ids_from_users()
             continue
 
+# ----------------------------
+# View Owner Guard
+# ----------------------------
+def only_owner(attr='user_id', message=None):
+    """Run a button callback only for the user whose id is stored in self.<attr>.
+    Anyone else gets `message` ephemerally, or a silent defer so the click doesn't fail."""
+    def deco(fn):
+        @wraps(fn)
+        async def wrap(self, interaction: discord.Interaction, button: discord.ui.Button):
+            if interaction.user.id != getattr(self, attr):
+                if message:
+                    await interaction.response.send_message(message, ephemeral=True)
+                else:
+                    await interaction.response.defer()
+                return
+            return await fn(self, interaction, button)
+        return wrap
+    return deco
+
 # ----------------------------
 # DM Offer View
 # ----------------------------
@@ -798,7 +1101,7 @@ class OfferView(discord.ui.View):
         if interaction.user != self.user:
             await interaction.response.send_message("This is not for you.", ephemeral=True)
             return
-        attending.append(self.user)
+        attending[self.user.id] = self.user
         pending_offer = None
         sync_ids_from_users()
         await interaction.response.edit_message(content="✅ You are now ATTENDING!", view=None)
@@ -811,7 +1114,7 @@ class OfferView(discord.ui.View):
         if interaction.user != self.user:
             await interaction.response.send_message("This is not for you.", ephemeral=True)
             return
-        not_attending.append(self.user)
+        not_attending[self.user.id] = self.user
         pending_offer = None
         sync_ids_from_users()
         await interaction.response.edit_message(content="❌ You declined the spot.", view=None)
@@ -838,16 +1141,17 @@ class CheckInView(discord.ui.View):
             await interaction.response.send_message("You're already checked in! ✅", ephemeral=True)
             return
         checked_in_ids.append(user.id)
-        save_state()
         # Disable the button after check-in
         button.disabled = True
         button.label = "Checked In ✅"
         button.style = discord.ButtonStyle.secondary
-        sname = SESSION_TYPES.get(session_type, SESSION_TYPES['hunt'])['label']
+        sname = _active_stype['label']
+        # Answer the interaction first; persisting is debounced and runs off the loop
         await interaction.response.edit_message(
             content=f"✅ **You're checked in for the {sname}!** See you in the session.",
             view=self
         )
+        request_save_state()
         # Refresh the session embed to show the checkmark
         if schedule_view:
             await schedule_view.update_embed()
@@ -855,6 +1159,21 @@ class CheckInView(discord.ui.View):
 # ----------------------------
 # Swap View (DM)
 # ----------------------------
+_notify_tasks = set()  # strong refs so pending DM tasks aren't garbage-collected
+
+async def _notify_requester(user_id, text):
+    """DM a user without holding up the interaction that triggered it."""
+    try:
+        user_obj = bot.get_user(user_id) or await bot.fetch_user(user_id)
+        await user_obj.send(text)
+    except discord.HTTPException:
+        pass
+
+def notify_requester(user_id, text):
+    task = asyncio.create_task(_notify_requester(user_id, text))
+    _notify_tasks.add(task)
+    task.add_done_callback(_notify_tasks.discard)
+
 class SwapView(discord.ui.View):
     def __init__(self, requester_id, target_id):
         super().__init__(timeout=300)  # 5 min timeout
@@ -862,58 +1181,41 @@ class SwapView(discord.ui.View):
         self.target_id = target_id
 
     @discord.ui.button(label="Accept Swap", style=discord.ButtonStyle.success, emoji="🔄", custom_id="swap_accept")
+    @only_owner('target_id', "This is not for you.")
     async def accept_swap(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.target_id:
-            await interaction.response.send_message("This is not for you.", ephemeral=True)
-            return
         # Find both users and swap their positions
-        req_in_attending = any(u.id == self.requester_id for u in attending)
-        req_in_standby = any(u.id == self.requester_id for u in standby)
-        tgt_in_attending = any(u.id == self.target_id for u in attending)
-        tgt_in_standby = any(u.id == self.target_id for u in standby)
+        req_in_attending = self.requester_id in attending
+        req_in_standby = self.requester_id in standby
+        tgt_in_attending = self.target_id in attending
+        tgt_in_standby = self.target_id in standby
 
         # Do the swap
         if req_in_attending and tgt_in_standby:
-            req_user = next(u for u in attending if u.id == self.requester_id)
-            tgt_user = next(u for u in standby if u.id == self.target_id)
-            attending.remove(req_user)
-            standby.remove(tgt_user)
-            attending.append(tgt_user)
-            standby.append(req_user)
+            req_user = attending.pop(self.requester_id)
+            tgt_user = standby.pop(self.target_id)
+            attending[tgt_user.id] = tgt_user
+            standby[req_user.id] = req_user
         elif req_in_standby and tgt_in_attending:
-            req_user = next(u for u in standby if u.id == self.requester_id)
-            tgt_user = next(u for u in attending if u.id == self.target_id)
-            standby.remove(req_user)
-            attending.remove(tgt_user)
-            standby.append(tgt_user)
-            attending.append(req_user)
+            req_user = standby.pop(self.requester_id)
+            tgt_user = attending.pop(self.target_id)
+            standby[tgt_user.id] = tgt_user
+            attending[req_user.id] = req_user
         else:
             await interaction.response.edit_message(content="❌ Swap failed — positions changed.", view=None)
             return
 
-        sync_ids_from_users()
         await interaction.response.edit_message(content="✅ Swap complete!", view=None)
+        sync_ids_from_users()
         if schedule_view:
             await schedule_view.update_embed()
 
-        # Notify requester
-        try:
-            req_user_obj = await bot.fetch_user(self.requester_id)
-            await req_user_obj.send("✅ Your swap was accepted!")
-        except:
-            pass
+        notify_requester(self.requester_id, "✅ Your swap was accepted!")
 
     @discord.ui.button(label="Decline Swap", style=discord.ButtonStyle.danger, emoji="❌", custom_id="swap_decline")
+    @only_owner('target_id', "This is not for you.")
     async def decline_swap(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.target_id:
-            await interaction.response.send_message("This is not for you.", ephemeral=True)
-            return
         await interaction.response.edit_message(content="❌ Swap declined.", view=None)
-        try:
-            req_user_obj = await bot.fetch_user(self.requester_id)
-            await req_user_obj.send("❌ Your swap request was declined.")
-        except:
-            pass
+        notify_requester(self.requester_id, "❌ Your swap request was declined.")
 
 # ----------------------------
 # Reminder Confirm/Drop View (DM)
@@ -924,21 +1226,17 @@ class ReminderView(discord.ui.View):
         self.user_id = user_id
 
     @discord.ui.button(label="Still Coming!", style=discord.ButtonStyle.success, emoji="👍", custom_id="reminder_confirm")
+    @only_owner()
     async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            return
         await interaction.response.edit_message(content="👍 Great, see you there!", view=None)
 
     @discord.ui.button(label="Can't Make It", style=discord.ButtonStyle.danger, emoji="👋", custom_id="reminder_drop")
+    @only_owner()
     async def drop(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            return
         # Remove from attending
         user = interaction.user
-        to_remove = [u for u in attending if u.id == user.id]
-        for u in to_remove:
-            attending.remove(u)
-        if user not in not_attending:
+        attending.pop(user.id, None)
+        if user.id not in not_attending:
             # Need a Member object; user from DM is a User not Member
             not_attending_ids.append(user.id)
         sync_ids_from_users()
@@ -950,7 +1248,94 @@ class ReminderView(discord.ui.View):
 # ----------------------------
 # Leaderboard Image Renderer
 # ----------------------------
-def _render_leaderboard_image(entries, clicker_id):
+FONT_DIR = "/usr/share/fonts/truetype/dejavu"
+PNG_COMPRESS_LEVEL = 1  # zlib level for rendered PNGs: much faster than the default 6, slightly larger files
+
+@lru_cache(maxsize=None)
+def _font_face(bold):
+    """One DejaVu Sans face per weight, read from disk once; sizes are derived from it."""
+    path = os.path.join(FONT_DIR, "DejaVuSans-Bold.ttf" if bold else "DejaVuSans.ttf")
+    with open(path, "rb") as f:
+        return ImageFont.truetype(io.BytesIO(f.read()), 16)
+
+@lru_cache(maxsize=None)
+def load_font(size, bold=False):
+    """DejaVu Sans at `size`, built once per (size, weight); Pillow's default font if missing."""
+    try:
+        # font_variant reuses the face's in-memory TTF bytes instead of reopening the file
+        return _font_face(bold).font_variant(size=size)
+    except OSError:
+        return ImageFont.load_default()
+
+@lru_cache(maxsize=512)
+def _text_mask(text, size, bold=False):
+    """Coverage mask for a label, rasterised once, plus its bbox offset from the draw origin."""
+    font = load_font(size, bold)
+    left, top, right, bottom = font.getbbox(text)
+    mask = Image.new("L", (right - left, bottom - top), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=font)
+    return mask, left, top
+
+@lru_cache(maxsize=2048)
+def text_bbox(text, size, bold=False):
+    """Same box as draw.textbbox((0, 0), ...); card layout measures the same strings every render."""
+    return load_font(size, bold).getbbox(text)
+
+def paste_text(img, xy, text, fill, size, bold=False):
+    """Pixel-identical to draw.text, but repeated labels (titles, headers, ranks) reuse a cached mask."""
+    mask, left, top = _text_mask(text, size, bold)
+    x, y = xy[0] + left, xy[1] + top
+    img.paste(fill, (x, y, x + mask.width, y + mask.height), mask)
+
+# Pillow drawing and PNG encoding run here so they don't stall the event loop.
+# Each render draws into its own Image, but the lru_cached helpers above and below
+# are shared between the worker threads: FreeTypeFont objects (_font_face/load_font),
+# _text_mask masks, and the card frame, tint, asset and rounded-mask Images. That is
+# safe because the cached Images are only ever read (paste sources and masks, never
+# drawn on), and Pillow's FreeType calls hold the GIL, so two threads never use one
+# face at once. A cache miss racing in both threads just builds the value twice.
+RENDER_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="render")
+
+async def run_render(fn, *args):
+    return await asyncio.get_running_loop().run_in_executor(RENDER_POOL, fn, *args)
+
+def _cached_table_render(draw):
+    """Memoize a leaderboard renderer on its inputs. Entries carry every value that is
+    drawn, so changed stats produce a new key and no explicit invalidation is needed.
+    The clicker highlight only matters when the clicker is on the board."""
+    @lru_cache(maxsize=64)
+    def png(entries, clicker_id):
+        return draw(entries, clicker_id).getvalue()
+
+    def render(entries, clicker_id):
+        entries = tuple(entries)
+        if not any(e[0] == clicker_id for e in entries):
+            clicker_id = None
+        return io.BytesIO(png(entries, clicker_id))
+    render.cache_clear = png.cache_clear
+    return render
+
+def _table_canvas(entries, clicker_id, width, height, bg, accent, title_height, header_height,
+                  row_height, stripes, highlight, marker):
+    """Paint a leaderboard table's solid fills (background, title accent, header bar, row
+    stripes, clicker marker) as a few numpy slice writes and return it as an Image.
+    Spans match the inclusive draw.rectangle boxes they replace."""
+    arr = np.empty((height, width, 3), dtype=np.uint8)
+    arr[:] = bg
+    arr[:title_height + 1, :5] = accent
+    arr[title_height:title_height + header_height + 1] = accent
+    y = title_height + header_height
+    for idx, entry in enumerate(entries):
+        rows = arr[y:y + row_height + 1]
+        if entry[0] == clicker_id:
+            rows[:] = highlight
+            rows[:, :5] = marker
+        else:
+            rows[:] = stripes[idx % 2]
+        y += row_height
+    return Image.fromarray(arr)
+
+def _draw_leaderboard_image(entries, clicker_id):
     """Render a leaderboard table as a PNG image. Returns a BytesIO object."""
     # --- Configuration ---
     BG_COLOR = (30, 33, 36)         # Discord dark bg
@@ -972,16 +1357,8 @@ def _render_leaderboard_image(entries, clicker_id):
     font_size = 16
     header_font_size = 14
     title_font_size = 22
-    try:
-        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
-        font_bold = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", font_size)
-        header_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", header_font_size)
-        title_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", title_font_size)
-    except OSError:
-        font = ImageFont.load_default()
-        font_bold = font
-        header_font = font
-        title_font = font
+    font = load_font(font_size)
+    font_bold = load_font(font_size, bold=True)
 
     # --- Column layout ---
     col_widths = [55, 200, 80, 80, 65, 65]  # Rank, Name, Attended, No-Show, Rate, Streak
@@ -993,19 +1370,19 @@ def _render_leaderboard_image(entries, clicker_id):
     table_width = sum(col_widths) + padding * 2
     table_height = title_height + header_height + row_height * len(entries) + padding
 
-    img = Image.new("RGB", (table_width, table_height), BG_COLOR)
+    # Fills first (accent bar, header bar, row stripes), then text on top
+    img = _table_canvas(entries, clicker_id, table_width, table_height, BG_COLOR, HEADER_COLOR,
+                        title_height, header_height, row_height, (ROW_EVEN, ROW_ODD), HIGHLIGHT_ROW, GOLD)
     draw = ImageDraw.Draw(img)
 
     # --- Title bar with accent ---
-    draw.rectangle([(0, 0), (4, title_height)], fill=HEADER_COLOR)  # left accent bar
-    draw.text((padding + 6, 10), "Attendance Leaderboard", fill=TEXT_COLOR, font=title_font)
+    paste_text(img, (padding + 6, 10), "Attendance Leaderboard", TEXT_COLOR, title_font_size, bold=True)
 
     # --- Column headers ---
     y = title_height
-    draw.rectangle([(0, y), (table_width, y + header_height)], fill=HEADER_COLOR)
     x = padding
     for i, header in enumerate(col_headers):
-        draw.text((x + 4, y + 7), header, fill=TEXT_COLOR, font=header_font)
+        paste_text(img, (x + 4, y + 7), header, TEXT_COLOR, header_font_size, bold=True)
         x += col_widths[i]
 
     # --- Data rows ---
@@ -1013,17 +1390,6 @@ def _render_leaderboard_image(entries, clicker_id):
     medal_labels = ["#1", "#2", "#3"]
     for idx, (uid_str, name, attended, no_shows, rate, streak) in enumerate(entries):
         is_clicker = uid_str == clicker_id
-        if is_clicker:
-            row_color = HIGHLIGHT_ROW
-        elif idx % 2 == 0:
-            row_color = ROW_EVEN
-        else:
-            row_color = ROW_ODD
-
-        draw.rectangle([(0, y), (table_width, y + row_height)], fill=row_color)
-        # Left accent for clicker
-        if is_clicker:
-            draw.rectangle([(0, y), (4, y + row_height)], fill=GOLD)
 
         x = padding
         # Rank column
@@ -1033,7 +1399,7 @@ def _render_leaderboard_image(entries, clicker_id):
         else:
             rank_text = f"#{idx + 1}"
             rank_color = DIM_TEXT
-        draw.text((x + 4, y + 7), rank_text, fill=rank_color, font=font_bold)
+        paste_text(img, (x + 4, y + 7), rank_text, rank_color, font_size, bold=True)
         x += col_widths[0]
 
         # Name column
@@ -1069,14 +1435,16 @@ def _render_leaderboard_image(entries, clicker_id):
         y += row_height
 
     buf = io.BytesIO()
-    img.save(buf, format="PNG")
+    img.save(buf, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
     buf.seek(0)
     return buf
 
+_render_leaderboard_image = _cached_table_render(_draw_leaderboard_image)
+
 # ----------------------------
 # Nesting Leaderboard Image Renderer
 # ----------------------------
-def _render_nesting_leaderboard_image(entries, clicker_id):
+def _draw_nesting_leaderboard_image(entries, clicker_id):
     """Render a Nesting leaderboard table as a PNG image. Returns a BytesIO object."""
     # --- Configuration ---
     BG_COLOR = (30, 33, 36)
@@ -1094,18 +1462,8 @@ def _render_nesting_leaderboard_image(entries, clicker_id):
     font_size = 16
     header_font_size = 14
     title_font_size = 22
-    try:
-        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
-        font_bold = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", font_size)
-        header_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", header_font_size)
-        title_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", title_font_size)
-        emoji_font = ImageFont.truetype("/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf", 20) # Attempt to load emoji font
-    except OSError:
-        font = ImageFont.load_default()
-        font_bold = font
-        header_font = font
-        title_font = font
-        emoji_font = font
+    font = load_font(font_size)
+    font_bold = load_font(font_size, bold=True)
 
     # --- Column layout ---
     col_widths = [55, 200, 95, 95, 95]  # Rank, Name, Parents, Babies, Protectors
@@ -1117,21 +1475,20 @@ def _render_nesting_leaderboard_image(entries, clicker_id):
     table_width = sum(col_widths) + padding * 2
     table_height = title_height + header_height + row_height * len(entries) + padding
 
-    img = Image.new("RGB", (table_width, table_height), BG_COLOR)
+    img = _table_canvas(entries, clicker_id, table_width, table_height, BG_COLOR, HEADER_COLOR,
+                        title_height, header_height, row_height, (ROW_EVEN, ROW_ODD), HIGHLIGHT_ROW, GOLD)
     draw = ImageDraw.Draw(img)
 
     # --- Title bar with accent ---
-    draw.rectangle([(0, 0), (4, title_height)], fill=HEADER_COLOR)
-    draw.text((padding + 6, 10), "🥚 Nesting Leaderboard", fill=TEXT_COLOR, font=title_font)
+    paste_text(img, (padding + 6, 10), "🥚 Nesting Leaderboard", TEXT_COLOR, title_font_size, bold=True)
 
     # --- Column headers ---
     y = title_height
-    draw.rectangle([(0, y), (table_width, y + header_height)], fill=HEADER_COLOR)
     x = padding
     for i, header in enumerate(col_headers):
         # We can't render emojis easily with Pil without specific setups, so we use text labels
         # but to keep it clean, we just write the text header in Black for contrast against yellow
-        draw.text((x + 4, y + 7), header, fill=(0,0,0), font=header_font)
+        paste_text(img, (x + 4, y + 7), header, (0,0,0), header_font_size, bold=True)
         x += col_widths[i]
 
     # --- Data rows ---
@@ -1139,16 +1496,6 @@ def _render_nesting_leaderboard_image(entries, clicker_id):
     medal_labels = ["#1", "#2", "#3"]
     for idx, (uid_str, name, parents, babies, protectors) in enumerate(entries):
         is_clicker = uid_str == clicker_id
-        if is_clicker:
-            row_color = HIGHLIGHT_ROW
-        elif idx % 2 == 0:
-            row_color = ROW_EVEN
-        else:
-            row_color = ROW_ODD
-
-        draw.rectangle([(0, y), (table_width, y + row_height)], fill=row_color)
-        if is_clicker:
-            draw.rectangle([(0, y), (4, y + row_height)], fill=GOLD)
 
         x = padding
         # Rank column
@@ -1158,7 +1505,7 @@ def _render_nesting_leaderboard_image(entries, clicker_id):
         else:
             rank_text = f"#{idx + 1}"
             rank_color = DIM_TEXT
-        draw.text((x + 4, y + 7), rank_text, fill=rank_color, font=font_bold)
+        paste_text(img, (x + 4, y + 7), rank_text, rank_color, font_size, bold=True)
         x += col_widths[0]
 
         # Name column
@@ -1184,13 +1531,84 @@ def _render_nesting_leaderboard_image(entries, clicker_id):
         y += row_height
 
     buf = io.BytesIO()
-    img.save(buf, format="PNG")
+    img.save(buf, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
     buf.seek(0)
     return buf
 
+_render_nesting_leaderboard_image = _cached_table_render(_draw_nesting_leaderboard_image)
+
 # ----------------------------
 # Dino Battle Image Renderer
 # ----------------------------
+# Card artwork that only depends on the card size is built once and reused.
+# Build card frame programmatically (true alpha transparency)
+@lru_cache(maxsize=4)
+def _build_card_frame(w, h):
+    """Draw an ornate card frame with true transparency using Pillow."""
+    frame = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+    fd = ImageDraw.Draw(frame)
+    GOLD = (190, 155, 60, 255)
+    GOLD_DIM = (140, 110, 40, 200)
+    DARK = (18, 18, 22, 230)
+    BORDER_W = 6
+
+    # Outer border — gold rounded rectangle
+    fd.rounded_rectangle([(0, 0), (w-1, h-1)], radius=14, outline=GOLD, width=BORDER_W)
+    # Inner border — darker inset
+    fd.rounded_rectangle([(BORDER_W+2, BORDER_W+2), (w-BORDER_W-3, h-BORDER_W-3)],
+                         radius=10, outline=GOLD_DIM, width=2)
+
+    # Name banner bar (dark semi-transparent strip across middle)
+    banner_y = int(h * 0.47)
+    banner_h = 48
+    fd.rectangle([(BORDER_W+3, banner_y), (w-BORDER_W-3, banner_y + banner_h)], fill=DARK)
+    fd.line([(BORDER_W+3, banner_y), (w-BORDER_W-3, banner_y)], fill=GOLD, width=2)
+    fd.line([(BORDER_W+3, banner_y+banner_h), (w-BORDER_W-3, banner_y+banner_h)], fill=GOLD, width=2)
+
+    # Stats area background (lower portion, semi-transparent)
+    stats_top = banner_y + banner_h + 8
+    fd.rounded_rectangle(
+        [(BORDER_W+6, stats_top), (w-BORDER_W-6, h-BORDER_W-6)],
+        radius=8, fill=(10, 10, 15, 180)
+    )
+
+    # Corner diamonds (decorative)
+    for cx, cy in [(16, 16), (w-16, 16), (16, h-16), (w-16, h-16)]:
+        fd.polygon([(cx, cy-6), (cx+6, cy), (cx, cy+6), (cx-6, cy)], fill=GOLD)
+
+    # Top center gem
+    gem_x, gem_y = w // 2, 10
+    fd.polygon([(gem_x, gem_y-5), (gem_x+8, gem_y+3), (gem_x, gem_y+11), (gem_x-8, gem_y+3)], fill=GOLD)
+
+    return frame
+
+@lru_cache(maxsize=8)
+def _diet_tint(carnivore, w, h):
+    """Translucent card background: red for carnivores, green for herbivores."""
+    return Image.new("RGBA", (w, h), (88, 28, 28, 180) if carnivore else (28, 68, 48, 180))
+
+# Avatars and custom frames, decoded and resized once. The cache key includes the
+# file's mtime, so images re-uploaded through the dashboard are picked up automatically.
+DINO_ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets", "dinos")
+
+def _asset_version(path):
+    """mtime of an asset file, or None if it doesn't exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+@lru_cache(maxsize=128)
+def _load_scaled_asset(path, version, size):
+    with Image.open(path) as im:
+        return im.convert("RGBA").resize(size, Image.Resampling.LANCZOS)
+
+@lru_cache(maxsize=8)
+def _rounded_mask(size, radius):
+    mask = Image.new("L", size, 0)
+    ImageDraw.Draw(mask).rounded_rectangle([(0, 0), size], radius=radius, fill=255)
+    return mask
+
 def _render_vs_image(dino_a, dino_b):
     """Render a side-by-side trading card battle image with fantasy frame. Returns a BytesIO object."""
     CARD_WIDTH = 300
@@ -1206,65 +1624,17 @@ def _render_vs_image(dino_a, dino_b):
     img = Image.new("RGBA", (TOTAL_WIDTH, TOTAL_HEIGHT), BG_COLOR)
     draw = ImageDraw.Draw(img)
 
-    try:
-        font_name = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 22)
-        font_sub = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 13)
-        font_stat_label = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 11)
-        font_stat_val = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 16)
-        font_vs = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 42)
-    except OSError:
-        font_name = ImageFont.load_default()
-        font_sub = ImageFont.load_default()
-        font_stat_label = ImageFont.load_default()
-        font_stat_val = ImageFont.load_default()
-        font_vs = ImageFont.load_default()
-
-    # Build card frame programmatically (true alpha transparency)
-    def _build_card_frame(w, h):
-        """Draw an ornate card frame with true transparency using Pillow."""
-        frame = Image.new("RGBA", (w, h), (0, 0, 0, 0))
-        fd = ImageDraw.Draw(frame)
-        GOLD = (190, 155, 60, 255)
-        GOLD_DIM = (140, 110, 40, 200)
-        DARK = (18, 18, 22, 230)
-        BORDER_W = 6
-
-        # Outer border — gold rounded rectangle
-        fd.rounded_rectangle([(0, 0), (w-1, h-1)], radius=14, outline=GOLD, width=BORDER_W)
-        # Inner border — darker inset
-        fd.rounded_rectangle([(BORDER_W+2, BORDER_W+2), (w-BORDER_W-3, h-BORDER_W-3)],
-                             radius=10, outline=GOLD_DIM, width=2)
-
-        # Name banner bar (dark semi-transparent strip across middle)
-        banner_y = int(h * 0.47)
-        banner_h = 48
-        fd.rectangle([(BORDER_W+3, banner_y), (w-BORDER_W-3, banner_y + banner_h)], fill=DARK)
-        fd.line([(BORDER_W+3, banner_y), (w-BORDER_W-3, banner_y)], fill=GOLD, width=2)
-        fd.line([(BORDER_W+3, banner_y+banner_h), (w-BORDER_W-3, banner_y+banner_h)], fill=GOLD, width=2)
-
-        # Stats area background (lower portion, semi-transparent)
-        stats_top = banner_y + banner_h + 8
-        fd.rounded_rectangle(
-            [(BORDER_W+6, stats_top), (w-BORDER_W-6, h-BORDER_W-6)],
-            radius=8, fill=(10, 10, 15, 180)
-        )
-
-        # Corner diamonds (decorative)
-        for cx, cy in [(16, 16), (w-16, 16), (16, h-16), (w-16, h-16)]:
-            fd.polygon([(cx, cy-6), (cx+6, cy), (cx, cy+6), (cx-6, cy)], fill=GOLD)
-
-        # Top center gem
-        gem_x, gem_y = w // 2, 10
-        fd.polygon([(gem_x, gem_y-5), (gem_x+8, gem_y+3), (gem_x, gem_y+11), (gem_x-8, gem_y+3)], fill=GOLD)
-
-        return frame
+    font_name = load_font(22, bold=True)
+    font_sub = load_font(13)
+    font_stat_label = load_font(11, bold=True)
+    font_stat_val = load_font(16, bold=True)
+    font_vs = load_font(42, bold=True)
 
     card_frame = _build_card_frame(CARD_WIDTH, CARD_HEIGHT)
 
     def draw_card(x_offset, dino, side="left"):
         # Diet tint behind everything
-        tint_color = (88, 28, 28, 180) if dino['type'] == 'carnivore' else (28, 68, 48, 180)
-        tint = Image.new("RGBA", (CARD_WIDTH, CARD_HEIGHT), tint_color)
+        tint = _diet_tint(dino['type'] == 'carnivore', CARD_WIDTH, CARD_HEIGHT)
         img.paste(tint, (x_offset, PADDING), tint)
 
         # Avatar — fill the upper portrait area of the frame
@@ -1273,26 +1643,23 @@ def _render_vs_image(dino_a, dino_b):
         avatar_x = x_offset + 20
         try:
             # Check custom frame first
-            custom_frame_path = os.path.join(os.path.dirname(__file__), "assets", "dinos", "frames", f"{side}_frame.png")
-            has_custom_frame = os.path.exists(custom_frame_path)
+            custom_frame_path = os.path.join(DINO_ASSETS_DIR, "frames", f"{side}_frame.png")
+            custom_frame_ver = _asset_version(custom_frame_path)
 
-            avatar_path = os.path.join(os.path.dirname(__file__), "assets", "dinos", f"{dino['id']}.png")
-            if not os.path.exists(avatar_path):
-                avatar_path = os.path.join(os.path.dirname(__file__), "assets", "dinos", "defaults", f"{dino['id']}.png")
-            avatar = Image.open(avatar_path).convert("RGBA")
-            avatar = avatar.resize(avatar_region, Image.Resampling.LANCZOS)
+            avatar_path = os.path.join(DINO_ASSETS_DIR, f"{dino['id']}.png")
+            avatar_ver = _asset_version(avatar_path)
+            if avatar_ver is None:
+                avatar_path = os.path.join(DINO_ASSETS_DIR, "defaults", f"{dino['id']}.png")
+                avatar_ver = _asset_version(avatar_path)
+            avatar = _load_scaled_asset(avatar_path, avatar_ver, avatar_region)
 
             # Apply rounded rectangle mask to avatar
-            mask = Image.new("L", avatar_region, 0)
-            mask_draw = ImageDraw.Draw(mask)
-            mask_draw.rounded_rectangle([(0, 0), avatar_region], radius=12, fill=255)
-            img.paste(avatar, (avatar_x, avatar_y), mask)
+            img.paste(avatar, (avatar_x, avatar_y), _rounded_mask(avatar_region, 12))
 
             # If custom frame exists, overlay it on top of avatar
-            if has_custom_frame:
+            if custom_frame_ver is not None:
                 try:
-                    custom_frame = Image.open(custom_frame_path).convert("RGBA")
-                    custom_frame = custom_frame.resize((CARD_WIDTH, CARD_HEIGHT), Image.Resampling.LANCZOS)
+                    custom_frame = _load_scaled_asset(custom_frame_path, custom_frame_ver, (CARD_WIDTH, CARD_HEIGHT))
                     img.paste(custom_frame, (x_offset, PADDING), custom_frame)
                 except Exception:
                     pass
@@ -1320,33 +1687,26 @@ def _render_vs_image(dino_a, dino_b):
 
         # Shrink font if name is too wide
         fn = font_name
-        name_bbox = draw.textbbox((0, 0), base_name, font=fn)
+        name_bbox = text_bbox(base_name, 22, bold=True)
         name_w = name_bbox[2] - name_bbox[0]
         if name_w > CARD_WIDTH - 40:
-            try:
-                fn = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 16)
-                name_bbox = draw.textbbox((0, 0), base_name, font=fn)
-                name_w = name_bbox[2] - name_bbox[0]
-            except OSError:
-                pass
+            fn = load_font(16, bold=True)
+            name_bbox = text_bbox(base_name, 16, bold=True)
+            name_w = name_bbox[2] - name_bbox[0]
 
         # Name banner area (below portrait, in frame banner region)
         name_y = PADDING + int(CARD_HEIGHT * 0.50)
         name_x = x_offset + (CARD_WIDTH - name_w) // 2
 
-        # Shadow + main text for legibility
-        for dx, dy in [(-1,-1),(1,-1),(-1,1),(1,1),(0,-1),(0,1),(-1,0),(1,0)]:
-            draw.text((name_x+dx, name_y+dy), base_name, fill=(0,0,0), font=fn)
-        draw.text((name_x, name_y), base_name, fill=TEXT_COLOR, font=fn)
+        # Outlined text for legibility
+        draw.text((name_x, name_y), base_name, fill=TEXT_COLOR, font=fn, stroke_width=1, stroke_fill=(0,0,0))
 
         if subtitle:
-            sub_bbox = draw.textbbox((0, 0), subtitle, font=font_sub)
+            sub_bbox = text_bbox(subtitle, 13)
             sub_w = sub_bbox[2] - sub_bbox[0]
             sub_x = x_offset + (CARD_WIDTH - sub_w) // 2
             sub_y = name_y + 24
-            for dx, dy in [(-1,0),(1,0),(0,-1),(0,1)]:
-                draw.text((sub_x+dx, sub_y+dy), subtitle, fill=(0,0,0), font=font_sub)
-            draw.text((sub_x, sub_y), subtitle, fill=(180, 180, 180), font=font_sub)
+            draw.text((sub_x, sub_y), subtitle, fill=(180, 180, 180), font=font_sub, stroke_width=1, stroke_fill=(0,0,0))
 
         # Stats — rendered as compact badges in the lower portion of the card
         stats_y = PADDING + int(CARD_HEIGHT * 0.62)
@@ -1369,17 +1729,13 @@ def _render_vs_image(dino_a, dino_b):
             )
 
             # Label on left
-            for dx, dy in [(-1,0),(1,0),(0,-1),(0,1)]:
-                draw.text((pill_x + 8 + dx, stats_y + 4 + dy), label, fill=(0,0,0), font=font_stat_label)
-            draw.text((pill_x + 8, stats_y + 4), label, fill=color, font=font_stat_label)
+            draw.text((pill_x + 8, stats_y + 4), label, fill=color, font=font_stat_label, stroke_width=1, stroke_fill=(0,0,0))
 
             # Value on right
-            val_bbox = draw.textbbox((0, 0), val, font=font_stat_val)
+            val_bbox = text_bbox(val, 16, bold=True)
             val_w = val_bbox[2] - val_bbox[0]
             val_x = pill_x + pill_w - val_w - 8
-            for dx, dy in [(-1,0),(1,0),(0,-1),(0,1)]:
-                draw.text((val_x + dx, stats_y + 2 + dy), val, fill=(0,0,0), font=font_stat_val)
-            draw.text((val_x, stats_y + 2), val, fill=TEXT_COLOR, font=font_stat_val)
+            draw.text((val_x, stats_y + 2), val, fill=TEXT_COLOR, font=font_stat_val, stroke_width=1, stroke_fill=(0,0,0))
 
             # Small colored accent bar
             bar_w = min(pill_w - 70, int(pill_w * 0.4))
@@ -1399,7 +1755,7 @@ def _render_vs_image(dino_a, dino_b):
         [(vs_x - circle_r, vs_y - circle_r), (vs_x + circle_r, vs_y + circle_r)],
         fill=(231, 76, 60), outline=(241, 196, 15), width=3
     )
-    vs_bbox = draw.textbbox((0, 0), "VS", font=font_vs)
+    vs_bbox = text_bbox("VS", 42, bold=True)
     vs_tw = vs_bbox[2] - vs_bbox[0]
     vs_th = vs_bbox[3] - vs_bbox[1]
     draw.text((vs_x - vs_tw // 2, vs_y - vs_th // 2 - 4), "VS", fill=TEXT_COLOR, font=font_vs)
@@ -1412,20 +1768,25 @@ def _render_vs_image(dino_a, dino_b):
     final.paste(img, (0, 0), img)
 
     buf = io.BytesIO()
-    final.save(buf, format="PNG")
+    final.save(buf, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
     buf.seek(0)
     return buf
 
 # ----------------------------
 # Main Schedule View
 # ----------------------------
+EMBED_EDIT_DEBOUNCE_SECONDS = 0.3
+
 class ScheduleView(discord.ui.View):
     def __init__(self):
         super().__init__(timeout=None)
+        self._pending_update = None   # TimerHandle for a coalesced embed edit
+        self._update_task = None
         self.build_buttons()
 
     def build_buttons(self):
         self.clear_items()
+        self._built_for = session_type
         if session_type == 'nesting':
             # 1. Parent
             btn_parent = discord.ui.Button(label="Join as Parent", style=discord.ButtonStyle.success, emoji="🦕", custom_id="nest_parent")
@@ -1461,18 +1822,9 @@ class ScheduleView(discord.ui.View):
             btn_relieve = discord.ui.Button(label="Relieve Spot", style=discord.ButtonStyle.primary, emoji="🔄", custom_id="schedule_relieve")
             btn_relieve.callback = self.relieve_spot
 
-            if session_type == 'growth':
-                btn_attend.label, btn_attend.emoji = "Join Growth", "🌱"
-                btn_not.label, btn_not.emoji = "Skipping", "😞"
-            elif session_type == 'pvp':
-                btn_attend.label, btn_attend.emoji = "Join Battle", "⚔️"
-                btn_not.label, btn_not.emoji = "Retreating", "😞"
-            elif session_type == 'migration':
-                btn_attend.label, btn_attend.emoji = "Join Herd", "🏃"
-                btn_not.label, btn_not.emoji = "Staying Behind", "😞"
-            else:
-                btn_attend.label, btn_attend.emoji = "Join Hunt", "🦴"
-                btn_not.label, btn_not.emoji = "Can't Make It", "😞"
+            attend_cfg, not_cfg = SESSION_BUTTON_CFG.get(session_type, SESSION_BUTTON_CFG['hunt'])
+            btn_attend.label, btn_attend.emoji = attend_cfg
+            btn_not.label, btn_not.emoji = not_cfg
 
             self.add_item(btn_attend)
             self.add_item(btn_standby)
@@ -1494,9 +1846,31 @@ class ScheduleView(discord.ui.View):
         self.add_item(btn_lb)
 
     async def update_embed(self):
-        if event_message:
+        """Schedule one embed edit; further calls inside the debounce window share it."""
+        if not event_message or self._pending_update is not None:
+            return
+        self._pending_update = asyncio.get_running_loop().call_later(
+            EMBED_EDIT_DEBOUNCE_SECONDS, self._start_embed_update)
+
+    def _start_embed_update(self):
+        self._pending_update = None
+        self._update_task = asyncio.create_task(self._flush_embed_update())
+
+    def cancel_embed_update(self):
+        if self._pending_update is not None:
+            self._pending_update.cancel()
+            self._pending_update = None
+
+    async def _flush_embed_update(self):
+        # Skip if the session ended or a newer view took over while we waited
+        if not event_message or session_ended or schedule_view is not self:
+            return
+        if self._built_for != session_type:
             self.build_buttons()
+        try:
             await event_message.edit(embed=build_embed(), view=self)
+        except discord.HTTPException as e:
+            print(f"❌ Could not update session embed: {e}")
 
     # --- Nesting Specific Callbacks ---
     async def join_parent(self, interaction: discord.Interaction):
@@ -1510,7 +1884,7 @@ class ScheduleView(discord.ui.View):
             return
         
         await self._remove_from_other_nest_roles(user.id)
-        nest_parent_ids.append(user.id)
+        nest_parent_ids.add(user.id)
         await self._ensure_attending(user, interaction, "🦕 Joined as a Nest Parent!")
 
     async def join_baby(self, interaction: discord.Interaction):
@@ -1521,7 +1895,7 @@ class ScheduleView(discord.ui.View):
             return
             
         await self._remove_from_other_nest_roles(user.id)
-        nest_baby_ids.append(user.id)
+        nest_baby_ids.add(user.id)
         await self._ensure_attending(user, interaction, "🐣 Joined as a Baby!")
 
     async def join_protector(self, interaction: discord.Interaction):
@@ -1532,27 +1906,25 @@ class ScheduleView(discord.ui.View):
             return
             
         await self._remove_from_other_nest_roles(user.id)
-        nest_protector_ids.append(user.id)
+        nest_protector_ids.add(user.id)
         await self._ensure_attending(user, interaction, "🛡️ Joined as a Protector!")
 
     async def _remove_from_other_nest_roles(self, uid):
-        if uid in nest_parent_ids: nest_parent_ids.remove(uid)
-        if uid in nest_baby_ids: nest_baby_ids.remove(uid)
-        if uid in nest_protector_ids: nest_protector_ids.remove(uid)
+        nest_parent_ids.discard(uid)
+        nest_baby_ids.discard(uid)
+        nest_protector_ids.discard(uid)
 
     async def _ensure_attending(self, user, interaction, success_msg):
         # Move user to attending if not already there, handle standby/not_attending logic
-        if user in not_attending:
-            not_attending.remove(user)
-        if user in standby:
-            standby.remove(user)
+        not_attending.pop(user.id, None)
+        standby.pop(user.id, None)
             
-        if user not in attending:
+        if user.id not in attending:
             if len(attending) < MAX_ATTENDING and pending_offer is None:
-                attending.append(user)
+                attending[user.id] = user
             else:
                 # If full, put them back on standby and don't assign role
-                standby.append(user)
+                standby[user.id] = user
                 await self._remove_from_other_nest_roles(user.id)
                 sync_ids_from_users()
                 await interaction.response.send_message("Attending is full! You've been placed on standby.", ephemeral=True)
@@ -1575,13 +1947,13 @@ class ScheduleView(discord.ui.View):
         if await self._handle_common_checks(interaction): return
         user = interaction.user
         
-        if user in attending:
+        if user.id in attending:
             await interaction.response.send_message("You're already attending!", ephemeral=True)
             return
-        if user in standby:
+        if user.id in standby:
             if len(attending) < MAX_ATTENDING and pending_offer is None:
-                standby.remove(user)
-                attending.append(user)
+                del standby[user.id]
+                attending[user.id] = user
                 sync_ids_from_users()
                 await interaction.response.send_message("✅ Moved from standby to attending!", ephemeral=True)
                 await self.update_embed()
@@ -1589,13 +1961,12 @@ class ScheduleView(discord.ui.View):
             else:
                 await interaction.response.send_message("You're on standby — attending is full right now.", ephemeral=True)
                 return
-        if user in not_attending:
-            not_attending.remove(user)
+        not_attending.pop(user.id, None)
 
         if is_auto_standby(user.id):
             stats = get_user_stats(user.id)
             rate = int((stats['no_shows'] / stats['total_signups']) * 100)
-            standby.append(user)
+            standby[user.id] = user
             sync_ids_from_users()
             await interaction.response.send_message(
                 f"⚠️ Your no-show rate is **{rate}%** — you've been placed on **standby**. "
@@ -1606,9 +1977,9 @@ class ScheduleView(discord.ui.View):
             return
 
         if len(attending) < MAX_ATTENDING and pending_offer is None:
-            attending.append(user)
+            attending[user.id] = user
         else:
-            standby.append(user)
+            standby[user.id] = user
         sync_ids_from_users()
         await interaction.response.send_message("Updated your attendance.", ephemeral=True)
         await self.update_embed()
@@ -1616,14 +1987,12 @@ class ScheduleView(discord.ui.View):
     async def join_standby(self, interaction: discord.Interaction):
         if await self._handle_common_checks(interaction): return
         user = interaction.user
-        if user in standby:
+        if user.id in standby:
             await interaction.response.send_message("You're already on standby!", ephemeral=True)
             return
-        if user in attending:
-            attending.remove(user)
-        if user in not_attending:
-            not_attending.remove(user)
-        standby.append(user)
+        attending.pop(user.id, None)
+        not_attending.pop(user.id, None)
+        standby[user.id] = user
         sync_ids_from_users()
         await interaction.response.send_message("Added to standby.", ephemeral=True)
         await self.update_embed()
@@ -1631,17 +2000,10 @@ class ScheduleView(discord.ui.View):
     async def not_attend(self, interaction: discord.Interaction):
         if await self._handle_common_checks(interaction): return
         user = interaction.user
-        removed = False
-        if user in attending:
-            attending.remove(user)
-            removed = True
-        elif user in standby:
-            standby.remove(user)
-            removed = True
+        removed = attending.pop(user.id, None) or standby.pop(user.id, None)
         if removed:
             await offer_next_standby()
-        if user not in not_attending:
-            not_attending.append(user)
+        not_attending.setdefault(user.id, user)
         sync_ids_from_users()
         await interaction.response.send_message("Marked as not attending.", ephemeral=True)
         await self.update_embed()
@@ -1651,12 +2013,11 @@ class ScheduleView(discord.ui.View):
         if session_ended:
             await interaction.response.send_message("🔴 Session has ended.", ephemeral=True)
             return
-        if user not in attending:
+        if user.id not in attending:
             await interaction.response.send_message("You are not in Attending.", ephemeral=True)
             return
-        attending.remove(user)
-        if user not in not_attending:
-            not_attending.append(user)
+        del attending[user.id]
+        not_attending.setdefault(user.id, user)
         sync_ids_from_users()
         await offer_next_standby()
         await interaction.response.send_message(
@@ -1698,7 +2059,7 @@ class ScheduleView(discord.ui.View):
 
     async def leaderboard_btn(self, interaction: discord.Interaction):
         """Post the attendance leaderboard as an image in the channel (with 60s cooldown)."""
-        global _leaderboard_cooldown
+        global _leaderboard_cooldown, _last_leaderboard
         now = datetime.now(EST)
         if _leaderboard_cooldown and (now - _leaderboard_cooldown).total_seconds() < 60:
             remaining = 60 - int((now - _leaderboard_cooldown).total_seconds())
@@ -1714,56 +2075,58 @@ class ScheduleView(discord.ui.View):
 
         guild = interaction.guild
         clicker_id = str(interaction.user.id)
-        entries = []
 
+        entries = leaderboard_entries(guild)
+        if not entries:
+            msg = "🥚 No nesting data yet." if session_type == 'nesting' else "📊 No attendance data yet."
+            await interaction.response.send_message(msg, ephemeral=True)
+            return
         if session_type == 'nesting':
-            for uid_str, data in attendance_history.items():
-                parents = data.get("nest_parent_count", 0)
-                babies = data.get("nest_baby_count", 0)
-                protectors = data.get("nest_protector_count", 0)
-                total_nest = parents + babies + protectors
-                if total_nest == 0:
-                    continue
-                try:
-                    member = guild.get_member(int(uid_str))
-                    name = member.display_name if member else f"User {uid_str}"
-                except:
-                    name = f"User {uid_str}"
-                entries.append((uid_str, name, parents, babies, protectors))
-
-            # Sort by total nested roles played, then by parents as tie-breaker
-            entries.sort(key=lambda x: ((x[2]+x[3]+x[4]), x[2]), reverse=True)
-            entries = entries[:15]
-            if not entries:
-                await interaction.response.send_message("🥚 No nesting data yet.", ephemeral=True)
-                return
-            img_bytes = _render_nesting_leaderboard_image(entries, clicker_id)
+            render, args = _render_nesting_leaderboard_image, (entries, clicker_id)
         else:
-            for uid_str, data in attendance_history.items():
-                total = data.get("total_signups", 0)
-                if total == 0:
-                    continue
-                attended = data.get("attended", 0)
-                no_shows = data.get("no_shows", 0)
-                streak = data.get("streak", 0)
-                rate = (attended / total) * 100
-                try:
-                    member = guild.get_member(int(uid_str))
-                    name = member.display_name if member else f"User {uid_str}"
-                except:
-                    name = f"User {uid_str}"
-                entries.append((uid_str, name, attended, no_shows, rate, streak))
-
-            entries.sort(key=lambda x: x[4], reverse=True)
-            entries = entries[:15]  # top 15
-            if not entries:
-                await interaction.response.send_message("📊 No attendance data yet.", ephemeral=True)
-                return
-            img_bytes = _render_leaderboard_image(entries, clicker_id)
+            render, args = _render_leaderboard_image, (entries, clicker_id)
 
-        file = discord.File(fp=img_bytes, filename="leaderboard.png")
         _leaderboard_cooldown = now
-        await interaction.response.send_message(file=file)
+        await interaction.response.defer()
+
+        # Entries carry every drawn value, so an identical key means an identical image:
+        # link the one already uploaded instead of rendering and uploading it again.
+        on_board = any(e[0] == clicker_id for e in entries)
+        lb_key = (session_type, tuple(entries), clicker_id if on_board else None)
+        if (_last_leaderboard and _last_leaderboard[0] == lb_key
+                and (now - _last_leaderboard[2]).total_seconds() < LEADERBOARD_URL_TTL):
+            embed = discord.Embed(color=_active_stype['color'])
+            embed.set_image(url=_last_leaderboard[1])
+            await interaction.followup.send(embed=embed)
+            return
+
+        img_bytes = await run_render(render, *args)
+        file = discord.File(fp=img_bytes, filename="leaderboard.png")
+        msg = await interaction.followup.send(file=file)
+        if msg and msg.attachments:
+            _last_leaderboard = (lb_key, msg.attachments[0].url, now)
+
+def leaderboard_entries(guild):
+    """Top-15 leaderboard rows for the current session type, as drawn by the renderers.
+    Reused until history changes, the type switches, or the TTL lapses."""
+    global _leaderboard_entries
+    key = (_history_version, session_type, guild.id if guild else None)
+    now = datetime.now(EST)
+    if (_leaderboard_entries and _leaderboard_entries[0] == key
+            and (now - _leaderboard_entries[1]).total_seconds() < LEADERBOARD_ENTRIES_TTL):
+        return _leaderboard_entries[2]
+
+    if session_type == 'nesting':
+        # Top 15 by total nested roles played, then by parents as tie-breaker
+        top = heapq.nlargest(15, nesting_rows(), key=BY_NEST_TOTAL_PARENTS)
+        entries = tuple((uid_str, member_display_name(guild, uid_str), parents, babies, protectors)
+                        for uid_str, parents, babies, protectors, _ in top)
+    else:
+        top = heapq.nlargest(15, attendance_rows(), key=BY_RATE)  # top 15
+        entries = tuple((uid_str, member_display_name(guild, uid_str), attended, no_shows, rate, streak)
+                        for uid_str, attended, total, rate, streak, no_shows in top)
+    _leaderboard_entries = (key, now, entries)
+    return entries
 
 # ----------------------------
 # Create / Reset Session
@@ -1773,12 +2136,12 @@ async def create_schedule(channel, session_name_arg: str, session_dt: datetime =
     global session_name, session_dt_str, event_message_id, event_channel_id
     global attending_ids, standby_ids, not_attending_ids, pending_offer_id
     global reminder_sent, checkin_active, checked_in_ids, checkin_message_id
-    global countdown_task, session_ended, session_type, nest_parent_ids, nest_baby_ids
+    global countdown_task, session_ended, nest_parent_ids, nest_baby_ids
 
     # Set session type
-    session_type = stype if stype in SESSION_TYPES else 'hunt'
-    nest_parent_ids = []
-    nest_baby_ids = []
+    set_session_type(stype if stype in SESSION_TYPES else 'hunt')
+    nest_parent_ids = set()
+    nest_baby_ids = set()
 
     # Archive the previous session if there was one
     if session_name and (attending_ids or standby_ids or not_attending_ids):
@@ -1805,7 +2168,7 @@ async def create_schedule(channel, session_name_arg: str, session_dt: datetime =
     elif event_message_id and event_channel_id:
         # Fallback: fetch and strip by stored ID (e.g. after bot restart)
         try:
-            old_ch = await bot.fetch_channel(event_channel_id)
+            old_ch = await resolve_channel(event_channel_id)
             old_msg = await old_ch.fetch_message(event_message_id)
             old_embed = old_msg.embeds[0] if old_msg.embeds else discord.Embed(title="Session Closed")
             old_embed.set_footer(text="🔴 Session closed — a new session has been created")
@@ -1857,7 +2220,7 @@ async def create_schedule(channel, session_name_arg: str, session_dt: datetime =
     # Save message info for persistence
     event_message_id = event_message.id
     event_channel_id = channel.id
-    save_state()
+    request_save_state()
 
     # Start live countdown timer if session has a future datetime
     if session_dt:
@@ -1866,7 +2229,7 @@ async def create_schedule(channel, session_name_arg: str, session_dt: datetime =
     # Post to status channel if configured
     if status_channel_id:
         try:
-            status_ch = await bot.fetch_channel(status_channel_id)
+            status_ch = await resolve_channel(status_channel_id)
             msg = status_start_msg.replace('{name}', session_name_arg)
             status_embed = discord.Embed(
                 title="Session Started 🟢",
@@ -1886,7 +2249,7 @@ async def edit_current_session(new_name: str, new_dt_str: str):
     
     session_name = new_name
     session_dt_str = new_dt_str
-    save_state()
+    request_save_state()
     
     # Reload the live countdown task with the new target time
     if countdown_task and not countdown_task.done():
@@ -1905,38 +2268,60 @@ async def edit_current_session(new_name: str, new_dt_str: str):
 # ----------------------------
 # Live Countdown Timer
 # ----------------------------
+def _countdown_delay(remaining):
+    """Seconds until the countdown/elapsed text next changes (remaining < 0 once started).
+    Over an hour out the countdown only shows minutes, so wake on the minute; inside the
+    last hour keep the 10s cadence, and after start the elapsed text is per-minute."""
+    if remaining > 3600:
+        return (int(remaining) % 60) or 60
+    if remaining > 0:
+        return 10
+    elapsed = int(-remaining)
+    if elapsed < 60:
+        return 30
+    return 60 - elapsed % 60
+
 async def _run_countdown():
     """Edits the session embed with a live countdown, then elapsed time after start."""
     global event_message, session_dt_str
     started = False
     session_online_posted = False
+    last_edit = None   # (embed cache key, footer) of the last edit we sent
+    delay = 10
     try:
         while True:
-            # Before start: update every 10s. After start: every 30s.
-            await asyncio.sleep(10 if not started else 30)
+            await asyncio.sleep(delay)
+            delay = 10
             if not event_message or not session_dt_str:
                 return
             if session_ended:
                 return  # session was ended by admin
             try:
-                session_dt = datetime.fromisoformat(session_dt_str)
+                session_dt = get_session_dt()
                 now = datetime.now(session_dt.tzinfo or EST)
                 remaining = (session_dt - now).total_seconds()
 
+                delay = _countdown_delay(remaining)
+
                 if remaining > 0:
                     # ── COUNTING DOWN ──
                     mins, secs = divmod(int(remaining), 60)
                     hours, mins = divmod(mins, 60)
                     if hours > 0:
-                        countdown_str = f"{hours}h {mins}m {secs}s"
+                        countdown_str = f"{hours}h {mins}m"
                     elif mins > 0:
                         countdown_str = f"{mins}m {secs}s"
                     else:
                         countdown_str = f"{secs}s"
                     if schedule_view:
                         embed = build_embed()
-                        embed.set_footer(text=f"⏰ Starts in {countdown_str}")
-                        await event_message.edit(embed=embed, view=schedule_view)
+                        footer = f"⏰ Starts in {countdown_str}"
+                        # Skip the API call when nothing visible changed
+                        sig = (_embed_cache[0], footer)
+                        if sig != last_edit:
+                            embed.set_footer(text=footer)
+                            await event_message.edit(embed=embed, view=schedule_view)
+                            last_edit = sig
                 else:
                     # ── SESSION STARTED — show elapsed time ──
                     if not started:
@@ -1945,9 +2330,9 @@ async def _run_countdown():
                         if not session_online_posted:
                             session_online_posted = True
                             try:
-                                archive_ch = await bot.fetch_channel(archive_channel_id)
+                                archive_ch = await resolve_channel(archive_channel_id)
                                 if archive_ch:
-                                    sname = SESSION_TYPES.get(session_type, SESSION_TYPES['hunt'])['label']
+                                    sname = _active_stype['label']
                                     online_embed = discord.Embed(
                                         title=f"{sname} Online 🟢",
                                         description="We're live for OOTAH TIME!",
@@ -1968,8 +2353,12 @@ async def _run_countdown():
                         elapsed_str = f"{secs}s ago"
                     if schedule_view:
                         embed = build_embed()
-                        embed.set_footer(text=f"⏰ Started {elapsed_str} · 🟢 Session has started!")
-                        await event_message.edit(embed=embed, view=schedule_view)
+                        footer = f"⏰ Started {elapsed_str} · 🟢 Session has started!"
+                        sig = (_embed_cache[0], footer)
+                        if sig != last_edit:
+                            embed.set_footer(text=footer)
+                            await event_message.edit(embed=embed, view=schedule_view)
+                            last_edit = sig
                     # Auto-end after 4 hours post-start
                     if elapsed >= 14400:
                         await end_session()
@@ -2015,10 +2404,8 @@ async def schedule(ctx, *args):
     session_dt = now.replace(hour=hour, minute=0, second=0, microsecond=0)
 
     sinfo = SESSION_TYPES[stype]
-    h12 = hour % 12 or 12
-    ampm = "PM" if hour >= 12 else "AM"
     await create_schedule(ctx.channel, f"Beta Led {sinfo['label']}", session_dt=session_dt, stype=stype)
-    await ctx.send(f"✅ {sinfo['emoji']} **Beta Led {sinfo['label']}** scheduled for **{h12}{ampm} EST** today!", delete_after=10)
+    await ctx.send(f"✅ {sinfo['emoji']} **Beta Led {sinfo['label']}** scheduled for **{hour_label(hour)} EST** today!", delete_after=10)
 
 @bot.command(help="Create a quick test session. Usage: !testsession [type] [minutes] (default 1 min, admin only)")
 async def testsession(ctx, *args):
@@ -2057,16 +2444,16 @@ async def force(ctx):
         session_dt = next_run_time(sd["hour"], sd["weekday"])
         if session_dt >= now:
             next_session = session_dt
-            session_name_arg = f"{sd['name']} {sd['hour'] % 12 or 12}{'AM' if sd['hour'] < 12 else 'PM'} EST Session"
+            session_name_arg = session_day_label(sd)
             break
 
     if not next_session:
         sd = session_days[0]
         next_session = next_run_time(sd["hour"], sd["weekday"])
-        session_name_arg = f"{sd['name']} {sd['hour'] % 12 or 12}{'AM' if sd['hour'] < 12 else 'PM'} EST Session"
+        session_name_arg = session_day_label(sd)
 
     try:
-        channel = await bot.fetch_channel(SCHEDULE_CHANNEL_ID)
+        channel = await resolve_channel(SCHEDULE_CHANNEL_ID)
         await create_schedule(channel, session_name_arg, session_dt=next_session)
         await ctx.send(f"✅ Forced creation of session: {session_name_arg}")
     except Exception as e:
@@ -2084,7 +2471,7 @@ async def setmax(ctx, n: int):
         await ctx.send("❌ Max must be between 1 and 50.")
         return
     MAX_ATTENDING = n
-    save_state()
+    request_save_state()
     await ctx.send(f"✅ Max attending set to **{n}**")
     if schedule_view:
         await schedule_view.update_embed()
@@ -2094,17 +2481,15 @@ async def addday(ctx, weekday: str, hour: int):
     """Add a session day. Usage: !addday Thursday 20 (for 8PM)"""
     if not await check_admin(ctx):
         return
-    day_map = {"monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
-               "friday": 4, "saturday": 5, "sunday": 6}
     day_lower = weekday.lower()
-    if day_lower not in day_map:
-        await ctx.send(f"❌ Invalid day. Use: {', '.join(day_map.keys())}")
+    if day_lower not in DAY_MAP:
+        await ctx.send(f"❌ Invalid day. Use: {DAY_NAMES}")
         return
     if hour < 0 or hour > 23:
         await ctx.send("❌ Hour must be 0-23 (24h format).")
         return
 
-    wd = day_map[day_lower]
+    wd = DAY_MAP[day_lower]
     # Check for duplicate
     for sd in session_days:
         if sd["weekday"] == wd and sd["hour"] == hour:
@@ -2117,30 +2502,26 @@ async def addday(ctx, weekday: str, hour: int):
         "name": weekday.capitalize(),
         "post_hours_before": 20
     })
-    save_state()
-    h12 = hour % 12 or 12
-    ampm = "AM" if hour < 12 else "PM"
-    await ctx.send(f"✅ Added **{weekday.capitalize()} {h12}{ampm}** session.")
+    request_save_state()
+    await ctx.send(f"✅ Added **{weekday.capitalize()} {hour_label(hour)}** session.")
 
 @bot.command(help="Remove a session day. Admin only. Usage: !removeday Thursday")
 async def removeday(ctx, weekday: str):
     """Remove a session day. Usage: !removeday Thursday"""
     if not await check_admin(ctx):
         return
-    day_map = {"monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
-               "friday": 4, "saturday": 5, "sunday": 6}
     day_lower = weekday.lower()
-    if day_lower not in day_map:
-        await ctx.send(f"❌ Invalid day. Use: {', '.join(day_map.keys())}")
+    if day_lower not in DAY_MAP:
+        await ctx.send(f"❌ Invalid day. Use: {DAY_NAMES}")
         return
 
-    wd = day_map[day_lower]
+    wd = DAY_MAP[day_lower]
     before = len(session_days)
     session_days[:] = [sd for sd in session_days if sd["weekday"] != wd]
     if len(session_days) == before:
         await ctx.send(f"❌ No sessions on {weekday.capitalize()} to remove.")
         return
-    save_state()
+    request_save_state()
     await ctx.send(f"✅ Removed all sessions on **{weekday.capitalize()}**.")
 
 @bot.command(help="Remove a user from all lists. Admin only. Usage: !kick @user")
@@ -2149,14 +2530,11 @@ async def kick(ctx, member: discord.Member):
     if not await check_admin(ctx):
         return
     removed_from = []
-    if member in attending:
-        attending.remove(member)
+    if attending.pop(member.id, None):
         removed_from.append("attending")
-    if member in standby:
-        standby.remove(member)
+    if standby.pop(member.id, None):
         removed_from.append("standby")
-    if member in not_attending:
-        not_attending.remove(member)
+    if not_attending.pop(member.id, None):
         removed_from.append("not attending")
 
     if removed_from:
@@ -2180,7 +2558,7 @@ async def resetstats(ctx, member: discord.Member):
             "attended": 0, "no_shows": 0, "total_signups": 0,
             "streak": 0, "best_streak": 0
         }
-        save_history()
+        request_save_history()
         await ctx.send(f"✅ Reset stats for {member.mention}")
     else:
         await ctx.send(f"❌ No stats found for {member.mention}")
@@ -2195,7 +2573,7 @@ async def setgrace(ctx, minutes: int):
         await ctx.send("❌ Grace period must be between 5 and 120 minutes.")
         return
     CHECKIN_GRACE_MINUTES = minutes
-    save_state()
+    request_save_state()
     await ctx.send(f"✅ Check-in grace period set to **{minutes} minutes**")
 
 @bot.command(help="Set no-show threshold for auto-standby. Admin only. Usage: !setnoshow 3")
@@ -2208,7 +2586,7 @@ async def setnoshow(ctx, n: int):
         await ctx.send("❌ Threshold must be between 1 and 20.")
         return
     NOSHOW_THRESHOLD = n
-    save_state()
+    request_save_state()
     await ctx.send(f"✅ No-show threshold set to **{n}** (auto-standby after {n} no-shows)")
 
 @bot.command(help="Show current bot settings. Admin only.")
@@ -2229,7 +2607,7 @@ async def settings(ctx):
     embed.add_field(name="Beta Roles", value=beta_list, inline=True)
     embed.add_field(name="Archive Channel", value=f"<#{archive_channel_id}>", inline=True)
     embed.add_field(name="Session Status", value=status, inline=True)
-    sinfo = SESSION_TYPES.get(session_type, SESSION_TYPES['hunt'])
+    sinfo = _active_stype
     embed.add_field(name="Session Type", value=f"{sinfo['emoji']} {sinfo['label']}", inline=True)
     embed.add_field(name="Owner Admin", value=f"<@{ADMIN_ID}>", inline=True)
     await ctx.send(embed=embed)
@@ -2244,7 +2622,8 @@ async def setadminroles(ctx, *roles):
         await ctx.send(f"Current admin roles: **{', '.join(admin_role_names)}**\nUsage: `!setadminroles RoleName1 RoleName2`")
         return
     admin_role_names = list(roles)
-    save_state()
+    _refresh_role_caches()
+    request_save_state()
     await ctx.send(f"✅ Admin roles set to: **{', '.join(admin_role_names)}**")
 
 @bot.command(help="Set beta scheduling roles. Admin only. Usage: !setbetaroles Beta 'Lead Beta'")
@@ -2257,7 +2636,8 @@ async def setbetaroles(ctx, *roles):
         await ctx.send(f"Current beta roles: **{', '.join(beta_role_names)}**\nUsage: `!setbetaroles RoleName1 RoleName2`")
         return
     beta_role_names = list(roles)
-    save_state()
+    _refresh_role_caches()
+    request_save_state()
     await ctx.send(f"✅ Beta scheduling roles set to: **{', '.join(beta_role_names)}**")
 
 @bot.command(help="Set the archive channel. Admin only. Usage: !setarchivechannel #channel")
@@ -2267,7 +2647,7 @@ async def setarchivechannel(ctx, channel: discord.TextChannel):
         return
     global archive_channel_id
     archive_channel_id = channel.id
-    save_state()
+    request_save_state()
     await ctx.send(f"✅ Archive channel set to {channel.mention}")
 
 @bot.command(help="End the current session manually. Admin only.")
@@ -2297,13 +2677,13 @@ async def settype(ctx, type_name: str = None):
         await ctx.send(f"❌ Invalid type. Available: {types_list}", delete_after=10)
         return
 
-    global session_type, nest_parent_ids, nest_baby_ids, nest_protector_ids
-    session_type = type_name.lower()
+    global nest_parent_ids, nest_baby_ids, nest_protector_ids
+    set_session_type(type_name.lower())
     if session_type != 'nesting':
-        nest_parent_ids = []
-        nest_baby_ids = []
-        nest_protector_ids = []
-    save_state()
+        nest_parent_ids = set()
+        nest_baby_ids = set()
+        nest_protector_ids = set()
+    request_save_state()
 
     sinfo = SESSION_TYPES[session_type]
     await ctx.send(f"{sinfo['emoji']} Session type changed to **{sinfo['label']}**!", delete_after=10)
@@ -2322,12 +2702,12 @@ async def parent(ctx, member: discord.Member):
         return
     global nest_parent_ids
     if member.id not in nest_parent_ids:
-        nest_parent_ids.append(member.id)
+        nest_parent_ids.add(member.id)
         # Also ensure they're in the attending list
-        if member not in attending and member.id not in attending_ids:
-            attending.append(member)
+        if member.id not in attending and member.id not in attending_ids:
+            attending[member.id] = member
             attending_ids.append(member.id)
-        save_state()
+        request_save_state()
     await ctx.send(f"🦕 {member.mention} is now a **Nest Parent**!", delete_after=10)
     if schedule_view and event_message:
         await schedule_view.update_embed()
@@ -2340,7 +2720,7 @@ async def unparent(ctx, member: discord.Member):
     global nest_parent_ids
     if member.id in nest_parent_ids:
         nest_parent_ids.remove(member.id)
-        save_state()
+        request_save_state()
         await ctx.send(f"✅ {member.mention} is no longer a parent.", delete_after=10)
         if schedule_view and event_message:
             await schedule_view.update_embed()
@@ -2357,15 +2737,14 @@ async def baby(ctx, member: discord.Member):
         return
     global nest_baby_ids
     if member.id not in nest_baby_ids:
-        nest_baby_ids.append(member.id)
+        nest_baby_ids.add(member.id)
         # Also ensure they're in the attending list
-        if member not in attending and member.id not in attending_ids:
-            attending.append(member)
+        if member.id not in attending and member.id not in attending_ids:
+            attending[member.id] = member
             attending_ids.append(member.id)
         # Remove from parent list if they were there
-        if member.id in nest_parent_ids:
-            nest_parent_ids.remove(member.id)
-        save_state()
+        nest_parent_ids.discard(member.id)
+        request_save_state()
     await ctx.send(f"🐣 {member.mention} is now a **Baby**!", delete_after=10)
     if schedule_view and event_message:
         await schedule_view.update_embed()
@@ -2378,7 +2757,7 @@ async def unbaby(ctx, member: discord.Member):
     global nest_baby_ids
     if member.id in nest_baby_ids:
         nest_baby_ids.remove(member.id)
-        save_state()
+        request_save_state()
         await ctx.send(f"✅ {member.mention} is no longer a baby.", delete_after=10)
         if schedule_view and event_message:
             await schedule_view.update_embed()
@@ -2392,9 +2771,9 @@ async def nest(ctx):
         await ctx.send("❌ No active nesting session. Current type: **" + SESSION_TYPES.get(session_type, {}).get('label', 'Unknown') + "**", delete_after=10)
         return
 
-    parents = [u for u in attending if u.id in nest_parent_ids]
-    babies = [u for u in attending if u.id in nest_baby_ids]
-    protectors = [u for u in attending if u.id not in nest_parent_ids and u.id not in nest_baby_ids]
+    parents = [u for u in attending.values() if u.id in nest_parent_ids]
+    babies = [u for u in attending.values() if u.id in nest_baby_ids]
+    protectors = [u for u in attending.values() if u.id not in nest_parent_ids and u.id not in nest_baby_ids]
 
     embed = discord.Embed(title="🥚 Nesting Status", color=0xf1c40f)
     embed.add_field(
@@ -2426,26 +2805,12 @@ async def stats(ctx, stype: str = None):
 
     # Check for nesting stats request
     if stype and stype.lower() == 'nesting':
-        entries = []
         guild = ctx.guild
-        for uid_str, data in attendance_history.items():
-            parents = data.get("nest_parent_count", 0)
-            babies = data.get("nest_baby_count", 0)
-            protectors = data.get("nest_protector_count", 0)
-            total = parents + babies + protectors
-            if total == 0:
-                continue
-            try:
-                member = guild.get_member(int(uid_str))
-                name = member.display_name if member else f"User {uid_str}"
-            except:
-                name = f"User {uid_str}"
-            entries.append((name, parents, babies, protectors, total))
-
-        entries.sort(key=lambda x: x[4], reverse=True)
+        top = heapq.nlargest(15, nesting_rows(), key=BY_NEST_TOTAL)
         medals = ["🥇", "🥈", "🥉"]
         lines = []
-        for i, (name, parents, babies, protectors, total) in enumerate(entries[:15]):
+        for i, (uid_str, parents, babies, protectors, total) in enumerate(top):
+            name = member_display_name(guild, uid_str)
             medal = medals[i] if i < 3 else f"{i+1}."
             lines.append(f"{medal} **{name}** — 🦕 {parents} | 🐣 {babies} | 🛡️ {protectors}")
 
@@ -2457,30 +2822,14 @@ async def stats(ctx, stype: str = None):
         await ctx.send(embed=embed)
         return
 
-    # Sort by standard attendance rate
-    entries = []
+    # Top 15 by standard attendance rate
     guild = ctx.guild
-    for uid_str, data in attendance_history.items():
-        total = data.get("total_signups", 0)
-        if total == 0:
-            continue
-        attended = data.get("attended", 0)
-        no_shows = data.get("no_shows", 0)
-        streak = data.get("streak", 0)
-        rate = (attended / total) * 100
-        try:
-            member = guild.get_member(int(uid_str))
-            name = member.display_name if member else f"User {uid_str}"
-        except:
-            name = f"User {uid_str}"
-
-        entries.append((name, attended, total, rate, streak, no_shows))
-
-    entries.sort(key=lambda x: x[3], reverse=True)  # sort by rate
+    top = heapq.nlargest(15, attendance_rows(), key=BY_RATE)
 
     medals = ["🥇", "🥈", "🥉"]
     lines = []
-    for i, (name, attended, total, rate, streak, no_shows) in enumerate(entries[:15]):
+    for i, (uid_str, attended, total, rate, streak, no_shows) in enumerate(top):
+        name = member_display_name(guild, uid_str)
         medal = medals[i] if i < 3 else f"{i+1}."
         streak_str = f" 🔥{streak}" if streak >= 3 else ""
         noshow_str = f" ⚠️{no_shows}NS" if no_shows > 0 else ""
@@ -2524,26 +2873,26 @@ async def swap(ctx, target: discord.Member):
         return
 
     # Verify both are in some list
-    req_in = requester in attending or requester in standby
-    tgt_in = target in attending or target in standby
+    req_in = requester.id in attending or requester.id in standby
+    tgt_in = target.id in attending or target.id in standby
     if not req_in or not tgt_in:
         await ctx.send("❌ Both users must be on attending or standby to swap.", delete_after=5)
         return
 
     # Same list = no point
-    if (requester in attending and target in attending) or (requester in standby and target in standby):
+    if (requester.id in attending and target.id in attending) or (requester.id in standby and target.id in standby):
         await ctx.send("❌ You're both in the same list — nothing to swap.", delete_after=5)
         return
 
     try:
         await target.send(
             f"🔄 **{requester.display_name}** wants to swap spots with you!\n"
-            f"They are {'attending' if requester in attending else 'on standby'}, "
-            f"you are {'attending' if target in attending else 'on standby'}.",
+            f"They are {'attending' if requester.id in attending else 'on standby'}, "
+            f"you are {'attending' if target.id in attending else 'on standby'}.",
             view=SwapView(requester.id, target.id)
         )
         await ctx.send(f"✅ Swap request sent to {target.mention}!", delete_after=10)
-    except:
+    except discord.HTTPException:
         await ctx.send(f"❌ Couldn't DM {target.mention}. They may have DMs disabled.", delete_after=10)
 
 # ----------------------------
@@ -2557,10 +2906,7 @@ async def days(ctx):
         return
     lines = []
     for sd in sorted(session_days, key=lambda x: x["weekday"]):
-        h = sd["hour"]
-        h12 = h % 12 or 12
-        ampm = "AM" if h < 12 else "PM"
-        lines.append(f"• **{sd['name']}** at {h12}{ampm} EST (posts {sd['post_hours_before']}h before)")
+        lines.append(f"• **{sd['name']}** at {hour_label(sd['hour'])} EST (posts {sd['post_hours_before']}h before)")
     embed = discord.Embed(title="📅 Session Schedule", description="\n".join(lines), color=0xe67e22)
     await ctx.send(embed=embed)
 
@@ -2600,48 +2946,42 @@ DINO_TEMPLATES = [
 def load_dinos():
     if os.path.exists(DINOS_FILE):
         try:
-            with open(DINOS_FILE, 'r') as f:
-                return json.load(f)
+            return read_json(DINOS_FILE)
         except Exception as e:
             print(f"❌ Error loading {DINOS_FILE}: {e}")
     return DINO_TEMPLATES.copy()
 
 def save_dinos(dinos_list):
     try:
-        with open(DINOS_FILE, 'w') as f:
-            json.dump(dinos_list, f, indent=2)
+        write_json(DINOS_FILE, dinos_list)
     except Exception as e:
         print(f"❌ Error saving {DINOS_FILE}: {e}")
 
 def load_dino_lb():
     if os.path.exists(DINO_LB_FILE):
         try:
-            with open(DINO_LB_FILE, 'r') as f:
-                return json.load(f)
+            return read_json(DINO_LB_FILE)
         except Exception as e:
             print(f"❌ Error loading {DINO_LB_FILE}: {e}")
     return {}
 
 def save_dino_lb(lb_data):
     try:
-        with open(DINO_LB_FILE, 'w') as f:
-            json.dump(lb_data, f, indent=2)
+        write_json(DINO_LB_FILE, lb_data)
     except Exception as e:
         print(f"❌ Error saving {DINO_LB_FILE}: {e}")
 
 def load_dino_stats():
     if os.path.exists(DINO_STATS_FILE):
         try:
-            with open(DINO_STATS_FILE, 'r') as f:
-                return json.load(f)
+            return read_json(DINO_STATS_FILE)
         except Exception as e:
             print(f"❌ Error loading {DINO_STATS_FILE}: {e}")
     return {}
 
 def save_dino_stats(stats):
     try:
-        with open(DINO_STATS_FILE, 'w') as f:
-            json.dump(stats, f, indent=2)
+        write_json(DINO_STATS_FILE, stats)
     except Exception as e:
         print(f"❌ Error saving {DINO_STATS_FILE}: {e}")
 
@@ -2809,16 +3149,18 @@ class DinoBattleView(discord.ui.View):
         if not lb:
             await interaction.response.send_message("No Dino Battle bets on record yet!", ephemeral=True)
             return
+        await interaction.response.defer(ephemeral=True, thinking=True)
         embed, file = await _build_dino_lb_embed(interaction.client, lb)
-        await interaction.response.send_message(embed=embed, file=file, ephemeral=True)
+        await interaction.followup.send(embed=embed, file=file, ephemeral=True)
 
     async def dino_lb_callback(self, interaction: discord.Interaction):
         stats = load_dino_stats()
         if not stats:
             await interaction.response.send_message("No dino battles recorded yet!", ephemeral=True)
             return
-        embed, file = _build_dino_stats_embed(stats)
-        await interaction.response.send_message(embed=embed, file=file, ephemeral=True)
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        embed, file = await _build_dino_stats_embed(stats)
+        await interaction.followup.send(embed=embed, file=file, ephemeral=True)
 
     async def menu_callback(self, interaction: discord.Interaction):
         is_admin = False
@@ -2854,16 +3196,18 @@ class DinoPostBattleView(discord.ui.View):
         if not lb:
             await interaction.response.send_message("No Dino Battle bets on record yet!", ephemeral=True)
             return
+        await interaction.response.defer(ephemeral=True, thinking=True)
         embed, file = await _build_dino_lb_embed(interaction.client, lb)
-        await interaction.response.send_message(embed=embed, file=file, ephemeral=True)
+        await interaction.followup.send(embed=embed, file=file, ephemeral=True)
 
     async def dino_lb_callback(self, interaction: discord.Interaction):
         stats = load_dino_stats()
         if not stats:
             await interaction.response.send_message("No dino battles recorded yet!", ephemeral=True)
             return
-        embed, file = _build_dino_stats_embed(stats)
-        await interaction.response.send_message(embed=embed, file=file, ephemeral=True)
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        embed, file = await _build_dino_stats_embed(stats)
+        await interaction.followup.send(embed=embed, file=file, ephemeral=True)
 
     async def menu_callback(self, interaction: discord.Interaction):
         view = HelpView(interaction.user.id, show_admin=False)
@@ -2960,12 +3304,12 @@ async def _build_dino_lb_embed(client, lb):
         try:
             user = await client.fetch_user(int(uid_str))
             name = user.display_name if user else f"User {uid_str}"
-        except:
+        except (ValueError, discord.HTTPException):
             name = f"User {uid_str}"
         wk = stats.get("weekly", {}).get(week, {})
         entries.append((uid_str, name, stats, wk))
 
-    buf = _render_battle_lb_image(entries, week)
+    buf = await run_render(_render_battle_lb_image, entries, week)
     file = discord.File(buf, filename="battle_lb.png")
     embed = discord.Embed(title="🦖 Battle Leaderboard 🦕", color=0xf1c40f)
     embed.set_image(url="attachment://battle_lb.png")
@@ -2985,16 +3329,8 @@ def _render_battle_lb_image(entries, week):
     ORANGE = (255, 165, 0)
     GOLD = (255, 215, 0)
     
-    try:
-        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 14)
-        font_bold = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 14)
-        header_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 13)
-        title_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 20)
-    except OSError:
-        font = ImageFont.load_default()
-        font_bold = font
-        header_font = font
-        title_font = font
+    font = load_font(14)
+    font_bold = load_font(14, bold=True)
 
     col_widths = [45, 170, 50, 45, 45, 55, 65, 55]
     col_headers = ["Rank", "Name", "W", "L", "T", "Streak", "Props", "Week"]
@@ -3010,13 +3346,13 @@ def _render_battle_lb_image(entries, week):
     draw = ImageDraw.Draw(img)
 
     draw.rectangle([(0, 0), (4, title_height)], fill=HEADER_COLOR)
-    draw.text((padding + 6, 8), "Battle Leaderboard", fill=TEXT_COLOR, font=title_font)
+    paste_text(img, (padding + 6, 8), "Battle Leaderboard", TEXT_COLOR, 20, bold=True)
 
     y = title_height
     draw.rectangle([(0, y), (table_width, y + header_height)], fill=HEADER_COLOR)
     x = padding
     for i, header in enumerate(col_headers):
-        draw.text((x + 3, y + 5), header, fill=TEXT_COLOR, font=header_font)
+        paste_text(img, (x + 3, y + 5), header, TEXT_COLOR, 13, bold=True)
         x += col_widths[i]
 
     y += header_height
@@ -3024,15 +3360,15 @@ def _render_battle_lb_image(entries, week):
     
     for idx, (uid_str, name, stats, wk) in enumerate(entries):
         row_color = ROW_EVEN if idx % 2 == 0 else ROW_ODD
-        draw.rectangle([(0, y), (table_width, y + row_height)], fill=row_color)
+        img.paste(row_color, (0, y, table_width + 1, y + row_height + 1))  # same span as draw.rectangle, cheaper fill
 
         x = padding
         # Rank
         if idx < 3:
             rc = medal_colors[idx]
-            draw.text((x + 3, y + 5), f"#{idx+1}", fill=rc, font=font_bold)
+            paste_text(img, (x + 3, y + 5), f"#{idx+1}", rc, 14, bold=True)
         else:
-            draw.text((x + 3, y + 5), f"#{idx+1}", fill=DIM_TEXT, font=font)
+            paste_text(img, (x + 3, y + 5), f"#{idx+1}", DIM_TEXT, 14)
         x += col_widths[0]
 
         # Name + stars
@@ -3076,12 +3412,12 @@ def _render_battle_lb_image(entries, week):
         y += row_height
 
     buf = io.BytesIO()
-    img.save(buf, format="PNG")
+    img.save(buf, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
     buf.seek(0)
     return buf
 
 
-def _build_dino_stats_embed(stats):
+async def _build_dino_stats_embed(stats):
     """Build a dino leaderboard as an image table."""
     sorted_dinos = sorted(
         stats.items(),
@@ -3089,7 +3425,7 @@ def _build_dino_stats_embed(stats):
         reverse=True
     )
 
-    buf = _render_dino_stats_image(sorted_dinos[:15])
+    buf = await run_render(_render_dino_stats_image, sorted_dinos[:15])
     file = discord.File(buf, filename="dino_stats.png")
     embed = discord.Embed(title="🦕 Dino Battle Leaderboard 🦖", color=0x2ecc71)
     embed.set_image(url="attachment://dino_stats.png")
@@ -3108,16 +3444,8 @@ def _render_dino_stats_image(sorted_dinos):
     RED = (240, 71, 71)
     GOLD = (255, 215, 0)
 
-    try:
-        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 14)
-        font_bold = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 14)
-        header_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 13)
-        title_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 20)
-    except OSError:
-        font = ImageFont.load_default()
-        font_bold = font
-        header_font = font
-        title_font = font
+    font = load_font(14)
+    font_bold = load_font(14, bold=True)
 
     col_widths = [45, 180, 50, 45, 45, 55, 55, 55]
     col_headers = ["Rank", "Dinosaur", "W", "L", "WR%", "Kills", "Deaths", "Flees"]
@@ -3133,13 +3461,13 @@ def _render_dino_stats_image(sorted_dinos):
     draw = ImageDraw.Draw(img)
 
     draw.rectangle([(0, 0), (4, title_height)], fill=HEADER_COLOR)
-    draw.text((padding + 6, 8), "Dino Leaderboard", fill=TEXT_COLOR, font=title_font)
+    paste_text(img, (padding + 6, 8), "Dino Leaderboard", TEXT_COLOR, 20, bold=True)
 
     y = title_height
     draw.rectangle([(0, y), (table_width, y + header_height)], fill=HEADER_COLOR)
     x = padding
     for i, header in enumerate(col_headers):
-        draw.text((x + 3, y + 5), header, fill=TEXT_COLOR, font=header_font)
+        paste_text(img, (x + 3, y + 5), header, TEXT_COLOR, 13, bold=True)
         x += col_widths[i]
 
     y += header_height
@@ -3147,14 +3475,14 @@ def _render_dino_stats_image(sorted_dinos):
 
     for idx, (did, ds) in enumerate(sorted_dinos):
         row_color = ROW_EVEN if idx % 2 == 0 else ROW_ODD
-        draw.rectangle([(0, y), (table_width, y + row_height)], fill=row_color)
+        img.paste(row_color, (0, y, table_width + 1, y + row_height + 1))  # same span as draw.rectangle, cheaper fill
 
         x = padding
         # Rank
         if idx < 3:
-            draw.text((x + 3, y + 5), f"#{idx+1}", fill=medal_colors[idx], font=font_bold)
+            paste_text(img, (x + 3, y + 5), f"#{idx+1}", medal_colors[idx], 14, bold=True)
         else:
-            draw.text((x + 3, y + 5), f"#{idx+1}", fill=DIM_TEXT, font=font)
+            paste_text(img, (x + 3, y + 5), f"#{idx+1}", DIM_TEXT, 14)
         x += col_widths[0]
 
         # Dinosaur name
@@ -3199,7 +3527,7 @@ def _render_dino_stats_image(sorted_dinos):
         y += row_height
 
     buf = io.BytesIO()
-    img.save(buf, format="PNG")
+    img.save(buf, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
     buf.seek(0)
     return buf
 
@@ -3243,7 +3571,7 @@ async def dinobattle(ctx):
 
     await ctx.send("⚔️ **Generating fighters...**")
     
-    buf = _render_vs_image(dino_a, dino_b)
+    buf = await run_render(_render_vs_image, dino_a, dino_b)
     file = discord.File(buf, filename="dinobattle.png")
     
     end_time = int(time.time()) + 60
@@ -3273,7 +3601,7 @@ async def dinobattle(ctx):
     embed.color = 0xe74c3c
     try:
         await msg.edit(embed=embed, view=view)
-    except:
+    except discord.HTTPException:
         pass
 
     await asyncio.sleep(5)
@@ -3376,7 +3704,7 @@ async def dinobattle(ctx):
             battle_embed.title = f"⚔️ Turn {i+1}"
             try:
                 await battle_msg.edit(embed=battle_embed)
-            except:
+            except discord.HTTPException:
                 pass
             await asyncio.sleep(1.5)
 
@@ -3402,7 +3730,7 @@ async def dinobattle(ctx):
         # Build two-column winner embed
         import battle_engine as _be
         winner_id = winner.get('id', '')
-        w_family = _be.SPECIES_FAMILIES.get(winner_id.lower(), "generic").replace("_", " ").title()
+        w_family = _be.family_of(winner_id).replace("_", " ").title()
         
         win_embed = discord.Embed(
             title=f"🏆 {result['winner_name']} WINS!",
@@ -3614,7 +3942,7 @@ async def dino(ctx, *, name: str = None):
     import battle_engine as _be
 
     dino_id = match['id']
-    family = _be.SPECIES_FAMILIES.get(dino_id.lower(), "generic")
+    family = _be.family_of(dino_id)
     family_label = family.replace("_", " ").title()
     dtype = match.get('type', 'carnivore')
     cw = match.get('cw', 3000)
@@ -3733,6 +4061,17 @@ async def dinostats(ctx):
 # ----------------------------
 # Custom Help Command
 # ----------------------------
+def _cached_embed(build):
+    """The help pages are static: build once, hand out shallow copies.
+    Copies share the field list, so callers may only swap the footer."""
+    built = lru_cache(maxsize=None)(build)
+
+    @wraps(build)
+    def copy():
+        return built().copy()
+    return copy
+
+@_cached_embed
 def _build_everyone_embed():
     """Build the Everyone commands help embed."""
     embed = discord.Embed(
@@ -3752,6 +4091,7 @@ def _build_everyone_embed():
     embed.set_footer(text="Page 1/3 · Session buttons: Attend · Standby · Not Attending · Relieve Spot")
     return embed
 
+@_cached_embed
 def _build_admin_embed():
     """Build the Admin commands help embed."""
     embed = discord.Embed(
@@ -3773,6 +4113,7 @@ def _build_admin_embed():
     embed.set_footer(text="Page 2/3 · Admin only")
     return embed
 
+@_cached_embed
 def _build_test_embed():
     """Build the Test commands help embed."""
     embed = discord.Embed(
@@ -3791,6 +4132,8 @@ def _build_test_embed():
     embed.set_footer(text="Page 3/3 · Testing & Minigames")
     return embed
 
+HELP_NOT_YOURS = "This help menu isn't for you. Type `!help` to get your own!"
+
 class HelpView(discord.ui.View):
     """Interactive help menu with page-navigation buttons."""
     def __init__(self, user_id, show_admin=False):
@@ -3803,27 +4146,21 @@ class HelpView(discord.ui.View):
             self.remove_item(self.show_test_page)
 
     @discord.ui.button(label="Everyone Commands", style=discord.ButtonStyle.success, emoji="📖")
+    @only_owner(message=HELP_NOT_YOURS)
     async def show_everyone_page(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This help menu isn't for you. Type `!help` to get your own!", ephemeral=True)
-            return
         footer = "Page 1/3 · Session buttons: Attend · Standby · Not Attending · Relieve Spot" if self.show_admin else "Session buttons: Attend · Standby · Not Attending · Relieve Spot"
         embed = _build_everyone_embed()
         embed.set_footer(text=footer)
         await interaction.response.edit_message(embed=embed, view=self)
 
     @discord.ui.button(label="Admin Commands", style=discord.ButtonStyle.danger, emoji="🔒")
+    @only_owner(message=HELP_NOT_YOURS)
     async def show_admin_page(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This help menu isn't for you. Type `!help` to get your own!", ephemeral=True)
-            return
         await interaction.response.edit_message(embed=_build_admin_embed(), view=self)
 
     @discord.ui.button(label="Test Commands", style=discord.ButtonStyle.secondary, emoji="🧪")
+    @only_owner(message=HELP_NOT_YOURS)
     async def show_test_page(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This help menu isn't for you. Type `!help` to get your own!", ephemeral=True)
-            return
         await interaction.response.edit_message(embed=_build_test_embed(), view=self)
 
 @bot.command(help="Show this help menu.")
@@ -3845,7 +4182,7 @@ async def help(ctx):
 async def auto_schedule_sessions():
     global last_posted_session
     now = datetime.now(EST)
-    channel = await bot.fetch_channel(SCHEDULE_CHANNEL_ID)
+    channel = await resolve_channel(SCHEDULE_CHANNEL_ID)
     if not channel:
         return
 
@@ -3856,16 +4193,14 @@ async def auto_schedule_sessions():
         session_dt = next_run_time(sd["hour"], sd["weekday"])
         post_dt = session_dt - timedelta(hours=sd["post_hours_before"])
         if window_start <= post_dt <= window_end:
-            h12 = sd["hour"] % 12 or 12
-            ampm = "AM" if sd["hour"] < 12 else "PM"
-            name = f"{sd['name']} {h12}{ampm} EST Session"
+            name = session_day_label(sd)
             session_key = f"{name}_{session_dt.isoformat()}"
             if last_posted_session == session_key:
                 print(f"⏩ Skipping duplicate post for: {name}")
                 return
             await create_schedule(channel, name, session_dt=session_dt)
             last_posted_session = session_key
-            save_state()
+            request_save_state()
             return
 
 # ----------------------------
@@ -3878,14 +4213,14 @@ async def session_reminders():
         return
 
     try:
-        session_dt = datetime.fromisoformat(session_dt_str)
+        session_dt = get_session_dt()
         now = datetime.now(session_dt.tzinfo or EST)
         time_until = (session_dt - now).total_seconds()
 
         # 1 hour before (between 55-65 min before to catch window)
         if 55 * 60 <= time_until <= 65 * 60:
             reminder_sent = True
-            save_state()
+            request_save_state()
             count = 0
             for uid in attending_ids:
                 try:
@@ -3913,7 +4248,7 @@ async def checkin_manager():
         return
 
     try:
-        session_dt = datetime.fromisoformat(session_dt_str)
+        session_dt = get_session_dt()
         now = datetime.now(session_dt.tzinfo or EST)
         minutes_after = (now - session_dt).total_seconds() / 60
 
@@ -3947,14 +4282,14 @@ async def checkin_manager():
                     print(f"   ❌ ERROR: Cannot DM user {uid}: {type(e).__name__}: {e}")
 
             # Post a brief notice in the channel
-            channel = await bot.fetch_channel(SCHEDULE_CHANNEL_ID)
+            channel = await resolve_channel(SCHEDULE_CHANNEL_ID)
             if channel:
                 notice = f"🟢 **Session is starting!** Check-in DMs sent to **{dm_sent}** attendee(s)."
                 if dm_failed:
                     failed_mentions = ", ".join(f"<@{uid}>" for uid in dm_failed)
                     notice += f"\n⚠️ Could not DM: {failed_mentions} — they may have DMs disabled."
                 await channel.send(notice)
-            save_state()
+            request_save_state()
             print(f"✅ Check-in DMs result: {dm_sent} success, {len(dm_failed)} failed")
 
         # After grace period: auto-relieve no-shows
@@ -3963,8 +4298,9 @@ async def checkin_manager():
             no_show_users = []
             checked_in_users = []
 
+            checked_in = set(checked_in_ids)
             for uid in list(attending_ids):  # copy list since we modify it
-                if uid in checked_in_ids:
+                if uid in checked_in:
                     record_attendance(uid)
                     checked_in_users.append(uid)
                 else:
@@ -3983,16 +4319,15 @@ async def checkin_manager():
                                     f"⚠️ **Warning:** Your no-show rate is **{rate}%**. "
                                     f"At 60%+ you'll be auto-placed on **standby**. Check in to improve!"
                                 )
-                            except:
+                            except discord.HTTPException:
                                 pass
 
             # AUTO-RELIEVE: remove no-shows from attending, offer spots to standby
+            no_show_set = set(no_show_users)
+            relieved = [uid for uid in attending if uid in no_show_set]
+            for uid in relieved:
+                not_attending.setdefault(uid, attending.pop(uid))
             for uid in no_show_users:
-                to_remove = [u for u in attending if u.id == uid]
-                for u in to_remove:
-                    attending.remove(u)
-                    if u not in not_attending:
-                        not_attending.append(u)
                 # DM the no-show
                 try:
                     user = await bot.fetch_user(uid)
@@ -4000,7 +4335,7 @@ async def checkin_manager():
                         f"❌ You didn't check in within {CHECKIN_GRACE_MINUTES} minutes. "
                         f"Your spot has been **auto-relieved** and offered to standby."
                     )
-                except:
+                except discord.HTTPException:
                     pass
 
             sync_ids_from_users()
@@ -4014,7 +4349,7 @@ async def checkin_manager():
                 await schedule_view.update_embed()
 
             # Post results
-            channel = await bot.fetch_channel(SCHEDULE_CHANNEL_ID)
+            channel = await resolve_channel(SCHEDULE_CHANNEL_ID)
             if channel:
                 no_show_mentions = []
                 for uid in no_show_users:
@@ -4059,7 +4394,7 @@ async def weekly_summary():
         return
 
     try:
-        channel = await bot.fetch_channel(SCHEDULE_CHANNEL_ID)
+        channel = await resolve_channel(SCHEDULE_CHANNEL_ID)
         if not channel:
             return
 
@@ -4081,7 +4416,7 @@ async def weekly_summary():
             try:
                 mvp_user = await bot.fetch_user(int(mvp_id))
                 mvp_mention = f"\n🏆 **MVP:** {mvp_user.mention} (🔥{mvp_streak} streak)"
-            except:
+            except (ValueError, discord.HTTPException):
                 mvp_mention = f"\n🏆 **MVP:** User {mvp_id} (🔥{mvp_streak} streak)"
 
         embed = discord.Embed(
@@ -4108,7 +4443,7 @@ def update_settings(data):
     global admin_role_names, beta_role_names, archive_channel_id, session_days
     global status_channel_id, status_start_msg, status_stop_msg
     global battle_channel_id
-    global session_type, nest_parent_ids, nest_baby_ids, nest_protector_ids
+    global nest_parent_ids, nest_baby_ids, nest_protector_ids
     if "max_attending" in data:
         MAX_ATTENDING = int(data["max_attending"])
     if "checkin_grace" in data:
@@ -4119,6 +4454,7 @@ def update_settings(data):
         admin_role_names = [r.strip() for r in data["admin_role_names"] if r.strip()]
     if "beta_role_names" in data:
         beta_role_names = [r.strip() for r in data["beta_role_names"] if r.strip()]
+    _refresh_role_caches()
     if "archive_channel_id" in data:
         archive_channel_id = int(data["archive_channel_id"])
     if "session_days" in data:
@@ -4134,7 +4470,7 @@ def update_settings(data):
     if "status_stop_msg" in data:
         status_stop_msg = data["status_stop_msg"]
     if "session_type" in data:
-        session_type = data["session_type"] if data["session_type"] in SESSION_TYPES else 'hunt'
+        set_session_type(data["session_type"] if data["session_type"] in SESSION_TYPES else 'hunt')
         if session_type != 'nesting':
             nest_parent_ids.clear()
             nest_baby_ids.clear()
@@ -4143,23 +4479,27 @@ def update_settings(data):
     # Process nesting arrays when present
     if "nest_parent_ids" in data:
         nest_parent_ids.clear()
-        nest_parent_ids.extend([str(uid) for uid in data["nest_parent_ids"]])
+        nest_parent_ids.update(str(uid) for uid in data["nest_parent_ids"])
     if "nest_baby_ids" in data:
         nest_baby_ids.clear()
-        nest_baby_ids.extend([str(uid) for uid in data["nest_baby_ids"]])
+        nest_baby_ids.update(str(uid) for uid in data["nest_baby_ids"])
     if "nest_protector_ids" in data:
         nest_protector_ids.clear()
-        nest_protector_ids.extend([str(uid) for uid in data["nest_protector_ids"]])
+        nest_protector_ids.update(str(uid) for uid in data["nest_protector_ids"])
         
-    save_state()
+    request_save_state()
     # Force a refresh of the embed so it updates instantly
     try:
         loop = asyncio.get_running_loop()
-        if session_dt_str and not session_ended:
-            loop.create_task(refresh_open_embeds())
-    except:
+        if session_dt_str and not session_ended and schedule_view:
+            loop.create_task(schedule_view.update_embed())
+    except RuntimeError:
         pass
 
+@bot.event
+async def on_guild_channel_delete(channel):
+    _channel_cache.pop(channel.id, None)
+
 # ----------------------------
 # Bot ready
 # ----------------------------
@@ -4215,8 +4555,8 @@ async def on_ready():
         "status_start_msg":    lambda: status_start_msg,
         "status_stop_msg":     lambda: status_stop_msg,
         "session_type":        lambda: session_type,
-        "nest_parent_ids":     lambda: nest_parent_ids,
-        "nest_baby_ids":       lambda: nest_baby_ids,
+        "nest_parent_ids":     lambda: list(nest_parent_ids),
+        "nest_baby_ids":       lambda: list(nest_baby_ids),
         "save_history":       save_history,
         "update_settings":    update_settings,
         "load_dinos":         load_dinos,
@@ -4244,8 +4584,11 @@ async def main():
         print("Set it with: export DISCORD_BOT_TOKEN='your_token_here'")
         return
 
-    async with bot:
-        await bot.start(token)
+    try:
+        async with bot:
+            await bot.start(token)
+    finally:
+        await flush_saves()
 
 if __name__ == "__main__":
     asyncio.run(main())
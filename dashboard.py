@@ -1242,7 +1242,7 @@ async def dino_profile_page(request):
     import battle_engine as _be
     import json as _json
 
-    dino_family = _be.SPECIES_FAMILIES.get(dino_id.lower(), "generic")
+    dino_family = _be.family_of(dino_id)
     family_label = dino_family.replace("_", " ").title()
     cw_val = dino.get('cw', 3000)
     group_slots = _be.get_group_slots(cw_val)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The bot's modules live at the repo root, not in an installed package.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
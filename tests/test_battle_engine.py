@@ -0,0 +1,71 @@
+"""Scalar vs batched engine parity: both must play the same fight on average."""
+import pytest
+
+import battle_engine as be
+
+N_SIMS = 4000
+TOL = 0.04  # about 5 standard errors on a win rate at N_SIMS fights
+
+# Parasaurolophus is a hadrosaur: its pool has Alarm Call, a 0-base heal, so
+# the pack's extra attacks exercise the "no effects without damage" rule.
+THERIZINO = {"id": "therizinosaurus", "name": "Therizinosaurus", "type": "herbivore",
+             "cw": 5000, "hp": 833, "atk": 83, "armor": 1.7, "spd": 750}
+PARASAUR = {"id": "parasaurolophus", "name": "Parasaurolophus", "type": "herbivore",
+            "cw": 4000, "hp": 700, "atk": 67, "armor": 1.3, "spd": 900}
+
+# Two effects on one ability, including a 0-base support move with two effects.
+MULTI_FX = {"id": "multi", "name": "Multi", "type": "carnivore",
+            "cw": 4000, "hp": 700, "atk": 70, "armor": 1.2, "spd": 800,
+            "custom_abilities": [
+                {"name": "Rend", "base": 100, "cd": 0},
+                {"name": "Maul", "base": 120, "cd": 2,
+                 "effects": [{"type": "bleed", "dur": 3, "pct": 0.05}, {"type": "bonebreak", "dur": 2}]},
+                {"name": "Brace", "base": 0, "cd": 3,
+                 "effects": [{"type": "defense", "dur": 2, "reduction": 0.5}, {"type": "heal", "pct": 0.08}]},
+            ]}
+
+MATCHUPS = {
+    "support_pack": (THERIZINO, PARASAUR, 1, 3),
+    "multi_effect": (MULTI_FX, PARASAUR, 2, 2),
+}
+JIT = [False, pytest.param(True, marks=pytest.mark.skipif(be.numba is None, reason="numba not installed"))]
+
+
+def _scalar_means(a, b, pack_a, pack_b):
+    runs = [be.simulate_battle(a, b, pack_a, pack_b, log=False, seed=i) for i in range(N_SIMS)]
+    return {
+        "a_wins": sum(r["winner"] == "a" for r in runs) / N_SIMS,
+        "total_kos": sum(r["total_kos"] for r in runs) / N_SIMS,
+        "bleed_kills": sum(r["bleed_kills"] for r in runs) / N_SIMS,
+        "any_fled": sum(bool(r["any_fled"]) for r in runs) / N_SIMS,
+    }
+
+
+@pytest.fixture(scope="module")
+def scalar_means():
+    return {name: _scalar_means(*m) for name, m in MATCHUPS.items()}
+
+
+@pytest.mark.parametrize("jit", JIT)
+@pytest.mark.parametrize("matchup", MATCHUPS)
+def test_batch_matches_scalar(scalar_means, matchup, jit):
+    res = be.simulate_batch(*MATCHUPS[matchup], n_sims=N_SIMS, seed=1, jit=jit)
+    for key, want in scalar_means[matchup].items():
+        assert float(res[key].mean()) == pytest.approx(want, abs=TOL), key
+
+
+def test_ability_table_keeps_every_effect():
+    side = be.BattleSide(MULTI_FX, pack_size=1)
+    tbl = be._ability_table(side.members[0])
+    assert tbl["eff"][1].tolist() == [be.EFF_BLEED, be.EFF_BONEBREAK]
+    assert tbl["eff"][2].tolist() == [be.EFF_DEFENSE, be.EFF_HEAL]
+    assert tbl["support"][2]
+
+
+def test_ability_pool_effects_are_copies():
+    pool = be.get_ability_pool("hadrosaur", "herbivore", 67)
+    for ab in pool:
+        for eff in ab["effects"]:
+            eff["pct"] = 9.9
+    fresh = be.get_ability_pool("hadrosaur", "herbivore", 67)
+    assert all(eff.get("pct") != 9.9 for ab in fresh for eff in ab["effects"])